@@ -1,4 +1,5 @@
 import os
+import pickle
 from flask import Flask, jsonify, render_template, request, session
 from dotenv import load_dotenv
 import pandas as pd
@@ -12,42 +13,71 @@ app.secret_key = os.getenv("FLASK_SECRET_KEY", "replace-with-your-secret-key")
 # Read Kakao API key from .env
 KAKAO_API_KEY = os.getenv('KAKAO_API_KEY')
 
-# Load spot data from Excel
+# Load spot data from Excel (cached as a pickle snapshot next to the workbook)
 BASE_DIR = os.path.dirname(__file__)
 DATA_PATH = os.path.join(BASE_DIR, 'data', 'spot_table_01.xlsx')
+SNAPSHOT_PATH = os.path.join(BASE_DIR, 'data', 'spot_table_01.snapshot.pkl')
 
-df = pd.read_excel(
-    DATA_PATH,
-    dtype={
-        'spot_id': int,
-        'name': str,
-        'address': str,
-        'tel': str,
-        'operation_hours': str,
-        'thum_url': str,
-        'menu_info': str,
-        'x': float,
-        'y': float,
-        'type': str
-    }
-)
-
-df.fillna('', inplace=True)
-
-spots = [
-    {
-        'spot_id': int(r['spot_id']),
-        'name': r['name'],
-        'address': r['address'],
-        'tel': r['tel'],
-        'operation_hours': r['operation_hours'],
-        'type': r['type'],
-        'coords': [r['x'], r['y']],
-        'thumbnail': r['thum_url'],
-        'menu': r['menu_info']
-    }
-    for _, r in df.iterrows()
-]
+
+def read_spots_from_excel(path):
+    df = pd.read_excel(
+        path,
+        dtype={
+            'spot_id': int,
+            'name': str,
+            'address': str,
+            'tel': str,
+            'operation_hours': str,
+            'thum_url': str,
+            'menu_info': str,
+            'x': float,
+            'y': float,
+            'type': str
+        }
+    )
+
+    df.fillna('', inplace=True)
+
+    return [
+        {
+            'spot_id': int(r['spot_id']),
+            'name': r['name'],
+            'address': r['address'],
+            'tel': r['tel'],
+            'operation_hours': r['operation_hours'],
+            'type': r['type'],
+            'coords': [r['x'], r['y']],
+            'thumbnail': r['thum_url'],
+            'menu': r['menu_info']
+        }
+        for r in df.to_dict('records')
+    ]
+
+
+def load_spots(path=DATA_PATH, snapshot_path=SNAPSHOT_PATH):
+    """Return the spot list, reading the workbook only when the snapshot is stale."""
+    stat = os.stat(path)
+    source = (stat.st_mtime_ns, stat.st_size)
+    try:
+        with open(snapshot_path, 'rb') as f:
+            cached_source, cached_spots = pickle.load(f)
+        if cached_source == source:
+            return cached_spots
+    except Exception:
+        pass
+
+    loaded = read_spots_from_excel(path)
+    tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((source, loaded), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+    except OSError:
+        pass
+    return loaded
+
+
+spots = load_spots()
 
 @app.route('/')
 def index():
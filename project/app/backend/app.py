@@ -1,9 +1,20 @@
+# 모듈을 import 할 때 읽는 설정(REFRESH_*, HTTP_* 등)에도 .env 값이 적용되도록 가장 먼저 로드
+from dotenv import load_dotenv
+load_dotenv()
+
 from flask import Flask, jsonify, request, Response, json
 from spot.service import FishingSpotService
 from spot.weather_by_spot import FishingWeatherService
 from spot.fish_by_spot import FishInfoService
+from spot.response_cache import SpotResponseCache
 from spot.update_spot_data import update_fishing_spot_data, retry_failed_spots
-from apscheduler.schedulers.background import BackgroundScheduler
+from spot.scheduler import REFRESH_SCHEDULER, RefreshScheduler
+from spot.priority import SpotPopularity
+from fish.harvest import harvest_fish_points
+from weather.client import forecast_cache
+from transport import transport
+from service_db.db_service import pool as db_pool
+from service_db.read_cache import board_cache
 
 import env
 import atexit
@@ -16,35 +27,72 @@ spot_service = FishingSpotService()
 weather_service = FishingWeatherService(weather_api_key=env.EnvironmentKey.KMA_SERVICE_KEY, spot_service=spot_service)
 fish_service = FishInfoService(fish_api_key=env.EnvironmentKey.FISH_API_KEY, spot_service=spot_service)
 
+# 게시판 낚시터 검색(/api/spots/search)이 메모리 검색 인덱스를 쓰도록 등록
+app.extensions["spot_service"] = spot_service
+
+spot_responses = SpotResponseCache(
+    spot_service,
+    dumps=lambda data: json.dumps(data, ensure_ascii=False, indent=2),
+)
+
+# 어류 조사 지점 전체 수집 (주 1회, 어종 갱신 직전) 후 로컬 인덱스 갱신
+def refresh_fish_points():
+    harvest_fish_points(env.EnvironmentKey.FISH_API_KEY)
+    fish_service.reload_point_index()
+
+# KMA 발표 시각에 맞춘 날씨 갱신 + 주간 어종 갱신
+# (즐겨찾기/게시글/조회 수 기반 인기 낚시터 우선, 시간당 호출 예산 내에서)
+popularity = SpotPopularity(spot_service.store)
+refresh_scheduler = RefreshScheduler(weather_service, fish_service, harvest=refresh_fish_points, popularity=popularity)
+# 여러 워커 프로세스로 띄울 때는 한 프로세스만 REFRESH_SCHEDULER=1 (나머지는 상태 조회만)
+if REFRESH_SCHEDULER:
+    refresh_scheduler.start()
+    atexit.register(refresh_scheduler.shutdown)
+# 아직 저장소에 반영하지 않은 조회 수 반영
+atexit.register(popularity.flush)
+
 app.register_blueprint(favorites_api)
 app.register_blueprint(user_api)
 app.register_blueprint(board_api, url_prefix="/api")
 app.register_blueprint(comment_api, url_prefix="/api")
 
+# 첫 요청이 MySQL 연결 + 인증을 기다리지 않도록 최소 개수만큼 미리 연결
+db_pool.warmup()
+
+
+# 데이터셋 버전별로 미리 직렬화·압축해 둔 낚시터 응답 (ETag 일치 시 304)
+def _spot_view_response(view: str) -> Response:
+    entry = spot_responses.get(view)
+    if request.if_none_match.contains_weak(entry.etag):
+        response = Response(status=304)
+    else:
+        encoding = "identity"
+        for candidate in ("br", "gzip"):
+            if candidate in entry.bodies and request.accept_encodings[candidate]:
+                encoding = candidate
+                break
+        response = Response(entry.bodies[encoding], content_type="application/json; charset=utf-8")
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+    response.set_etag(entry.etag, weak=True)
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 # 낚시터 출력
 @app.route("/api/spots", methods=["GET"])
 def get_all_spots():
-    return Response(
-        json.dumps(spot_service.get_all_spots(), ensure_ascii=False, indent=2),
-        content_type="application/json; charset=utf-8"
-    )
+    return _spot_view_response("all")
 
 # 선상 낚시터 출력
 @app.route("/api/spots/boat", methods=["GET"])
 def get_sea_spots():
-    return Response(
-        json.dumps(spot_service.get_sea_spots(), ensure_ascii=False, indent=2),
-        content_type="application/json; charset=utf-8"
-    )
+    return _spot_view_response("boat")
 
 # 실내 낚시터 출력
 @app.route("/api/spots/indoor", methods=["GET"])
 def get_ground_spots():
-    return Response(
-        json.dumps(spot_service.get_ground_spots(), ensure_ascii=False, indent=2),
-        content_type="application/json; charset=utf-8"
-    )
+    return _spot_view_response("indoor")
 
 # 낚시터 날씨 출력, 파라미터 낚시터이름
 @app.route("/api/weather", methods=["GET"])
@@ -52,12 +100,45 @@ def get_weather_by_name():
     name = request.args.get("name")
     if not name:
         return jsonify({"error": "Missing 'name' parameter"}), 400
+    # 실제 낚시터 이름만 조회 수에 반영 (임의 이름으로 기록이 늘지 않도록)
+    if spot_service.get_route_by_name(name) is not None:
+        popularity.record_hit(name)
     result = weather_service.get_weather_by_spot_name(name)
     return Response(
         json.dumps(result, ensure_ascii=False),
         content_type="application/json; charset=utf-8"
     )
 
+# 예보 캐시 적중률 출력
+@app.route("/api/weather/cache", methods=["GET"])
+def get_weather_cache_stats():
+    return jsonify(forecast_cache.stats())
+
+# 외부 API 호스트별 연결 재사용/지연 통계 출력
+@app.route("/api/http/stats", methods=["GET"])
+def get_http_stats():
+    return jsonify(transport.stats())
+
+# 어종 WFS 타일 캐시 적중률 출력
+@app.route("/api/fish/cache", methods=["GET"])
+def get_fish_cache_stats():
+    return jsonify(fish_service.tile_cache.stats())
+
+# MySQL 연결 풀 크기/재사용률/대기 시간 출력
+@app.route("/api/db/pool", methods=["GET"])
+def get_db_pool_stats():
+    return jsonify(db_pool.stats())
+
+# 게시판/댓글 읽기 캐시 적중률/무효화 횟수 출력
+@app.route("/api/db/cache", methods=["GET"])
+def get_board_cache_stats():
+    return jsonify(board_cache.stats())
+
+# 갱신 작업별 최근 실행 시간/결과와 데이터 신선도 출력
+@app.route("/api/refresh/status", methods=["GET"])
+def get_refresh_status():
+    return jsonify(refresh_scheduler.status())
+
 # 낚시터 어종 출력, 파라미터 낚시터이름
 @app.route("/api/fish", methods=["GET"])
 def get_fish_by_name():
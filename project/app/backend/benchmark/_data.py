@@ -0,0 +1,61 @@
+"""
+벤치마크 공용 데이터 준비.
+
+저장소에는 원본 낚시터 목록(project/data/fishing_spot.csv)만 있으므로
+FishingSpotService 가 읽는 컬럼 이름(spot_id, name, type, address, lat, lon)으로 바꿔 임시 CSV를 만든다.
+임시 CSV와 스냅샷은 실행이 끝나면 지워지는 임시 디렉터리에만 둔다 (dataset/snapshot 에 남기지 않음).
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+
+import pandas as pd
+
+from spot.service import FishingSpotService
+
+RAW_SPOT_CSV = os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "fishing_spot.csv")
+
+RAW_COLUMNS = {
+    "번호": "spot_id",
+    "낚시터명": "name",
+    "낚시터유형": "type",
+    "소재지도로명주소": "address",
+    "소재지지번주소": "lot_address",
+    "WGS84위도": "lat",
+    "WGS84경도": "lon",
+}
+TYPE_NAMES = {"바다": "boat", "평지": "indoor"}
+
+
+def sample_spot_csv(directory: str) -> str:
+    """
+    변환된 낚시터 CSV 경로를 반환 (weather_* / fish_list 컬럼은 빈 값)
+    """
+    df = pd.read_csv(RAW_SPOT_CSV).rename(columns=RAW_COLUMNS)
+    df = df.dropna(subset=["lat", "lon"])
+    df["type"] = df["type"].map(TYPE_NAMES).fillna(df["type"])
+    df["address"] = df["address"].fillna(df["lot_address"])
+    for col in ["weather_mid", "weather_short", "weather_ultra", "fish_list"]:
+        df[col] = None
+
+    path = os.path.join(directory, "fishing_spot.csv")
+    df.to_csv(path, index=False, encoding="utf-8-sig")
+    return path
+
+
+@contextmanager
+def sample_workspace():
+    """
+    (변환된 낚시터 CSV 경로, 스냅샷 디렉터리) — with 블록이 끝나면 둘 다 삭제
+    """
+    with tempfile.TemporaryDirectory(prefix="fishingplus-bench-") as tmp:
+        yield sample_spot_csv(tmp), os.path.join(tmp, "snapshot")
+
+
+@contextmanager
+def sample_spot_service():
+    """
+    임시 CSV / 임시 스냅샷 디렉터리를 쓰는 FishingSpotService
+    """
+    with sample_workspace() as (spot_path, snapshot_dir):
+        yield FishingSpotService(file_path=spot_path, snapshot_dir=snapshot_dir)
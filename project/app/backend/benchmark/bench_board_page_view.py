@@ -0,0 +1,174 @@
+"""
+게시판 화면당 쿼리 수 벤치마크: 이전 조회 방식 vs 통합 조회.
+
+SQLite 임시 DB(게시글 BOARDS 건, 글마다 댓글 0~COMMENTS_MAX 건, 일부 글은 낚시터 연결)에서
+  • 목록 화면: 이전 = 목록 1회 + 글마다 댓글 조회 (댓글 수 표시, N+1)
+              현재 = 댓글 수를 포함한 목록 1회 (service_db.pagination)
+  • 상세 화면: 이전 = 게시글 + 낚시터 + /api/comments 전체 댓글 (3회)
+              현재 = 게시글/낚시터/댓글 수 1회 + 댓글 한 페이지 1회 (service_db.board_queries)
+를 실행해 화면당 쿼리 수와 시간을 잰다 (캐시 없이 DB 조회만).
+실행 (backend 디렉터리에서):
+    python -m benchmark.bench_board_page_view
+"""
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from service_db.board_queries import BOARD_DETAIL_SQL, split_detail
+from service_db.pagination import (
+    BOARD_PAGE_SIZE,
+    COMMENT_PAGE_SIZE,
+    board_page,
+    board_page_query,
+    comment_page,
+    comment_page_query,
+)
+
+BOARDS = 20_000
+COMMENTS_MAX = 120
+SPOTS = 500
+ROUNDS = 200
+
+LEGACY_LIST_SQL = f"""
+    SELECT board_id, user_id, title, content, reg_date
+    FROM board
+    ORDER BY reg_date DESC
+    LIMIT {BOARD_PAGE_SIZE}
+"""
+LEGACY_BOARD_SQL = "SELECT board_id, user_id, title, content, reg_date FROM board WHERE board_id = %s"
+LEGACY_SPOT_SQL = """
+    SELECT s.spot_id, s.name, s.address, s.tel, s.operation_hours, s.thum_url, s.menu_info, s.type
+    FROM spot s
+    JOIN board_spot bs ON s.spot_id = bs.spot_id
+    WHERE bs.board_id = %s
+"""
+LEGACY_COMMENTS_SQL = """
+    SELECT comment_id, board_id, user_id, comment_content, comment_date
+    FROM comment
+    WHERE board_id = %s
+    ORDER BY comment_date ASC
+"""
+
+
+class CountingDB:
+    def __init__(self, conn):
+        self.conn = conn
+        self.queries = 0
+
+    def fetchall(self, sql: str, params: tuple = ()) -> list[dict]:
+        self.queries += 1
+        cursor = self.conn.execute(sql.replace("%s", "?"), params)
+        columns = [c[0] for c in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def fetchone(self, sql: str, params: tuple = ()) -> dict | None:
+        rows = self.fetchall(sql, params)
+        return rows[0] if rows else None
+
+
+def seed(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE board (board_id INTEGER PRIMARY KEY, user_id TEXT, title TEXT, content TEXT, reg_date TEXT);
+        CREATE TABLE spot (spot_id INTEGER PRIMARY KEY, name TEXT, address TEXT, tel TEXT, operation_hours TEXT,
+                           thum_url TEXT, menu_info TEXT, type TEXT);
+        CREATE TABLE board_spot (board_id INTEGER UNIQUE, spot_id INTEGER);
+        CREATE TABLE comment (comment_id INTEGER PRIMARY KEY, board_id INTEGER, user_id TEXT,
+                              comment_content TEXT, comment_date TEXT);
+        CREATE INDEX ix_board_reg_date_board_id ON board (reg_date, board_id);
+        CREATE INDEX ix_comment_board_id_comment_date ON comment (board_id, comment_date);
+    """)
+    rng = random.Random(0)
+    start = datetime(2024, 1, 1)
+    fmt = "%Y-%m-%d %H:%M:%S"
+    conn.executemany("INSERT INTO spot VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (
+        (i, f"낚시터 {i}", f"주소 {i}", "010-0000-0000", "00:00~24:00", "", "", "boat") for i in range(1, SPOTS + 1)
+    ))
+    conn.executemany("INSERT INTO board VALUES (?, ?, ?, ?, ?)", (
+        (i, f"user{i % 300}", f"조행기 {i}", "본문 " * 200, (start + timedelta(minutes=i)).strftime(fmt))
+        for i in range(1, BOARDS + 1)
+    ))
+    conn.executemany("INSERT INTO board_spot VALUES (?, ?)", (
+        (i, rng.randint(1, SPOTS)) for i in range(1, BOARDS + 1) if i % 3
+    ))
+
+    def comments():
+        for board_id in range(1, BOARDS + 1):
+            base = start + timedelta(minutes=board_id)
+            for n in range(rng.randint(0, COMMENTS_MAX)):
+                yield board_id, f"user{rng.randrange(300)}", "댓글 " * 10, (base + timedelta(seconds=n * 7)).strftime(fmt)
+
+    conn.executemany("INSERT INTO comment (board_id, user_id, comment_content, comment_date) VALUES (?, ?, ?, ?)", comments())
+    conn.commit()
+    conn.execute("ANALYZE")
+    return conn
+
+
+# ----------------------------------------------------------------------
+# 화면 한 번 그리기
+# ----------------------------------------------------------------------
+def legacy_list_view(db: CountingDB):
+    boards = db.fetchall(LEGACY_LIST_SQL)
+    for board in boards:
+        board["comment_count"] = len(db.fetchall(LEGACY_COMMENTS_SQL, (board["board_id"],)))
+    return boards
+
+
+def list_view(db: CountingDB):
+    sql, params = board_page_query(None, BOARD_PAGE_SIZE)
+    return board_page(db.fetchall(sql, params), BOARD_PAGE_SIZE)
+
+
+def legacy_detail_view(db: CountingDB, board_id: int):
+    board = db.fetchone(LEGACY_BOARD_SQL, (board_id,))
+    spot = db.fetchone(LEGACY_SPOT_SQL, (board_id,))
+    comments = db.fetchall(LEGACY_COMMENTS_SQL, (board_id,))
+    return board, spot, comments, len(comments)
+
+
+def detail_view(db: CountingDB, board_id: int):
+    board, spot, count = split_detail(db.fetchone(BOARD_DETAIL_SQL, (board_id,)))
+    sql, params = comment_page_query(board_id, None, COMMENT_PAGE_SIZE)
+    comments, _ = comment_page(db.fetchall(sql, params), COMMENT_PAGE_SIZE)
+    return board, spot, comments, count
+
+
+def measure(view, db: CountingDB, args_list: list) -> tuple[float, float]:
+    db.queries = 0
+    start = time.perf_counter()
+    for args in args_list:
+        view(db, *args)
+    elapsed = (time.perf_counter() - start) * 1000
+    return db.queries / len(args_list), elapsed / len(args_list)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = seed(os.path.join(tmp, "board.db"))
+        db = CountingDB(conn)
+
+        # 두 방식 결과가 같은지 확인 (댓글 수 / 상세)
+        legacy_counts = [b["comment_count"] for b in legacy_list_view(db)]
+        counts = [b["comment_count"] for b in list_view(db)[0]]
+        assert legacy_counts == counts, "목록 댓글 수 불일치"
+        old, new = legacy_detail_view(db, 7), detail_view(db, 7)
+        assert old[0] == new[0] and old[1] == new[1] and old[3] == new[3], "상세 결과 불일치"
+
+        rng = random.Random(1)
+        board_ids = [(rng.randint(1, BOARDS),) for _ in range(ROUNDS)]
+        print(f"게시글 {BOARDS:,}건, 화면 {ROUNDS}회 평균 (이전 → 현재)")
+        for label, legacy, current, args in (
+            ("목록 화면", legacy_list_view, list_view, [()] * ROUNDS),
+            ("상세 화면", legacy_detail_view, detail_view, board_ids),
+        ):
+            legacy_queries, legacy_ms = measure(legacy, db, args)
+            queries, ms = measure(current, db, args)
+            print(f"{label}  쿼리 {legacy_queries:5.1f} → {queries:4.1f}회   {legacy_ms:7.3f} ms → {ms:7.3f} ms")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+게시판 목록 벤치마크: 전체 조회 vs OFFSET 페이지 vs 키셋(커서) 페이지.
+
+MySQL 대신 SQLite 임시 DB에 게시글 ROWS 건을 넣고
+GET /api/boards 가 실행하는 쿼리(service_db.pagination)를 그대로 실행한다.
+  • full   : 기존 쿼리 (본문 포함 전체 행, LIMIT 없음)
+  • offset : 같은 목록 컬럼을 LIMIT/OFFSET 으로 (깊은 페이지일수록 느려짐)
+  • keyset : (reg_date, board_id) 커서 다음 페이지
+실행 (backend 디렉터리에서):
+    python -m benchmark.bench_board_pagination [ROWS]
+"""
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from service_db.pagination import (
+    BOARD_LIST_COLUMNS,
+    BOARD_LIST_ORDER,
+    BOARD_PAGE_SIZE,
+    board_page,
+    board_page_query,
+    encode_cursor,
+)
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+ROUNDS = 20
+PAGES = (1, 100, 10_000)   # 조회할 페이지 번호 (깊이)
+
+FULL_SQL = """
+    SELECT board_id, user_id, title, content, reg_date
+    FROM board
+    ORDER BY reg_date DESC
+"""
+
+
+def seed(path: str):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE board (
+            board_id INTEGER PRIMARY KEY,
+            user_id  TEXT NOT NULL,
+            title    TEXT NOT NULL,
+            content  TEXT NOT NULL,
+            reg_date TEXT NOT NULL
+        )
+    """)
+    # 목록 쿼리의 댓글 수 하위 쿼리용 (댓글은 비워 둠)
+    conn.execute("""
+        CREATE TABLE comment (
+            comment_id      INTEGER PRIMARY KEY,
+            board_id        INTEGER NOT NULL,
+            user_id         TEXT NOT NULL,
+            comment_content TEXT NOT NULL,
+            comment_date    TEXT NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX ix_comment_board_id_comment_date ON comment (board_id, comment_date)")
+    rng = random.Random(0)
+    start = datetime(2023, 1, 1)
+    words = ["감성돔", "우럭", "방파제", "조황", "채비", "밑밥", "물때", "입질", "선상", "갯바위"]
+
+    def rows():
+        for board_id in range(1, ROWS + 1):
+            # 같은 초에 여러 글이 올라오는 경우도 섞음 (board_id 로 순서 구분)
+            reg_date = start + timedelta(seconds=board_id * 30 - rng.randrange(3) * 30)
+            content = " ".join(rng.choice(words) for _ in range(rng.randint(20, 200)))
+            yield board_id, f"user{rng.randrange(5000)}", f"{rng.choice(words)} 조행기 {board_id}", content, reg_date.strftime("%Y-%m-%d %H:%M:%S")
+
+    conn.executemany("INSERT INTO board VALUES (?, ?, ?, ?, ?)", rows())
+    conn.commit()
+    return conn
+
+
+def execute(conn, sql: str, params: tuple = ()) -> list[dict]:
+    cursor = conn.execute(sql.replace("%s", "?"), params)
+    columns = [c[0] for c in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def timed(fn, rounds: int = ROUNDS) -> tuple[float, object]:
+    result = None
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = fn()
+    return (time.perf_counter() - start) / rounds * 1000, result
+
+
+def keyset_cursor_for(conn, page: int) -> str | None:
+    """
+    page 번째 페이지를 여는 커서 (앞 페이지 마지막 행 기준)
+    """
+    if page == 1:
+        return None
+    rows = execute(conn, f"SELECT reg_date, board_id FROM board {BOARD_LIST_ORDER} LIMIT 1 OFFSET ?",
+                   ((page - 1) * BOARD_PAGE_SIZE - 1,))
+    return encode_cursor(rows[0]["reg_date"], rows[0]["board_id"])
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "board.db")
+        start = time.perf_counter()
+        conn = seed(path)
+        print(f"게시글 {ROWS:,}건 생성: {time.perf_counter() - start:.1f}s")
+
+        ms, rows = timed(lambda: execute(conn, FULL_SQL), rounds=1)
+        body = len(json.dumps(rows, ensure_ascii=False).encode("utf-8"))
+        print(f"{'full (인덱스 없음)':<28} {ms:10.1f} ms  응답 {body / 1e6:8.1f} MB")
+        del rows
+
+        for indexed in (False, True):
+            if indexed:
+                conn.execute("CREATE INDEX ix_board_reg_date_board_id ON board (reg_date, board_id)")
+                conn.execute("ANALYZE")
+            label = "인덱스" if indexed else "인덱스 없음"
+            for page in PAGES:
+                if not indexed and page > 1:
+                    continue   # 인덱스 없이는 페이지마다 전체 정렬이라 1페이지만 측정
+                if (page - 1) * BOARD_PAGE_SIZE >= ROWS:
+                    continue
+                offset_sql = f"SELECT {BOARD_LIST_COLUMNS} FROM board {BOARD_LIST_ORDER} LIMIT %s OFFSET %s"
+                offset_ms, _ = timed(lambda: execute(conn, offset_sql, (BOARD_PAGE_SIZE, (page - 1) * BOARD_PAGE_SIZE)),
+                                     rounds=ROUNDS if indexed else 1)
+
+                cursor = keyset_cursor_for(conn, page)
+                sql, params = board_page_query(cursor, BOARD_PAGE_SIZE)
+                keyset_ms, rows = timed(lambda: board_page(execute(conn, sql, params), BOARD_PAGE_SIZE),
+                                        rounds=ROUNDS if indexed else 1)
+                page_rows, _ = rows
+                body = len(json.dumps(page_rows, ensure_ascii=False).encode("utf-8"))
+                print(
+                    f"{f'page {page:,} ({label})':<28} offset {offset_ms:8.2f} ms  keyset {keyset_ms:8.2f} ms  "
+                    f"응답 {body / 1e3:.1f} KB"
+                )
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+MySQL 요청마다 연결 vs 연결 풀 부하 벤치마크.
+
+.env 의 DB_* 설정으로 접속해, 동시 스레드 THREADS 개가 각각 REQUESTS 번
+블루프린트와 같은 크기의 짧은 쿼리(즐겨찾기 조회)를 실행한다.
+  • per-request: 요청마다 get_connection() → 쿼리 → close()
+  • pooled     : db_connection() 으로 풀에서 빌려 쓰고 반납
+실행 (backend 디렉터리에서, MySQL 필요):
+    python -m benchmark.bench_db_pool
+"""
+import statistics
+import threading
+import time
+
+from service_db import db_service
+from service_db.db_service import ConnectionPool, get_connection
+
+THREADS = 16
+REQUESTS = 200
+QUERY = """
+    SELECT s.spot_id, s.name, f.memo
+    FROM favorites f
+    JOIN spot s ON f.spot_id = s.spot_id
+    WHERE f.user_id = %s
+"""
+
+
+def per_request():
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(QUERY, ("bench",))
+        cursor.fetchall()
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def pooled():
+    with db_service.db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(QUERY, ("bench",))
+        cursor.fetchall()
+
+
+def run(fn) -> dict:
+    latencies = []
+    lock = threading.Lock()
+
+    def worker():
+        local = []
+        for _ in range(REQUESTS):
+            start = time.perf_counter()
+            fn()
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "max": latencies[-1],
+    }
+
+
+def report(label: str, result: dict):
+    print(
+        f"{label:<12} {result['rps']:8.0f} req/s  "
+        f"p50 {result['p50']:7.2f} ms  p95 {result['p95']:7.2f} ms  max {result['max']:7.2f} ms"
+    )
+
+
+def main():
+    print(f"스레드 {THREADS}개 × 요청 {REQUESTS}회")
+    report("per-request", run(per_request))
+
+    # 최대 크기를 스레드 수보다 작게 잡아 고갈 시 대기 시간도 함께 측정
+    for max_size in (THREADS, THREADS // 2):
+        db_service.pool = ConnectionPool(get_connection, min_size=2, max_size=max_size)
+        db_service.pool.warmup()
+        report(f"pool({max_size})", run(pooled))
+        stats = db_service.pool.stats()
+        print(
+            f"{'':<12} 생성 {stats['created']}개, 재사용률 {stats['reuse_ratio']:.2%}, "
+            f"고갈 {stats['exhausted']}회, 평균 대기 {stats['wait_ms_avg']} ms, 최대 대기 {stats['wait_ms_max']} ms"
+        )
+        db_service.pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+service_db 쓰기 요청당 DB 왕복 횟수 벤치마크: 확인 후 쓰기(이전) vs 단일 문장 쓰기(현재).
+
+.env 의 DB_* 설정으로 접속한 MySQL 에 마이그레이션(alembic upgrade head)이 적용돼 있어야 한다.
+  • 이전: 블루프린트가 예전에 실행하던 SELECT 확인 + 개별 DELETE 순서를 그대로 재현
+  • 현재: Flask 테스트 클라이언트로 블루프린트를 호출
+두 경우 모두 연결 풀을 쓰며, 문장(execute) + commit 횟수와 요청당 시간을 잰다.
+벤치 전용 사용자(bench_rt_user)와 그 게시글/즐겨찾기는 끝나면 삭제한다.
+실행 (backend 디렉터리에서, MySQL 필요):
+    python -m benchmark.bench_db_round_trips
+"""
+import threading
+import time
+
+import pymysql
+from flask import Flask
+
+from service_db import db_service
+from service_db.board_service import board_api
+from service_db.comment_service import comment_api
+from service_db.db_service import DB_CONFIG, ConnectionPool, db_connection
+from service_db.favorites_service import favorites_api
+from service_db.user_service import user_api
+
+ROUNDS = 50
+USER = "bench_rt_user"
+EMAIL = "bench_rt_user@example.com"
+
+_counter = threading.local()
+
+
+class CountingConnection(pymysql.connections.Connection):
+    """
+    문장 실행(query) / commit 마다 왕복 1회로 집계 (반납 시 rollback 은 두 방식 공통이라 제외)
+    """
+
+    def query(self, sql, unbuffered=False):
+        _counter.value = getattr(_counter, "value", 0) + 1
+        return super().query(sql, unbuffered)
+
+    def commit(self):
+        _counter.value = getattr(_counter, "value", 0) + 1
+        return super().commit()
+
+
+def counted(fn) -> tuple[int, float]:
+    _counter.value = 0
+    start = time.perf_counter()
+    fn()
+    return _counter.value, (time.perf_counter() - start) * 1000
+
+
+# ----------------------------------------------------------------------
+# 이전 방식 (확인 후 쓰기)
+# ----------------------------------------------------------------------
+def legacy_create_user():
+    with db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM users WHERE user_id = %s OR email = %s", (USER, EMAIL))
+        if cursor.fetchone():
+            return
+        cursor.execute(
+            "INSERT INTO users (user_id, user_pw, name, email, address, phone) VALUES (%s, %s, %s, %s, %s, %s)",
+            (USER, "pw", "bench", EMAIL, None, None),
+        )
+        conn.commit()
+
+
+def legacy_add_favorite(spot_id):
+    with db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM favorites WHERE user_id = %s AND spot_id = %s", (USER, spot_id))
+        if cursor.fetchone():
+            return
+        cursor.execute("INSERT INTO favorites (user_id, spot_id, memo) VALUES (%s, %s, %s)", (USER, spot_id, ""))
+        conn.commit()
+
+
+def legacy_post_comment(board_id):
+    with db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM board WHERE board_id = %s", (board_id,))
+        if not cursor.fetchone():
+            return
+        cursor.execute(
+            "INSERT INTO comment (board_id, user_id, comment_content, comment_date) VALUES (%s, %s, %s, NOW())",
+            (board_id, USER, "bench"),
+        )
+        conn.commit()
+
+
+def legacy_update_board(board_id, spot_id):
+    with db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT user_id FROM board WHERE board_id = %s", (board_id,))
+        if cursor.fetchone()["user_id"] != USER:
+            return
+        cursor.execute("UPDATE board SET title = %s, content = %s WHERE board_id = %s", ("bench", "bench", board_id))
+        cursor.execute("DELETE FROM board_spot WHERE board_id = %s", (board_id,))
+        cursor.execute("INSERT INTO board_spot (board_id, spot_id) VALUES (%s, %s)", (board_id, spot_id))
+        conn.commit()
+
+
+def legacy_delete_board(board_id):
+    with db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT user_id FROM board WHERE board_id = %s", (board_id,))
+        if cursor.fetchone()["user_id"] != USER:
+            return
+        cursor.execute("DELETE FROM comment WHERE board_id = %s", (board_id,))
+        cursor.execute("DELETE FROM board_spot WHERE board_id = %s", (board_id,))
+        cursor.execute("DELETE FROM board WHERE board_id = %s", (board_id,))
+        conn.commit()
+
+
+# ----------------------------------------------------------------------
+# 준비 / 정리
+# ----------------------------------------------------------------------
+def create_board(client, spot_id) -> int:
+    response = client.post("/api/boards", json={"user_id": USER, "title": "bench", "content": "bench", "spot_id": spot_id})
+    board_id = response.get_json()["board_id"]
+    client.post("/api/comments", json={"board_id": board_id, "user_id": USER, "comment_content": "bench"})
+    return board_id
+
+
+def cleanup():
+    with db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("DELETE FROM board WHERE user_id = %s", (USER,))
+        cursor.execute("DELETE FROM users WHERE user_id = %s", (USER,))
+        conn.commit()
+
+
+def report(label: str, legacy: list, current: list):
+    legacy_calls = sum(c for c, _ in legacy) / len(legacy)
+    current_calls = sum(c for c, _ in current) / len(current)
+    legacy_ms = sum(ms for _, ms in legacy) / len(legacy)
+    current_ms = sum(ms for _, ms in current) / len(current)
+    print(
+        f"{label:<22} 왕복 {legacy_calls:4.1f} → {current_calls:4.1f}   "
+        f"{legacy_ms:7.2f} ms → {current_ms:7.2f} ms"
+    )
+
+
+def main():
+    db_service.pool = ConnectionPool(lambda: CountingConnection(**DB_CONFIG), min_size=1, max_size=2)
+    app = Flask(__name__)
+    app.register_blueprint(favorites_api)
+    app.register_blueprint(user_api)
+    app.register_blueprint(board_api, url_prefix="/api")
+    app.register_blueprint(comment_api, url_prefix="/api")
+    client = app.test_client()
+
+    with db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT spot_id FROM spot ORDER BY spot_id LIMIT %s", (ROUNDS + 1,))
+        spot_ids = [row["spot_id"] for row in cursor.fetchall()]
+    if len(spot_ids) < ROUNDS + 1:
+        raise SystemExit(f"spot 테이블에 낚시터가 {ROUNDS + 1}곳 이상 필요합니다")
+
+    cleanup()
+    try:
+        print(f"요청 {ROUNDS}회 평균 (이전 → 현재)")
+        user = {"user_id": USER, "user_pw": "pw", "name": "bench", "email": EMAIL}
+        legacy, current = [], []
+        for _ in range(ROUNDS):
+            legacy.append(counted(legacy_create_user))
+            cleanup()
+            current.append(counted(lambda: client.post("/create/users", json=user)))
+            cleanup()
+        report("create_user", legacy, current)
+
+        client.post("/create/users", json=user)
+        legacy = [counted(legacy_create_user) for _ in range(ROUNDS)]
+        current = [counted(lambda: client.post("/create/users", json=user)) for _ in range(ROUNDS)]
+        report("create_user (중복)", legacy, current)
+
+        legacy = [counted(lambda s=s: legacy_add_favorite(s)) for s in spot_ids[:ROUNDS]]
+        with db_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("DELETE FROM favorites WHERE user_id = %s", (USER,))
+            conn.commit()
+        current = [
+            counted(lambda s=s: client.post("/favorites", json={"user_id": USER, "spot_id": s}))
+            for s in spot_ids[:ROUNDS]
+        ]
+        report("add_favorite", legacy, current)
+
+        legacy = [counted(lambda s=s: legacy_add_favorite(s)) for s in spot_ids[:ROUNDS]]
+        current = [
+            counted(lambda s=s: client.post("/favorites", json={"user_id": USER, "spot_id": s}))
+            for s in spot_ids[:ROUNDS]
+        ]
+        report("add_favorite (중복)", legacy, current)
+
+        board_id = create_board(client, spot_ids[0])
+        legacy = [counted(lambda: legacy_post_comment(board_id)) for _ in range(ROUNDS)]
+        current = [
+            counted(lambda: client.post("/api/comments", json={"board_id": board_id, "user_id": USER, "comment_content": "bench"}))
+            for _ in range(ROUNDS)
+        ]
+        report("post_comment", legacy, current)
+
+        legacy = [counted(lambda s=s: legacy_update_board(board_id, s)) for s in spot_ids[1:ROUNDS + 1]]
+        current = [
+            counted(lambda s=s: client.put(f"/api/boards/{board_id}", json={"user_id": USER, "title": "bench", "content": "bench", "spot_id": s}))
+            for s in spot_ids[1:ROUNDS + 1]
+        ]
+        report("update_board", legacy, current)
+
+        boards = [create_board(client, spot_ids[0]) for _ in range(ROUNDS * 2)]
+        legacy = [counted(lambda b=b: legacy_delete_board(b)) for b in boards[:ROUNDS]]
+        current = [
+            counted(lambda b=b: client.delete(f"/api/boards/{b}", json={"user_id": USER}))
+            for b in boards[ROUNDS:]
+        ]
+        report("delete_board", legacy, current)
+    finally:
+        cleanup()
+        db_service.pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+위경도 → KMA 격자 변환 처리량 벤치마크 (낚시터 전체 테이블 기준).
+
+• 스칼라: x_y_to_kma_grid 를 낚시터마다 호출
+• 배치:   x_y_to_kma_grid_batch 한 번 호출
+실행 (backend 디렉터리에서):
+    python -m benchmark.bench_kma_grid
+"""
+import os
+import time
+
+import pandas as pd
+
+from function import x_y_to_kma_grid, x_y_to_kma_grid_batch
+
+SPOT_CSV = os.path.join(os.path.dirname(__file__), "..", "..", "..", "data", "fishing_spot.csv")
+REPEAT = 20
+
+
+def main():
+    df = pd.read_csv(SPOT_CSV).dropna(subset=["WGS84위도", "WGS84경도"])
+    lats = df["WGS84위도"].to_numpy()
+    lons = df["WGS84경도"].to_numpy()
+
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        scalar = [x_y_to_kma_grid(a, b) for a, b in zip(lats, lons)]
+    scalar_time = (time.perf_counter() - start) / REPEAT
+
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        nx, ny = x_y_to_kma_grid_batch(lats, lons)
+    batch_time = (time.perf_counter() - start) / REPEAT
+
+    assert scalar == list(zip(nx.tolist(), ny.tolist())), "스칼라/배치 결과 불일치"
+
+    n = len(lats)
+    print(f"낚시터 {n}곳, 결과 일치")
+    print(f"스칼라: {scalar_time * 1000:.2f} ms ({n / scalar_time:,.0f} 점/초)")
+    print(f"배치  : {batch_time * 1000:.2f} ms ({n / batch_time:,.0f} 점/초)")
+    print(f"속도 향상: x{scalar_time / batch_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+주소 → 중기 예보 지역 코드 변환 벤치마크: iterrows 순차 탐색 ×3 vs Aho-Corasick 1회 탐색.
+
+낚시터 전체 주소에 대해 두 방식의 결과가 같은지 확인하고 처리 시간을 비교한다.
+실행 (backend 디렉터리에서):
+    python -m benchmark.bench_region_matcher
+"""
+import time
+
+from benchmark._data import sample_spot_service
+
+
+def iterrows_lookup(address, df):
+    """기존 _lookup_code_from_address (디버그 출력 제외)"""
+    for _, row in df.iterrows():
+        if row["region_name"] in address:
+            return row["region_code"]
+    return None
+
+
+def main():
+    with sample_spot_service() as service:
+        addresses = [a for a in service.df["address"] if isinstance(a, str)]
+        tables = [service.land_df, service.temp_df, service.sea_df]
+
+        start = time.perf_counter()
+        legacy = [tuple(iterrows_lookup(a, df) for df in tables) for a in addresses]
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matched = [service.resolve_mid_codes_from_address(a) for a in addresses]
+        matcher_time = time.perf_counter() - start
+
+        assert legacy == matched, "지역 코드 결과 불일치"
+
+        n = len(addresses)
+        print(f"주소 {n}개, 결과 일치")
+        print(f"iterrows ×3    : {legacy_time * 1000:8.1f} ms ({legacy_time / n * 1e6:.0f} us / 낚시터)")
+        print(f"Aho-Corasick ×1: {matcher_time * 1000:8.1f} ms ({matcher_time / n * 1e6:.1f} us / 낚시터)")
+        print(f"속도 향상      : x{legacy_time / matcher_time:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+낚시터 조회 지연 벤치마크: DataFrame 불리언 마스크 vs 해시 인덱스.
+
+날씨 요청 1건이 하는 조회(좌표 1회 + 중기 코드용 주소 3회)를 기준으로 비교한다.
+실행 (backend 디렉터리에서):
+    python -m benchmark.bench_spot_lookup
+"""
+import random
+import time
+
+from benchmark._data import sample_spot_service
+
+LOOKUPS = 20000
+
+
+def mask_lookup(df, name):
+    """기존 방식: 요청마다 전체 DataFrame 마스크 생성"""
+    row = df[df["name"] == name]
+    if row.empty:
+        return None, None
+    return float(row.iloc[0]["lat"]), float(row.iloc[0]["lon"])
+
+
+def main():
+    with sample_spot_service() as service:
+        df = service.df
+        names = random.Random(0).choices(df["name"].tolist(), k=LOOKUPS)
+
+        for name in names[:100]:
+            assert mask_lookup(df, name) == service.get_coordinates_by_name(name)
+
+        start = time.perf_counter()
+        for name in names[:LOOKUPS // 20]:
+            mask_lookup(df, name)
+        mask_us = (time.perf_counter() - start) / (LOOKUPS // 20) * 1e6
+
+        start = time.perf_counter()
+        for name in names:
+            service.get_coordinates_by_name(name)
+        index_us = (time.perf_counter() - start) / LOOKUPS * 1e6
+
+        print(f"낚시터 {len(df)}곳")
+        print(f"DataFrame 마스크: {mask_us:8.2f} us / 조회 (날씨 요청당 4회 ≈ {mask_us * 4:.0f} us)")
+        print(f"해시 인덱스     : {index_us:8.2f} us / 조회 (날씨 요청당 4회 ≈ {index_us * 4:.1f} us)")
+        print(f"속도 향상       : x{mask_us / index_us:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+낚시터 이름 검색 지연 벤치마크: SQL LIKE '%키워드%' vs 메모리 n-gram/초성 인덱스.
+
+MySQL 대신 SQLite 임시 DB의 spot 테이블에 같은 낚시터 이름을 넣고
+/api/spots/search 의 이전 쿼리(LIKE, LIMIT 20)와 FishingSpotService.search_spots 를 비교한다.
+원본 목록(약 1천 곳)과 SCALE 배로 늘린 목록 두 크기에서 잰다.
+실행 (backend 디렉터리에서):
+    python -m benchmark.bench_spot_search
+"""
+import os
+import sqlite3
+import tempfile
+import time
+
+from benchmark._data import sample_spot_service
+from spot.search import SpotSearchIndex
+
+SCALE = 50
+ROUNDS = 200
+KEYWORDS = ["낚시터", "바다", "제일", "용", "저수지", "유어장", "관광농원", "ㄴㅅㅌ", "ㅇㅇㅈ", "없는이름", "낚시터낚시"]
+
+LIKE_SQL = "SELECT spot_id, name, address FROM spot WHERE name LIKE ? LIMIT 20"
+
+
+def sqlite_spots(path: str, records: list[dict]) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE spot (spot_id INTEGER PRIMARY KEY, name TEXT, address TEXT)")
+    conn.execute("CREATE INDEX ix_spot_name ON spot (name)")
+    conn.executemany("INSERT INTO spot VALUES (?, ?, ?)", (
+        (i, record["name"], record.get("address")) for i, record in enumerate(records, start=1)
+    ))
+    conn.commit()
+    return conn
+
+
+def per_query_us(fn) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for keyword in KEYWORDS:
+            fn(keyword)
+    return (time.perf_counter() - start) / (ROUNDS * len(KEYWORDS)) * 1e6
+
+
+def check(conn, index: SpotSearchIndex):
+    """
+    초성이 아닌 질의는 LIKE 와 같은 낚시터 집합을 찾아야 함 (순서/개수 제한 제외)
+    """
+    for keyword in KEYWORDS:
+        if keyword.startswith("ㄴ") or keyword.startswith("ㅇ"):
+            continue
+        like = {row[0] for row in conn.execute("SELECT name FROM spot WHERE name LIKE ?", (f"%{keyword}%",))}
+        found = {record["name"] for record in index.search(keyword, limit=len(index))}
+        assert like == found, keyword
+
+
+def main():
+    with sample_spot_service() as service:
+        records = [r for r in service.index.records if isinstance(r.get("name"), str)]
+        samples = {kw: [r["name"] for r in service.search_spots(kw, limit=5)] for kw in ("낚시", "ㅂㅅ", "제일")}
+    scaled = [{**r, "name": f"{r['name']} {n}" if n else r["name"]} for n in range(SCALE) for r in records]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, rows in ((f"{len(records):,}곳", records), (f"{len(scaled):,}곳 (x{SCALE})", scaled)):
+            conn = sqlite_spots(os.path.join(tmp, f"spot-{len(rows)}.db"), rows)
+            start = time.perf_counter()
+            index = SpotSearchIndex(rows)
+            build_ms = (time.perf_counter() - start) * 1000
+            check(conn, index)
+
+            like_us = per_query_us(lambda kw: conn.execute(LIKE_SQL, (f"%{kw}%",)).fetchall())
+            index_us = per_query_us(lambda kw: index.search(kw))
+            print(
+                f"{label:<16} LIKE {like_us:9.1f} µs/질의   인덱스 {index_us:7.1f} µs/질의 "
+                f"({like_us / index_us:5.1f}배)   색인 {build_ms:6.1f} ms"
+            )
+            conn.close()
+
+    for keyword, names in samples.items():
+        print(f"  {keyword!r}: {names}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+시작 시간 벤치마크: 원본 CSV 파싱 vs 바이너리 스냅샷 로드.
+
+FishingSpotService 생성(지역 CSV 4개 + 낚시터 CSV + 예보 경로 계산 + 인덱스)을
+스냅샷이 없을 때(원본 파싱 후 스냅샷 저장)와 있을 때로 나눠 잰다.
+실행 (backend 디렉터리에서):
+    python -m benchmark.bench_startup
+"""
+import json
+import os
+import time
+
+from benchmark._data import sample_workspace
+from spot.service import FishingSpotService
+from spot.snapshot import snapshot_name
+
+ROUNDS = 5
+
+
+def clear_snapshots(spot_path, snapshot_dir):
+    for name in ["regions", snapshot_name("spots", spot_path)]:
+        path = os.path.join(snapshot_dir, f"{name}.pkl")
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def run(spot_path, snapshot_dir):
+    def load():
+        return FishingSpotService(file_path=spot_path, snapshot_dir=snapshot_dir)
+
+    cold = []
+    for _ in range(ROUNDS):
+        clear_snapshots(spot_path, snapshot_dir)
+        cold.append(timed(load))
+
+    warm = [timed(load) for _ in range(ROUNDS)]
+
+    # 스냅샷에서 읽은 결과가 원본 파싱 결과와 같은지 확인
+    clear_snapshots(spot_path, snapshot_dir)
+    fresh = load()
+    cached = load()
+    assert fresh.df.equals(cached.df)
+    # (NaN != NaN 이므로 직렬화해서 비교)
+    assert json.dumps(fresh.get_all_spots(), default=str) == json.dumps(cached.get_all_spots(), default=str)
+
+    cold_ms, warm_ms = min(cold), min(warm)
+    print(f"낚시터 {len(fresh.df)}곳, {ROUNDS}회 중 최소값")
+    print(f"  CSV 파싱 (+스냅샷 저장): {cold_ms:8.1f} ms")
+    print(f"  스냅샷 로드            : {warm_ms:8.1f} ms")
+    print(f"  x{cold_ms / warm_ms:.1f}")
+
+
+def main():
+    with sample_workspace() as (spot_path, snapshot_dir):
+        run(spot_path, snapshot_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+WeatherService.get_all_forecasts 순차/동시 조회 비교 벤치마크.
+
+로컬 스텁 서버가 KMA 응답을 흉내내며 요청마다 STUB_DELAY 만큼 지연한다.
+실행 (backend 디렉터리에서):
+    python -m benchmark.bench_weather_concurrency
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import weather.client as client
+from weather.service import WeatherService
+
+STUB_DELAY = 0.2   # 업스트림 1회 왕복 지연 (초)
+ROUNDS = 5
+
+STUB_BODY = json.dumps({
+    "response": {
+        "header": {"resultCode": "00"},
+        "body": {"items": {"item": [
+            {"category": "T1H", "fcstDate": "20250101", "fcstTime": "0000", "fcstValue": "3"}
+        ]}},
+    }
+}).encode("utf-8")
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(STUB_DELAY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(STUB_BODY)))
+        self.end_headers()
+        self.wfile.write(STUB_BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def _run(service: WeatherService, concurrent: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        client.forecast_cache.clear()   # 캐시 없이 업스트림 왕복만 측정
+        service.get_all_forecasts(concurrent=concurrent)
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}/"
+
+    # 업스트림 URL을 스텁 서버로 교체
+    client.KMA_URL = base + "{}?serviceKey={}&nx={}&ny={}&base_date={}&base_time={}"
+    client.KMA_MID_URL = base + "{}?serviceKey={}&regId={}&tmFc={}{}"
+
+    service = WeatherService("stub", 60, 127, "11B00000", "11B10101", "12A20000")
+    sequential = _run(service, concurrent=False)
+    concurrent = _run(service, concurrent=True)
+    server.shutdown()
+
+    print(f"업스트림 지연      : {STUB_DELAY * 1000:.0f} ms / 호출")
+    print(f"순차 조회 (5회 호출): {sequential * 1000:.1f} ms / 요청")
+    print(f"동시 조회 (5회 호출): {concurrent * 1000:.1f} ms / 요청")
+    print(f"속도 향상          : x{sequential / concurrent:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+어류 WFS 응답 파서 벤치마크: 기존 xmltodict 파서 vs iterparse 스트리밍 파서.
+
+대용량 픽스처(maxFeatures 상한 500 × PAGES 페이지 분량)를 생성해 두 파서의
+결과가 같은지 확인하고 처리 시간을 비교한다.
+실행 (backend 디렉터리에서):
+    python -m benchmark.bench_wfs_parser
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+
+import xmltodict
+
+from fish.parser import fix_encoding_if_needed, parse_wfs_features
+
+FEATURES = 500 * 10
+REPEAT = 5
+
+SPECIES = ["붕어", "잉어", "메기", "쏘가리", "배스", "블루길", "피라미", "끄리"]
+
+
+def build_fixture(path: str, count: int):
+    with open(path, "wb") as f:
+        f.write(
+            b'<?xml version="1.0" encoding="UTF-8"?>\n'
+            b'<wfs:FeatureCollection xmlns:wfs="http://www.opengis.net/wfs" '
+            b'xmlns:gml="http://www.opengis.net/gml" xmlns:EcoBank="http://www.nie-ecobank.kr">\n'
+        )
+        for i in range(count):
+            f.write((
+                "<gml:featureMember><EcoBank:mv_map_ntee_fishes_point fid=\"p.{i}\">"
+                "<EcoBank:spcs_code>F{i:05d}</EcoBank:spcs_code>"
+                "<EcoBank:spcs_korean_nm>{nm}</EcoBank:spcs_korean_nm>"
+                "<EcoBank:examin_year>{year}</EcoBank:examin_year>"
+                "<EcoBank:examin_realm_se_code>R0{realm}</EcoBank:examin_realm_se_code>"
+                "<EcoBank:examin_begin_de>{year}0401</EcoBank:examin_begin_de>"
+                "<EcoBank:examin_end_de>{year}0430</EcoBank:examin_end_de>"
+                "<EcoBank:geom><gml:Point srsName=\"EPSG:5186\">"
+                "<gml:coordinates decimal=\".\" cs=\",\" ts=\" \">{x:.3f},{y:.3f}</gml:coordinates>"
+                "</gml:Point></EcoBank:geom>"
+                "</EcoBank:mv_map_ntee_fishes_point></gml:featureMember>\n"
+            ).format(
+                i=i,
+                nm=SPECIES[i % len(SPECIES)],
+                year=2010 + i % 12,
+                realm=i % 3,
+                x=200000 + (i * 37) % 200000,
+                y=300000 + (i * 53) % 300000,
+            ).encode("utf-8"))
+        f.write(b"</wfs:FeatureCollection>\n")
+
+
+def legacy_parse(raw_xml: str) -> list:
+    """기존 xmltodict 기반 parse_wfs_features (비교용 사본)"""
+    doc = xmltodict.parse(raw_xml)
+    root = doc.get("wfs:FeatureCollection") or doc.get("FeatureCollection")
+    raw_members = root.get("gml:featureMember") or root.get("featureMember") or []
+    members = [raw_members] if isinstance(raw_members, dict) else raw_members
+    features = []
+    for member in members:
+        key_candidates = [k for k in member.keys() if k.endswith("fishes_point")]
+        if not key_candidates:
+            continue
+        node = member.get(key_candidates[0])
+        feat = {
+            "spce_id": node.get("EcoBank:spcs_code"),
+            "spcs_korean_nm": fix_encoding_if_needed(node.get("EcoBank:spcs_korean_nm")),
+            "examin_year": node.get("EcoBank:examin_year"),
+            "examin_area_nm": node.get("EcoBank:examin_realm_se_code"),
+            "examin_begin_de": node.get("EcoBank:examin_begin_de"),
+            "examin_end_de": node.get("EcoBank:examin_end_de"),
+        }
+        coords = None
+        geom = node.get("EcoBank:geom")
+        if geom and geom.get("gml:Point"):
+            coord_obj = geom["gml:Point"].get("gml:coordinates")
+            text = coord_obj.get("#text") if isinstance(coord_obj, dict) else coord_obj
+            if text:
+                x, y = map(float, text.split(","))
+                coords = [x, y]
+        feat["geom"] = {"type": "Point", "coordinates": coords}
+        features.append(feat)
+    return features
+
+
+def _measure(func, arg):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = func(arg)
+    elapsed = (time.perf_counter() - start) / REPEAT
+    tracemalloc.start()
+    func(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "wfs_fish_points.xml")
+        build_fixture(path, FEATURES)
+        with open(path, "rb") as f:
+            raw = f.read()
+
+    # requests 는 charset 헤더가 없으면 latin1 로 디코딩 → 기존 파서가 받던 입력
+    legacy, legacy_time, legacy_peak = _measure(legacy_parse, raw.decode("latin1"))
+    stream, stream_time, stream_peak = _measure(parse_wfs_features, raw)
+    assert legacy == stream, "파서 결과 불일치"
+
+    print(f"픽스처: 피처 {FEATURES}개, {len(raw) / 1024:.0f} KB, 결과 일치")
+    print(f"xmltodict : {legacy_time * 1000:.1f} ms, 최대 메모리 {legacy_peak / 1024:.0f} KB")
+    print(f"iterparse : {stream_time * 1000:.1f} ms, 최대 메모리 {stream_peak / 1024:.0f} KB")
+    print(f"속도 향상 : x{legacy_time / stream_time:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 메모리 상한 + 만료 시각을 가진 LRU 캐시 (스레드 안전)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class LRUCache:
+    """
+    • max_entries: 최대 항목 수
+    • max_bytes: 항목 크기(size) 합계 상한 (None이면 제한 없음)
+    • set(..., expires_at=epoch 초): 해당 시각 이후 조회 시 miss 처리
+    가득 차면 가장 오래 사용되지 않은 항목부터 제거.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int | None = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: OrderedDict = OrderedDict()   # key → (value, expires_at, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at, size = entry
+            if expires_at is not None and expires_at <= time.time():
+                self._remove(key)
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key, default=None):
+        """
+        적중/실패 카운터와 LRU 순서를 건드리지 않고 조회 (이중 확인용)
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.time():
+                return default
+            return value
+
+    def set(self, key, value, expires_at: float | None = None, size: int = 0):
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, expires_at, size)
+            self._bytes += size
+            self._evict()
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+    def __len__(self):
+        return len(self._data)
+
+    # ── 내부 처리 (lock 보유 상태에서 호출) ──────────────────────────────────
+    def _remove(self, key):
+        _, _, size = self._data.pop(key)
+        self._bytes -= size
+
+    def _evict(self):
+        while len(self._data) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes and len(self._data) > 1
+        ):
+            key = next(iter(self._data))
+            self._remove(key)
+            self.evictions += 1
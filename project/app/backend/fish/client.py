@@ -1,4 +1,4 @@
-import requests
+from transport import transport
 
 from .const import (
     BASE_URL,
@@ -7,6 +7,7 @@ from .const import (
     PARAM_TYPE_NAME,
     PARAM_BBOX,
     PARAM_MAX_FEATURES,
+    PARAM_START_INDEX,
     DEFAULT_TYPE_NAME,
     DEFAULT_MAX_FEATURES,
 )
@@ -27,15 +28,17 @@ class FishAPIClient:
         type_name: str = None,
         max_features: int = None,
         srs: str = None,
-    ) -> str:
+        start_index: int = None,
+    ) -> bytes:
         """
         WFS 조회: 지정한 bbox, 피처 타입, 최대 개수 등에 따라 피처 정보(XML/JSON) 반환.
         • bbox: "minx,miny,maxx,maxy"
         • type_name: 피처 타입명(쉼표 구분, 기본 DEFAULT_TYPE_NAME)
         • max_features: 최대 개수 (기본 DEFAULT_MAX_FEATURES)
         • srs: 좌표계 (기본 DEFAULT_SRS)
+        • start_index: 페이지 시작 위치 (전체 수집 시 사용)
 
-        응답 데이터를 XML 문자열로 반환합니다.
+        응답 데이터를 디코딩하지 않은 XML 바이트로 반환합니다 (파서가 한 번에 디코딩).
         """
         url = BASE_URL + WFS_ENDPOINT
         params = {
@@ -44,8 +47,9 @@ class FishAPIClient:
             PARAM_BBOX: bbox,
             PARAM_MAX_FEATURES: max_features or DEFAULT_MAX_FEATURES,
         }
-        resp = requests.get(url, params=params)
+        if start_index:
+            params[PARAM_START_INDEX] = start_index
+        resp = transport.get(url, params=params)
         # print(url, params)
         resp.raise_for_status()
-        # print(resp.text)
-        return resp.text
+        return resp.content
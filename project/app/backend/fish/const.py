@@ -15,6 +15,7 @@ PARAM_SERVICE_KEY  = "serviceKey"
 PARAM_TYPE_NAME    = "typeName"    # 피처 타입명(쉼표 구분)
 PARAM_BBOX         = "bbox"        # "minx,miny,maxx,maxy"
 PARAM_MAX_FEATURES = "maxFeatures" # 최대 피처 개수 (기본 10, 최대 500)
+PARAM_START_INDEX  = "startIndex"  # 페이지 시작 위치 (0부터)
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  기본값 (옵션 파라미터 디폴트)
@@ -34,3 +35,10 @@ WFS_FIELD_SPCS_KOR_NAME= "spcs_korean_nm"
 WFS_FIELD_AREA_NAME    = "examin_area_nm"
 WFS_FIELD_BEGIN_DATE   = "examin_begin_de"
 WFS_FIELD_END_DATE     = "examin_end_de"
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  어류 조사 지점 전체 수집(harvest) 설정
+# ─────────────────────────────────────────────────────────────────────────────
+MAX_FEATURES_LIMIT   = 500                                  # maxFeatures 상한
+SERVICE_AREA_BBOX    = (-40000.0, 40000.0, 660000.0, 700000.0)  # 국내 전역 (EPSG:5186 minx,miny,maxx,maxy)
+HARVEST_TILE_SIZE_M  = 50000.0                              # 수집 타일 한 변 (m)
@@ -0,0 +1,72 @@
+from typing import List, Dict, Any
+
+from .const import (
+    DEFAULT_TYPE_NAME,
+    MAX_FEATURES_LIMIT,
+    SERVICE_AREA_BBOX,
+    HARVEST_TILE_SIZE_M,
+    WFS_FIELD_GEOM,
+)
+from .index import ATTRIBUTE_FIELDS, FISH_POINTS_PATH, save_points
+from .service import FishService, feature_key
+
+
+def _tiles(bbox: tuple, size: float):
+    minx, miny, maxx, maxy = bbox
+    x = minx
+    while x < maxx:
+        y = miny
+        while y < maxy:
+            yield x, y, min(x + size, maxx), min(y + size, maxy)
+            y += size
+        x += size
+
+
+def harvest_fish_points(
+    service_key: str,
+    path: str = FISH_POINTS_PATH,
+    bbox: tuple = SERVICE_AREA_BBOX,
+    tile_size_m: float = HARVEST_TILE_SIZE_M,
+    page_size: int = MAX_FEATURES_LIMIT,
+    type_name: str = DEFAULT_TYPE_NAME,
+    request_delay: float = 0.2,
+) -> int:
+    """
+    서비스 지역 전체를 타일로 나눠 WFS 레이어를 maxFeatures/startIndex 페이지 단위로 수집,
+    로컬 파일로 저장. 반환: 저장된 지점 수
+    """
+    fish_service = FishService(service_key)
+    seen = set()
+    records: List[Dict[str, Any]] = []
+    tiles = 0
+
+    for tile in _tiles(bbox, tile_size_m):
+        tile_bbox = ",".join(str(v) for v in tile)
+        features = fish_service.get_all_features(
+            bbox=tile_bbox,
+            type_name=type_name,
+            page_size=page_size,
+            request_delay=request_delay,
+        )
+        tiles += 1
+
+        # 타일 경계에 걸친 지점은 양쪽 타일에서 조회되므로 중복 제거
+        for feature in features:
+            coords = feature[WFS_FIELD_GEOM]["coordinates"]
+            key = feature_key(feature)
+            if not coords or key in seen:
+                continue
+            seen.add(key)
+            record = {f: feature.get(f) for f in ATTRIBUTE_FIELDS}
+            record["x"], record["y"] = coords
+            records.append(record)
+
+    save_points(records, path)
+    print(f"[FishHarvest] 타일 {tiles}개, 지점 {len(records)}개 저장: {path}")
+    return len(records)
+
+
+if __name__ == "__main__":
+    # 실행 (backend 디렉터리에서): python -m fish.harvest
+    import env
+    harvest_fish_points(env.EnvironmentKey.FISH_API_KEY)
@@ -0,0 +1,108 @@
+import os
+from collections import defaultdict
+from typing import List, Dict, Any
+
+import numpy as np
+import pandas as pd
+
+from .const import (
+    WFS_FIELD_SPC_ID,
+    WFS_FIELD_GEOM,
+    WFS_FIELD_EXAMIN_YEAR,
+    WFS_FIELD_SPCS_KOR_NAME,
+    WFS_FIELD_AREA_NAME,
+    WFS_FIELD_BEGIN_DATE,
+    WFS_FIELD_END_DATE,
+)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FISH_POINTS_PATH = os.path.join(BASE_DIR, "..", "dataset", "fish_points", "fish_points.csv")
+
+# 저장 파일 컬럼: 피처 속성 + EPSG:5186 좌표
+ATTRIBUTE_FIELDS = [
+    WFS_FIELD_SPC_ID,
+    WFS_FIELD_SPCS_KOR_NAME,
+    WFS_FIELD_EXAMIN_YEAR,
+    WFS_FIELD_AREA_NAME,
+    WFS_FIELD_BEGIN_DATE,
+    WFS_FIELD_END_DATE,
+]
+POINT_COLUMNS = ATTRIBUTE_FIELDS + ["x", "y"]
+
+DEFAULT_CELL_SIZE_M = 5000.0
+
+
+class FishPointIndex:
+    """
+    어류 조사 지점(EPSG:5186) 격자 버킷 공간 인덱스.
+    • cell_size_m 크기 정사각 셀마다 지점 번호 목록을 보관
+    • query_radius(): 반경이 걸치는 셀만 확인 후 실제 거리로 필터링
+    """
+
+    def __init__(self, records: List[Dict[str, Any]], cell_size_m: float = DEFAULT_CELL_SIZE_M):
+        self.cell_size = cell_size_m
+        self.records = records
+        self.xs = np.array([r["x"] for r in records], dtype=np.float64)
+        self.ys = np.array([r["y"] for r in records], dtype=np.float64)
+
+        buckets = defaultdict(list)
+        for i, (x, y) in enumerate(zip(self.xs, self.ys)):
+            buckets[(int(x // cell_size_m), int(y // cell_size_m))].append(i)
+        self.buckets = {k: np.array(v, dtype=np.int64) for k, v in buckets.items()}
+
+    def __len__(self):
+        return len(self.records)
+
+    @classmethod
+    def load(cls, path: str = FISH_POINTS_PATH, cell_size_m: float = DEFAULT_CELL_SIZE_M):
+        """
+        수집 파일이 없으면 None
+        """
+        if not os.path.exists(path):
+            return None
+        df = pd.read_csv(path, dtype={f: str for f in ATTRIBUTE_FIELDS})
+        df = df.dropna(subset=["x", "y"])
+        df = df.astype(object).where(df.notna(), None)
+        return cls(df[POINT_COLUMNS].to_dict("records"), cell_size_m)
+
+    def query_radius(self, x: float, y: float, radius_m: float, limit: int | None = None) -> List[Dict[str, Any]]:
+        """
+        (x, y) 반경 radius_m 안의 지점을 가까운 순으로 반환 (parse_wfs_features 와 같은 형식)
+        """
+        c = self.cell_size
+        cx0, cx1 = int((x - radius_m) // c), int((x + radius_m) // c)
+        cy0, cy1 = int((y - radius_m) // c), int((y + radius_m) // c)
+
+        candidates = [
+            self.buckets[(cx, cy)]
+            for cx in range(cx0, cx1 + 1)
+            for cy in range(cy0, cy1 + 1)
+            if (cx, cy) in self.buckets
+        ]
+        if not candidates:
+            return []
+
+        idx = np.concatenate(candidates)
+        dist2 = (self.xs[idx] - x) ** 2 + (self.ys[idx] - y) ** 2
+        mask = dist2 <= radius_m * radius_m
+        idx, dist2 = idx[mask], dist2[mask]
+        order = np.argsort(dist2, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+        return [self._to_feature(self.records[i]) for i in idx[order]]
+
+    @staticmethod
+    def _to_feature(record: Dict[str, Any]) -> Dict[str, Any]:
+        feature = {f: record.get(f) for f in ATTRIBUTE_FIELDS}
+        feature[WFS_FIELD_GEOM] = {"type": "Point", "coordinates": [record["x"], record["y"]]}
+        return feature
+
+
+def save_points(records: List[Dict[str, Any]], path: str = FISH_POINTS_PATH):
+    """
+    임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    pd.DataFrame(records, columns=POINT_COLUMNS).to_csv(tmp_path, index=False, encoding="utf-8-sig")
+    os.replace(tmp_path, path)
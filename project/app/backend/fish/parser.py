@@ -1,5 +1,6 @@
-import xmltodict
-from typing import List, Dict, Any
+from io import BytesIO
+from typing import Iterator, List, Dict, Any
+from xml.etree.ElementTree import iterparse, ParseError
 
 from .const import (
     WFS_FIELD_SPC_ID,
@@ -11,6 +12,16 @@ from .const import (
     WFS_FIELD_END_DATE,
 )
 
+# WFS 응답 요소 이름(네임스페이스 제외) → 결과 필드명
+FEATURE_FIELDS = {
+    "spcs_code":            WFS_FIELD_SPC_ID,
+    "spcs_korean_nm":       WFS_FIELD_SPCS_KOR_NAME,
+    "examin_year":          WFS_FIELD_EXAMIN_YEAR,
+    "examin_realm_se_code": WFS_FIELD_AREA_NAME,
+    "examin_begin_de":      WFS_FIELD_BEGIN_DATE,
+    "examin_end_de":        WFS_FIELD_END_DATE,
+}
+
 def fix_encoding_if_needed(text: str) -> str:
     """
     깨진 한글 복구: latin1로 잘못 디코딩된 문자열을 utf-8로 복구
@@ -22,56 +33,79 @@ def fix_encoding_if_needed(text: str) -> str:
     except Exception:
         return text
 
-def parse_wfs_features(raw_xml: str) -> List[Dict[str, Any]]:
-    features: List[Dict[str, Any]] = []
-
+def _to_bytes(raw_xml) -> bytes:
+    """
+    응답 원문을 바이트로 통일. latin1로 잘못 디코딩된 문자열은 원래 바이트로 되돌림
+    """
+    if isinstance(raw_xml, (bytes, bytearray)):
+        return bytes(raw_xml)
     try:
-        doc = xmltodict.parse(raw_xml)
-    except Exception as e:
-        raise RuntimeError(f"WFS XML 파싱 실패: {e}")
-
-    root = doc.get("wfs:FeatureCollection") or doc.get("FeatureCollection")
-    if not root:
-        return features
+        return raw_xml.encode("latin1")
+    except UnicodeEncodeError:
+        return raw_xml.encode("utf-8")
 
-    raw_members = root.get("gml:featureMember") or root.get("featureMember") or []
-    members = [raw_members] if isinstance(raw_members, dict) else raw_members
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
 
-    for member in members:
-        key_candidates = [k for k in member.keys() if k.endswith("fishes_point")]
-        if not key_candidates:
-            continue
+def _text(elem) -> str | None:
+    text = (elem.text or "").strip()
+    return text or None
 
-        feature_node = member.get(key_candidates[0])
-        if not isinstance(feature_node, dict):
+def _parse_coordinates(geom) -> list[float] | None:
+    for point in geom:
+        if _local(point.tag) != "Point":
             continue
+        for coord in point:
+            if _local(coord.tag) != "coordinates":
+                continue
+            coord_text = _text(coord)
+            if not coord_text:
+                return None
+            try:
+                x, y = map(float, coord_text.split(","))
+                return [x, y]
+            except ValueError:
+                return None
+    return None
 
-        parsed_feat: Dict[str, Any] = {}
-
-        # 일반 필드 (한글 포함된 항목은 디코딩 시도)
-        parsed_feat["spce_id"]          = feature_node.get("EcoBank:spcs_code")
-        parsed_feat["spcs_korean_nm"]   = fix_encoding_if_needed(feature_node.get("EcoBank:spcs_korean_nm"))
-        parsed_feat["examin_year"]      = feature_node.get("EcoBank:examin_year")
-        parsed_feat["examin_area_nm"]   = feature_node.get("EcoBank:examin_realm_se_code")
-        parsed_feat["examin_begin_de"]  = feature_node.get("EcoBank:examin_begin_de")
-        parsed_feat["examin_end_de"]    = feature_node.get("EcoBank:examin_end_de")
+def _parse_feature(feature) -> Dict[str, Any]:
+    parsed_feat: Dict[str, Any] = dict.fromkeys(FEATURE_FIELDS.values())
+    coords = None
+    for child in feature:
+        name = _local(child.tag)
+        if name in FEATURE_FIELDS:
+            parsed_feat[FEATURE_FIELDS[name]] = _text(child)
+        elif name == WFS_FIELD_GEOM:
+            coords = _parse_coordinates(child)
+    parsed_feat[WFS_FIELD_GEOM] = {"type": "Point", "coordinates": coords}
+    return parsed_feat
 
-        # 좌표 파싱
-        coords = None
-        geom_node = feature_node.get("EcoBank:geom")
-        if geom_node:
-            point_node = geom_node.get("gml:Point")
-            if point_node:
-                coord_obj = point_node.get("gml:coordinates")
-                coord_text = coord_obj.get("#text") if isinstance(coord_obj, dict) else coord_obj
-                if coord_text:
-                    try:
-                        x, y = map(float, coord_text.split(","))
-                        coords = [x, y]
-                    except:
-                        coords = None
+def iter_wfs_features(raw_xml) -> Iterator[Dict[str, Any]]:
+    """
+    WFS 응답을 gml:featureMember 단위로 읽어가며 피처를 하나씩 반환.
+    처리한 요소는 바로 해제하므로 응답 크기와 무관하게 메모리 사용이 일정함.
+    """
+    depth = 0
+    root = None
+    try:
+        for event, elem in iterparse(BytesIO(_to_bytes(raw_xml)), events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if root is None:
+                    root = elem
+                    if _local(root.tag) != "FeatureCollection":
+                        return
+                continue
 
-        parsed_feat["geom"] = {"type": "Point", "coordinates": coords}
-        features.append(parsed_feat)
+            depth -= 1
+            if depth == 1 and _local(elem.tag) == "featureMember":
+                for feature in elem:
+                    if _local(feature.tag).endswith("fishes_point"):
+                        yield _parse_feature(feature)
+                        break
+                root.remove(elem)
+    except ParseError as e:
+        raise RuntimeError(f"WFS XML 파싱 실패: {e}")
 
-    return features
+def parse_wfs_features(raw_xml) -> List[Dict[str, Any]]:
+    return list(iter_wfs_features(raw_xml))
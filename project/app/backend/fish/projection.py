@@ -0,0 +1,41 @@
+from functools import lru_cache
+
+import numpy as np
+from pyproj import Transformer
+
+from .const import DEFAULT_SRS
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  좌표 투영 (WGS84 → EPSG:5186)
+#  Transformer 생성 비용이 크므로 좌표계 쌍마다 한 번만 생성해 재사용
+# ─────────────────────────────────────────────────────────────────────────────
+WGS84_SRS = "EPSG:4326"
+
+
+@lru_cache(maxsize=None)
+def get_transformer(src: str = WGS84_SRS, dst: str = DEFAULT_SRS) -> Transformer:
+    return Transformer.from_crs(src, dst, always_xy=True)
+
+
+def project_point(lat: float, lon: float) -> tuple[float, float]:
+    """
+    위도/경도 → EPSG:5186 (x, y)
+    """
+    return get_transformer().transform(lon, lat)  # transform(lon, lat)
+
+
+def project_points(lats, lons) -> tuple[np.ndarray, np.ndarray]:
+    """
+    위도/경도 배열 → EPSG:5186 (x 배열, y 배열). 한 번의 호출로 전체 변환
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    return get_transformer().transform(lons, lats)
+
+
+def bbox_from_projected(x_5186: float, y_5186: float, radius_km: float) -> str:
+    """
+    EPSG:5186 중심점 + 반경(km) → "minx,miny,maxx,maxy"
+    """
+    r_m = radius_km * 1000.0
+    return f"{x_5186 - r_m},{y_5186 - r_m},{x_5186 + r_m},{y_5186 + r_m}"
@@ -1,9 +1,20 @@
 # fish/service.py
+import time
+
 from .client import FishAPIClient
+from .const import MAX_FEATURES_LIMIT, WFS_FIELD_GEOM
 from .parser import parse_wfs_features
 from typing import List, Dict, Any
 
 
+def feature_key(feature: Dict[str, Any]) -> tuple:
+    """
+    피처 식별 키 (속성 + 좌표). 겹치는 bbox 결과 중복 제거용
+    """
+    coords = tuple(feature[WFS_FIELD_GEOM]["coordinates"] or ())
+    return tuple(v for k, v in feature.items() if k != WFS_FIELD_GEOM) + coords
+
+
 class FishService:
     """
     WFS 피처 리스트(딕셔너리) 리턴
@@ -17,17 +28,55 @@ class FishService:
         bbox: str,
         type_name: str = None,
         max_features: int = None,
+        start_index: int = None,
     ) -> List[Dict[str, Any]]:
         """
         WFS를 통해 피처(속성 + 좌표) 리스트를 파싱하여 반환.
         • bbox: "minx,miny,maxx,maxy"
         • type_name: 피처 타입명 (기본 DEFAULT_TYPE_NAME)
         • max_features: 최대 개수 (기본 DEFAULT_MAX_FEATURES)
-        • srs: 좌표계 (기본 DEFAULT_SRS)
+        • start_index: 페이지 시작 위치
         """
         raw_xml = self.client.get_wfs_features(
             bbox=bbox,
             type_name=type_name,
             max_features=max_features,
+            start_index=start_index,
         )
         return parse_wfs_features(raw_xml)
+
+    def get_all_features(
+        self,
+        bbox: str,
+        type_name: str = None,
+        page_size: int = MAX_FEATURES_LIMIT,
+        request_delay: float = 0.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        bbox 안의 피처를 maxFeatures/startIndex 페이지 단위로 모두 조회 (중복 제거).
+        마지막 페이지이거나, 서버가 startIndex 를 무시해 새 피처가 없으면 종료.
+        """
+        seen = set()
+        features: List[Dict[str, Any]] = []
+        start = 0
+        while True:
+            page = self.get_features(
+                bbox=bbox,
+                type_name=type_name,
+                max_features=page_size,
+                start_index=start,
+            )
+            new = 0
+            for feature in page:
+                key = feature_key(feature)
+                if key in seen:
+                    continue
+                seen.add(key)
+                features.append(feature)
+                new += 1
+
+            if len(page) < page_size or new == 0:
+                return features
+            start += page_size
+            if request_delay:
+                time.sleep(request_delay)
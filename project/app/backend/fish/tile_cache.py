@@ -0,0 +1,102 @@
+import math
+import threading
+import time
+from typing import List, Dict, Any
+
+from cache import LRUCache
+
+from .const import DEFAULT_TYPE_NAME, WFS_FIELD_GEOM
+from .service import FishService, feature_key
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  WFS bbox 조회용 타일 캐시 설정
+#  (EPSG:5186 고정 격자에 맞춰 조회 → 가까운 낚시터끼리 타일 결과 공유)
+# ─────────────────────────────────────────────────────────────────────────────
+TILE_SIZE_M     = 5000.0
+TILE_TTL_SEC    = 24 * 60 * 60     # 조사 자료는 드물게 갱신됨
+TILE_MAX_TILES  = 4096
+
+
+class TileFeatureCache:
+    """
+    • 조회 반경을 덮는 고정 타일들의 피처를 타일 단위로 WFS 조회 후 캐시 (TTL + LRU 상한)
+    • 타일 결과를 합친 뒤 실제 거리로 필터링해 반경 안의 피처만 반환
+    """
+
+    def __init__(
+        self,
+        fish_service: FishService,
+        type_name: str = DEFAULT_TYPE_NAME,
+        tile_size_m: float = TILE_SIZE_M,
+        ttl_sec: float = TILE_TTL_SEC,
+        max_tiles: int = TILE_MAX_TILES,
+    ):
+        self.fish_service = fish_service
+        self.type_name = type_name
+        self.tile_size = tile_size_m
+        self.ttl = ttl_sec
+        self.cache = LRUCache(max_entries=max_tiles)
+        # 같은 타일을 여러 요청이 동시에 조회하지 않도록 타일별 잠금
+        self._locks: dict[tuple, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _tile_lock(self, tile: tuple) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(tile, threading.Lock())
+
+    def _tile_features(self, tx: int, ty: int) -> List[Dict[str, Any]]:
+        tile = (tx, ty)
+        features = self.cache.get(tile)
+        if features is not None:
+            return features
+
+        # 조회 실패(예외) 시에도 타일 잠금은 정리
+        try:
+            with self._tile_lock(tile):
+                features = self.cache.peek(tile)
+                if features is not None:
+                    return features
+
+                s = self.tile_size
+                bbox = f"{tx * s},{ty * s},{(tx + 1) * s},{(ty + 1) * s}"
+                features = self.fish_service.get_all_features(bbox=bbox, type_name=self.type_name)
+                self.cache.set(tile, features, expires_at=time.time() + self.ttl, size=len(features))
+                return features
+        finally:
+            with self._locks_guard:
+                self._locks.pop(tile, None)
+
+    def query_radius(self, x: float, y: float, radius_m: float, limit: int | None = None) -> List[Dict[str, Any]]:
+        """
+        (x, y) 반경 radius_m 안의 피처를 가까운 순으로 반환
+        """
+        s = self.tile_size
+        tx0, tx1 = math.floor((x - radius_m) / s), math.floor((x + radius_m) / s)
+        ty0, ty1 = math.floor((y - radius_m) / s), math.floor((y + radius_m) / s)
+
+        seen = set()
+        matches = []
+        r2 = radius_m * radius_m
+        for tx in range(tx0, tx1 + 1):
+            for ty in range(ty0, ty1 + 1):
+                for feature in self._tile_features(tx, ty):
+                    coords = feature[WFS_FIELD_GEOM]["coordinates"]
+                    if not coords:
+                        continue
+                    d2 = (coords[0] - x) ** 2 + (coords[1] - y) ** 2
+                    if d2 > r2:
+                        continue
+                    # 타일 경계 위 지점은 양쪽 타일에 포함될 수 있음
+                    key = feature_key(feature)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    matches.append((d2, len(matches), feature))
+
+        matches.sort()
+        if limit is not None:
+            matches = matches[:limit]
+        return [feature for _, _, feature in matches]
+
+    def stats(self) -> dict:
+        return self.cache.stats()
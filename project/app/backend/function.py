@@ -1,31 +1,33 @@
 import math
+import numpy as np
 import requests
 from datetime import datetime, timedelta, timezone
 
+from transport import transport
+
 
 # ─────────────────────────────────────────────────────────────────────────────
-# 1) WGS84(lat, lon) → KMA 그리드(nx, ny) 변환
+# 1) WGS84(lat, lon) ↔ KMA 그리드(nx, ny) 변환 (Lambert Conformal Conic)
 #    (여기서 x는 위도, y는 경도)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def x_y_to_kma_grid(x: float, y: float) -> (int, int):
-    """
-    x(위도), y(경도) → KMA 그리드(nx, ny) 변환
-    """
-    latitude = x
-    longitude = y
+RE    = 6371.00877        # 지구 반경 (km)
+GRID  = 5.0               # 격자 간격 (km)
+SLAT1 = 30.0              # 표준위도 1 (deg)
+SLAT2 = 60.0              # 표준위도 2 (deg)
+OLON  = 126.0             # 기준 경도 (deg)
+OLAT  = 38.0              # 기준 위도 (deg)
+XO    = 43                # 기준 격자 X 좌표 (Nx)
+YO    = 136               # 기준 격자 Y 좌표 (Ny)
 
-    RE    = 6371.00877        # 지구 반경 (km)
-    GRID  = 5.0               # 격자 간격 (km)
-    SLAT1 = 30.0              # 표준위도 1 (deg)
-    SLAT2 = 60.0              # 표준위도 2 (deg)
-    OLON  = 126.0             # 기준 경도 (deg)
-    OLAT  = 38.0              # 기준 위도 (deg)
-    XO    = 43                # 기준 격자 X 좌표 (Nx)
-    YO    = 136               # 기준 격자 Y 좌표 (Ny)
+DEGRAD = math.pi / 180.0
+RADDEG = 180.0 / math.pi
 
-    DEGRAD = math.pi / 180.0
 
+def _lcc_constants() -> tuple[float, float, float, float, float]:
+    """
+    투영 상수 (re, olon, sn, sf, ro) — 모듈 로드 시 한 번만 계산
+    """
     re = RE / GRID
     slat1 = SLAT1 * DEGRAD
     slat2 = SLAT2 * DEGRAD
@@ -38,22 +40,101 @@ def x_y_to_kma_grid(x: float, y: float) -> (int, int):
     sf = (sf ** sn * math.cos(slat1)) / sn
     ro = math.tan(math.pi * 0.25 + olat * 0.5)
     ro = re * sf / (ro ** sn)
+    return re, olon, sn, sf, ro
+
+
+_RE, _OLON, _SN, _SF, _RO = _lcc_constants()
+_RE_SF = _RE * _SF
+
+
+def x_y_to_kma_grid(x: float, y: float) -> (int, int):
+    """
+    x(위도), y(경도) → KMA 그리드(nx, ny) 변환
+    """
+    latitude = x
+    longitude = y
 
     ra = math.tan(math.pi * 0.25 + latitude * DEGRAD * 0.5)
-    ra = re * sf / (ra ** sn)
-    theta = longitude * DEGRAD - olon
+    ra = _RE * _SF / (ra ** _SN)
+    theta = longitude * DEGRAD - _OLON
     if theta > math.pi:
         theta -= 2.0 * math.pi
     if theta < -math.pi:
         theta += 2.0 * math.pi
-    theta *= sn
+    theta *= _SN
 
     xg = (ra * math.sin(theta)) + XO + 0.5
-    yg = (ro - ra * math.cos(theta)) + YO + 0.5
+    yg = (_RO - ra * math.cos(theta)) + YO + 0.5
 
     return int(xg), int(yg)
 
 
+def x_y_to_kma_grid_batch(lats, lons) -> tuple[np.ndarray, np.ndarray]:
+    """
+    위도/경도 배열 → (nx 배열, ny 배열). x_y_to_kma_grid 와 같은 식을 벡터 연산으로 수행
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+
+    ra = np.tan(math.pi * 0.25 + lats * DEGRAD * 0.5)
+    ra = _RE * _SF / (ra ** _SN)
+    theta = lons * DEGRAD - _OLON
+    theta = np.where(theta > math.pi, theta - 2.0 * math.pi, theta)
+    theta = np.where(theta < -math.pi, theta + 2.0 * math.pi, theta)
+    theta = theta * _SN
+
+    xg = (ra * np.sin(theta)) + XO + 0.5
+    yg = (_RO - ra * np.cos(theta)) + YO + 0.5
+
+    # int() 와 같이 0 방향 절사
+    return np.trunc(xg).astype(np.int64), np.trunc(yg).astype(np.int64)
+
+
+def kma_grid_to_x_y(nx: float, ny: float) -> (float, float):
+    """
+    KMA 그리드(nx, ny) → x(위도), y(경도). 격자 중심점 좌표를 반환
+    """
+    xn = nx - XO
+    yn = _RO - ny + YO
+    ra = math.sqrt(xn * xn + yn * yn)
+    if _SN < 0.0:
+        ra = -ra
+
+    alat = (_RE_SF / ra) ** (1.0 / _SN)
+    alat = 2.0 * math.atan(alat) - math.pi * 0.5
+
+    if abs(xn) <= 0.0:
+        theta = 0.0
+    elif abs(yn) <= 0.0:
+        theta = math.pi * 0.5
+        if xn < 0.0:
+            theta = -theta
+    else:
+        theta = math.atan2(xn, yn)
+    alon = theta / _SN + _OLON
+
+    return alat * RADDEG, alon * RADDEG
+
+
+def kma_grid_to_x_y_batch(nx, ny) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (nx 배열, ny 배열) → (위도 배열, 경도 배열)
+    """
+    xn = np.asarray(nx, dtype=np.float64) - XO
+    yn = _RO - np.asarray(ny, dtype=np.float64) + YO
+    ra = np.sqrt(xn * xn + yn * yn)
+    if _SN < 0.0:
+        ra = -ra
+
+    alat = (_RE_SF / ra) ** (1.0 / _SN)
+    alat = 2.0 * np.arctan(alat) - math.pi * 0.5
+    # atan2(xn, yn) 는 xn=0 → 0, yn=0 → ±π/2 로 스칼라 분기와 동일
+    theta = np.arctan2(xn, yn)
+    alon = theta / _SN + _OLON
+
+    return alat * RADDEG, alon * RADDEG
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 2) 기준 시각 계산 함수 (KST)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -142,13 +223,13 @@ def fetch_weather_all(
 
     # 2-1-a) 초단기 실황
     url_ncst = "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getUltraSrtNcst"
-    r_ncst = requests.get(url_ncst, params=common_params, timeout=10)
+    r_ncst = transport.get(url_ncst, params=common_params)
     r_ncst.raise_for_status()
     result["ultra"] = { "ncst": r_ncst.json() }
 
     # 2-1-b) 초단기 예보
     url_fcst = "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getUltraSrtFcst"
-    r_fcst = requests.get(url_fcst, params=common_params, timeout=10)
+    r_fcst = transport.get(url_fcst, params=common_params)
     r_fcst.raise_for_status()
     result["ultra"]["fcst"] = r_fcst.json()
 
@@ -168,7 +249,7 @@ def fetch_weather_all(
         "dataType": "JSON",
     }
     url_short = "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getVilageFcst"
-    r_short = requests.get(url_short, params=params_short, timeout=10)
+    r_short = transport.get(url_short, params=params_short)
     r_short.raise_for_status()
     result["short"] = r_short.json()
 
@@ -188,19 +269,19 @@ def fetch_weather_all(
 
     # 2-3-a) 중기 육상 예보
     url_mid_land = "http://apis.data.go.kr/1360000/MidFcstInfoService/getMidLandFcst"
-    r_mid_land = requests.get(url_mid_land, params=params_mid, timeout=10)
+    r_mid_land = transport.get(url_mid_land, params=params_mid)
     r_mid_land.raise_for_status()
     result["mid"] = { "land": r_mid_land.json() }
 
     # 2-3-b) 중기 기온 예보
     url_mid_ta = "http://apis.data.go.kr/1360000/MidFcstInfoService/getMidTa"
-    r_mid_ta = requests.get(url_mid_ta, params=params_mid, timeout=10)
+    r_mid_ta = transport.get(url_mid_ta, params=params_mid)
     r_mid_ta.raise_for_status()
     result["mid"]["ta"] = r_mid_ta.json()
 
     # 2-3-c) 중기 해상 예보
     url_mid_sea = "http://apis.data.go.kr/1360000/MidFcstInfoService/getMidSeaFcst"
-    r_mid_sea = requests.get(url_mid_sea, params=params_mid, timeout=10)
+    r_mid_sea = transport.get(url_mid_sea, params=params_mid)
     r_mid_sea.raise_for_status()
     result["mid"]["sea"] = r_mid_sea.json()
 
@@ -208,7 +289,7 @@ def fetch_weather_all(
 
 import requests
 import xmltodict
-from pyproj import Transformer
+from fish.projection import project_point, bbox_from_projected
 from typing import List, Dict, Any
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -236,23 +317,11 @@ def bbox_from_x_y_radius(x: float, y: float, radius_km: float) -> str:
     • x: 위도(lat), y: 경도(lon)
     • radius_km: 반경(단위: km)
 
-    반환: EPSG:5186 좌표계의 "miny,minx,maxy,maxx" 문자열
+    반환: EPSG:5186 좌표계의 "minx,miny,maxx,maxy" 문자열
     """
-    # 1) WGS84(4326) → EPSG:5186
-    transformer = Transformer.from_crs("EPSG:4326", "EPSG:5186", always_xy=True)
-    x_5186, y_5186 = transformer.transform(y, x)  # transform(lon, lat)
-
-    # 2) 반경 km → 미터
-    r_m = radius_km * 1000.0
-
-    # 3) 바운딩박스 계산
-    minx = x_5186 - r_m
-    maxx = x_5186 + r_m
-    miny = y_5186 - r_m
-    maxy = y_5186 + r_m
-
-    # 4) "minx,miny,maxx,maxy" 순서
-    return f"{minx},{miny},{maxx},{maxy}"
+    # WGS84(4326) → EPSG:5186 (캐시된 Transformer 사용)
+    x_5186, y_5186 = project_point(x, y)
+    return bbox_from_projected(x_5186, y_5186, radius_km)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -291,7 +360,7 @@ def fetch_fish_by_radius(
     prepared = requests.Request("GET", url, params=params).prepare()
     print("▶ 호출 URL:", prepared.url)
 
-    resp = requests.get(url, params=params, timeout=10)
+    resp = transport.get(url, params=params)
     print("▶ HTTP 상태 코드:", resp.status_code)
     resp.raise_for_status()
 
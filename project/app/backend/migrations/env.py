@@ -0,0 +1,39 @@
+from alembic import context
+from sqlalchemy import create_engine
+from sqlalchemy.engine import URL
+
+from service_db.db_service import DB_CONFIG
+
+# 블루프린트와 같은 .env 접속 정보 사용 (모델 없이 op.* 로 직접 작성한 마이그레이션만 실행)
+DB_URL = URL.create(
+    "mysql+pymysql",
+    username=DB_CONFIG["user"],
+    password=DB_CONFIG["password"],
+    host=DB_CONFIG["host"],
+    port=DB_CONFIG["port"],
+    database=DB_CONFIG["database"],
+    query={"charset": "utf8mb4"},
+)
+
+
+def run_migrations_offline():
+    """
+    DB 접속 없이 SQL 출력 (alembic upgrade head --sql)
+    """
+    context.configure(url=DB_URL, literal_binds=True, dialect_opts={"paramstyle": "named"})
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    engine = create_engine(DB_URL)
+    with engine.connect() as connection:
+        context.configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
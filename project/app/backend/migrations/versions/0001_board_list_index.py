@@ -0,0 +1,23 @@
+"""게시판 목록 키셋 페이지네이션용 인덱스
+
+GET /api/boards 가 (reg_date DESC, board_id DESC) 순으로 커서 다음 행부터 읽으므로
+같은 순서의 복합 인덱스로 정렬 없이 LIMIT 건만 스캔
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_board_reg_date_board_id", "board", ["reg_date", "board_id"])
+
+
+def downgrade():
+    op.drop_index("ix_board_reg_date_board_id", table_name="board")
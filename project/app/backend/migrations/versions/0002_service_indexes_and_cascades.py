@@ -0,0 +1,110 @@
+"""블루프린트 조회/쓰기용 인덱스 + 외래 키 CASCADE
+
+• comment(board_id, comment_date)   : 게시글별 댓글 목록 (정렬 포함)
+• favorites(user_id, spot_id) UNIQUE: 즐겨찾기 중복 방지 → INSERT 한 번으로 등록 (중복은 409)
+• board_spot(board_id) UNIQUE      : 게시글당 낚시터 하나 → ON DUPLICATE KEY UPDATE 로 교체
+• users(email) UNIQUE               : 이메일 중복 방지 → 회원 생성 시 사전 SELECT 제거
+• board(reg_date) 는 0001 의 (reg_date, board_id) 인덱스가 대신함
+• comment/board_spot → board, favorites/board_spot → spot, favorites → users 에 ON DELETE CASCADE
+  (게시글 삭제는 DELETE 한 번으로 댓글/낚시터 연결까지 삭제)
+
+기존 외래 키가 있으면 CASCADE 버전으로 교체함 (이름은 실행 시점에 information_schema 에서 찾으므로 --sql 에서도 동작).
+favorites / users.email 에 중복이 남아 있으면 UNIQUE 인덱스 생성이, 이미 끊긴 참조(고아 행)가
+남아 있으면 외래 키 생성이 실패하므로 먼저 직접 정리해야 함 (자동으로 지우지 않음).
+downgrade 는 CASCADE 없는 일반 외래 키로 되돌림 (이름은 MySQL 이 붙임)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+# (테이블, 컬럼, 참조 테이블, 참조 컬럼)
+CASCADE_FKS = [
+    ("comment", "board_id", "board", "board_id"),
+    ("board_spot", "board_id", "board", "board_id"),
+    ("board_spot", "spot_id", "spot", "spot_id"),
+    ("favorites", "spot_id", "spot", "spot_id"),
+    ("favorites", "user_id", "users", "user_id"),
+]
+
+
+def _fk_name(table: str, column: str) -> str:
+    return f"fk_{table}_{column}"
+
+
+def _orphan_sql(table: str, column: str, ref_table: str, ref_column: str, select: str = "*") -> str:
+    return (
+        f"SELECT {select} FROM {table} WHERE {column} IS NOT NULL "
+        f"AND {column} NOT IN (SELECT {ref_column} FROM {ref_table})"
+    )
+
+
+def _check_orphans():
+    """
+    끊긴 참조가 남아 있으면 건수와 조회 쿼리를 알려주고 중단
+    (--sql 오프라인 모드는 셀 수 없음 → 남아 있으면 외래 키 생성 단계에서 실패)
+    """
+    if context.is_offline_mode():
+        return
+    bind = op.get_bind()
+    orphans = []
+    for table, column, ref_table, ref_column in CASCADE_FKS:
+        count = bind.execute(sa.text(_orphan_sql(table, column, ref_table, ref_column, "COUNT(*)"))).scalar()
+        if count:
+            query = _orphan_sql(table, column, ref_table, ref_column)
+            orphans.append(f"  {table}.{column} → {ref_table}: {count}건  ({query})")
+    if orphans:
+        raise RuntimeError("끊긴 참조(고아 행)를 먼저 정리한 뒤 다시 실행하세요:\n" + "\n".join(orphans))
+
+
+def _drop_fk_statements(table: str, column: str) -> list[str]:
+    """
+    table.column 의 기존 외래 키 삭제 SQL (MySQL 이 붙인 이름을 실행 시점에 찾아 PREPARE 로 실행, 없으면 아무것도 안 함)
+    """
+    return [
+        "SET @fks = (SELECT GROUP_CONCAT(CONCAT('DROP FOREIGN KEY `', constraint_name, '`')) "
+        "FROM information_schema.key_column_usage "
+        f"WHERE table_schema = DATABASE() AND table_name = '{table}' AND column_name = '{column}' "
+        "AND referenced_table_name IS NOT NULL)",
+        f"SET @drop_fks = IF(@fks IS NULL, 'DO 0', CONCAT('ALTER TABLE `{table}` ', @fks))",
+        "PREPARE drop_fks FROM @drop_fks",
+        "EXECUTE drop_fks",
+        "DEALLOCATE PREPARE drop_fks",
+    ]
+
+
+def upgrade():
+    # MySQL DDL 은 트랜잭션으로 되돌릴 수 없으므로 스키마를 바꾸기 전에 검사
+    _check_orphans()
+    op.create_index("ix_comment_board_id_comment_date", "comment", ["board_id", "comment_date"])
+    op.create_index("uq_favorites_user_id_spot_id", "favorites", ["user_id", "spot_id"], unique=True)
+    op.create_index("uq_board_spot_board_id", "board_spot", ["board_id"], unique=True)
+    op.create_index("uq_users_email", "users", ["email"], unique=True)
+
+    for table, column, ref_table, ref_column in CASCADE_FKS:
+        for statement in _drop_fk_statements(table, column):
+            op.execute(statement)
+        op.create_foreign_key(
+            _fk_name(table, column), table, ref_table, [column], [ref_column], ondelete="CASCADE"
+        )
+
+
+def downgrade():
+    for table, column, ref_table, ref_column in reversed(CASCADE_FKS):
+        op.drop_constraint(_fk_name(table, column), table, type_="foreignkey")
+
+    op.drop_index("uq_users_email", table_name="users")
+    op.drop_index("uq_board_spot_board_id", table_name="board_spot")
+    op.drop_index("uq_favorites_user_id_spot_id", table_name="favorites")
+    op.drop_index("ix_comment_board_id_comment_date", table_name="comment")
+
+    # 인덱스를 지운 뒤 생성 (먼저 만들면 외래 키가 위 인덱스를 써서 삭제가 막힘)
+    for table, column, ref_table, ref_column in CASCADE_FKS:
+        op.create_foreign_key(None, table, ref_table, [column], [ref_column])
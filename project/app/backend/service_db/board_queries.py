@@ -0,0 +1,25 @@
+# ─────────────────────────────────────────────────────────────────────────────
+#  게시글 상세 화면 조회 (게시글 + 연결 낚시터 + 댓글 수를 한 번에)
+#  댓글 목록은 pagination.comment_page_query 로 한 페이지만 추가 조회 → 상세 화면 = 쿼리 2회
+# ─────────────────────────────────────────────────────────────────────────────
+BOARD_FIELDS = ("board_id", "user_id", "title", "content", "reg_date")
+SPOT_FIELDS = ("spot_id", "name", "address", "tel", "operation_hours", "thum_url", "menu_info", "type")
+
+BOARD_DETAIL_SQL = f"""
+    SELECT {", ".join(f"b.{field}" for field in BOARD_FIELDS)},
+           (SELECT COUNT(*) FROM comment c WHERE c.board_id = b.board_id) AS comment_count,
+           {", ".join(f"s.{field}" for field in SPOT_FIELDS)}
+    FROM board b
+    LEFT JOIN board_spot bs ON bs.board_id = b.board_id
+    LEFT JOIN spot s ON s.spot_id = bs.spot_id
+    WHERE b.board_id = %s
+"""
+
+
+def split_detail(row: dict) -> tuple[dict, dict | None, int]:
+    """
+    상세 조회 한 행 → (게시글, 낚시터 또는 None, 댓글 수)
+    """
+    board = {field: row[field] for field in BOARD_FIELDS}
+    spot = {field: row[field] for field in SPOT_FIELDS} if row["spot_id"] is not None else None
+    return board, spot, int(row["comment_count"])
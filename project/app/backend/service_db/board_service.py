@@ -1,32 +1,46 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
+import math
 import pymysql
+from pymysql.constants import ER
 from dotenv import load_dotenv
-from .db_service import get_connection
+from .db_service import db_connection, row_exists
+from .read_cache import BOARD_LIST, board_cache, board_scope
+from .board_queries import BOARD_DETAIL_SQL, split_detail
+from .pagination import (
+    COMMENT_PAGE_SIZE,
+    COMMENT_PAGE_SIZE_MAX,
+    InvalidPage,
+    board_page,
+    board_page_query,
+    comment_page,
+    comment_page_query,
+    decode_cursor,
+    page_size,
+)
 
 load_dotenv()
 
 board_api = Blueprint('board_api', __name__)
 
-# 게시판 조회
+# 게시판 조회 (키셋 페이지네이션: ?limit=20&cursor=<next_cursor>, 글마다 댓글 수 포함)
 @board_api.route("/boards", methods=["GET"])
 def search_all_boards():
-    conn = get_connection()
-    cursor = conn.cursor(pymysql.cursors.DictCursor)
+    try:
+        size = page_size(request.args.get("limit"))
+        sql, params = board_page_query(request.args.get("cursor"), size)
+    except InvalidPage as e:
+        return jsonify({"result": "실패", "error": str(e)}), 400
+
+    def load():
+        with db_connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(sql, params)
+            return board_page(cursor.fetchall(), size)
 
     try:
-        sql = """
-            SELECT board_id, user_id, title, content, reg_date
-            FROM board
-            ORDER BY reg_date DESC
-        """
-        cursor.execute(sql)
-        boards = cursor.fetchall()
-        return jsonify({"result": "성공", "boards": boards}), 200
+        boards, next_cursor = board_cache.get_or_load(BOARD_LIST, (request.args.get("cursor"), size), load)
+        return jsonify({"result": "성공", "boards": boards, "next_cursor": next_cursor}), 200
     except Exception as e:
         return jsonify({"result": "실패", "error": str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
 
 # 게시판 등록
 @board_api.route("/boards", methods=["POST"])
@@ -40,31 +54,31 @@ def create_board():
     if not all([user_id, title, content]):
         return jsonify({"result": "실패", "error": "필수 필드 필요"}), 400
 
-    conn = get_connection()
-    cursor = conn.cursor(pymysql.cursors.DictCursor)
     try:
-        cursor.execute("""
-            INSERT INTO board (user_id, title, content, reg_date)
-            VALUES (%s, %s, %s, NOW())
-        """, (user_id, title, content))
-        board_id = cursor.lastrowid
-
-        if spot_id:
+        with db_connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
             cursor.execute("""
-                INSERT INTO board_spot (board_id, spot_id)
-                VALUES (%s, %s)
-            """, (board_id, spot_id))
+                INSERT INTO board (user_id, title, content, reg_date)
+                VALUES (%s, %s, %s, NOW())
+            """, (user_id, title, content))
+            board_id = cursor.lastrowid
+
+            if spot_id:
+                cursor.execute("""
+                    INSERT INTO board_spot (board_id, spot_id)
+                    VALUES (%s, %s)
+                """, (board_id, spot_id))
 
-        conn.commit()
+            conn.commit()
+        board_cache.invalidate_board(board_id)
         return jsonify({"result": "성공", "board_id": board_id}), 201
 
+    except pymysql.err.IntegrityError as e:
+        if e.args[0] == ER.NO_REFERENCED_ROW_2:
+            return jsonify({"result": "실패", "error": "존재하지 않는 낚시터"}), 404
+        return jsonify({"result": "실패", "error": str(e)}), 500
     except Exception as e:
-        conn.rollback()
         return jsonify({"result": "실패", "error": str(e)}), 500
 
-    finally:
-        cursor.close()
-        conn.close()
 
 # 게시판 수정
 @board_api.route("boards/<int:board_id>", methods=["PUT"])
@@ -78,32 +92,34 @@ def update_board(board_id):
     if not all([user_id, title, content]):
         return jsonify({"result": "실패", "error": "필수 항목 누락"}), 400
 
-    conn = get_connection()
-    cursor = conn.cursor()
     try:
-        # 작성자 확인
-        cursor.execute("SELECT user_id FROM board WHERE board_id = %s", (board_id,))
-        result = cursor.fetchone()
-        if not result:
-            return jsonify({"result": "실패", "error": "게시글 없음"}), 404
-        if result["user_id"] != user_id:
-            return jsonify({"result": "실패", "error": "권한 없음"}), 403
-
-        # 게시글 수정
-        cursor.execute("UPDATE board SET title = %s, content = %s WHERE board_id = %s", (title, content, board_id))
+        with db_connection() as conn, conn.cursor() as cursor:
+            # 작성자 조건을 붙인 UPDATE 한 번으로 권한 확인 + 수정
+            cursor.execute(
+                "UPDATE board SET title = %s, content = %s WHERE board_id = %s AND user_id = %s",
+                (title, content, board_id, user_id),
+            )
+            if cursor.rowcount == 0:
+                if not row_exists(cursor, "board", "board_id", board_id):
+                    return jsonify({"result": "실패", "error": "게시글 없음"}), 404
+                return jsonify({"result": "실패", "error": "권한 없음"}), 403
 
-        if spot_id:
-            cursor.execute("DELETE FROM board_spot WHERE board_id = %s", (board_id,))
-            cursor.execute("INSERT INTO board_spot (board_id, spot_id) VALUES (%s, %s)", (board_id, spot_id))
+            # 게시글당 낚시터 하나 (UNIQUE board_id) → 있으면 교체
+            if spot_id:
+                cursor.execute("""
+                    INSERT INTO board_spot (board_id, spot_id) VALUES (%s, %s)
+                    ON DUPLICATE KEY UPDATE spot_id = VALUES(spot_id)
+                """, (board_id, spot_id))
 
-        conn.commit()
+            conn.commit()
+        board_cache.invalidate_board(board_id)
         return jsonify({"result": "성공"}), 200
+    except pymysql.err.IntegrityError as e:
+        if e.args[0] == ER.NO_REFERENCED_ROW_2:
+            return jsonify({"result": "실패", "error": "존재하지 않는 낚시터"}), 404
+        return jsonify({"result": "실패", "error": str(e)}), 500
     except Exception as e:
-        conn.rollback()
         return jsonify({"result": "실패", "error": str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
 
 # 게시판 삭제
 @board_api.route("boards/<int:board_id>", methods=["DELETE"])
@@ -114,84 +130,136 @@ def delete_board(board_id):
     if not user_id:
         return jsonify({"result": "실패", "error": "user_id 필요"}), 400
 
-    conn = get_connection()
-    cursor = conn.cursor(pymysql.cursors.DictCursor)
     try:
-        # 작성자 확인
-        cursor.execute("SELECT user_id FROM board WHERE board_id = %s", (board_id,))
-        result = cursor.fetchone()
-        if not result:
-            return jsonify({"result": "실패", "error": "게시글 없음"}), 404
-        if result["user_id"] != user_id:
-            return jsonify({"result": "실패", "error": "권한 없음"}), 403
-
-        # 댓글 먼저 삭제
-        cursor.execute("DELETE FROM comment WHERE board_id = %s", (board_id,))
-
-        # board_spot 관계 삭제
-        cursor.execute("DELETE FROM board_spot WHERE board_id = %s", (board_id,))
-
-        # 게시글 삭제
-        cursor.execute("DELETE FROM board WHERE board_id = %s", (board_id,))
-        conn.commit()
+        with db_connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            # 댓글 / board_spot 은 외래 키 ON DELETE CASCADE 로 함께 삭제
+            cursor.execute("DELETE FROM board WHERE board_id = %s AND user_id = %s", (board_id, user_id))
+            if cursor.rowcount == 0:
+                if not row_exists(cursor, "board", "board_id", board_id):
+                    return jsonify({"result": "실패", "error": "게시글 없음"}), 404
+                return jsonify({"result": "실패", "error": "권한 없음"}), 403
+            conn.commit()
+        board_cache.invalidate_board(board_id)
         return jsonify({"result": "성공"}), 200
     except Exception as e:
-        conn.rollback()
         import traceback
         traceback.print_exc()
         return jsonify({"result": "실패", "error": str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
+
+# 낚시터 데이터셋 버전 → CSV 의 spot_id 가 spot 테이블과 일치하는지 (버전마다 한 번 확인)
+_spot_ids_match = {}
+
+def _json_value(value):
+    # CSV 빈 칸(NaN)은 null 로
+    return None if isinstance(value, float) and math.isnan(value) else value
+
+def _csv_spot_id(record: dict) -> int | None:
+    spot_id = _json_value(record.get("spot_id"))
+    return int(spot_id) if spot_id is not None else None
+
+def _check_spot_ids(records: list[dict]) -> bool:
+    """
+    모든 CSV 낚시터에 spot_id 가 있고, spot 테이블의 같은 spot_id 가 같은 이름인지
+    (board_spot / favorites 외래 키가 spot 테이블을 가리키므로 다르면 메모리 검색 결과를 쓸 수 없음)
+    """
+    if not records or any(_csv_spot_id(record) is None for record in records):
+        print("[Search] 낚시터 CSV에 spot_id 가 없는 행이 있어 SQL 검색 사용")
+        return False
+    with db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT spot_id, name FROM spot")
+        db_names = {row["spot_id"]: row["name"] for row in cursor.fetchall()}
+    mismatched = sum(1 for record in records if db_names.get(_csv_spot_id(record)) != record.get("name"))
+    if mismatched:
+        print(f"[Search] 낚시터 CSV의 spot_id {mismatched}곳이 spot 테이블과 달라 SQL 검색 사용")
+    return mismatched == 0
+
+def _search_index_usable(spot_service) -> bool:
+    index = spot_service.index
+    usable = _spot_ids_match.get(index.version)
+    if usable is None:
+        try:
+            usable = _check_spot_ids(index.records)
+        except Exception as e:
+            # 확인하지 못하면 캐시하지 않고 이번 요청만 SQL 경로로
+            print(f"[Search] spot 테이블 대조 실패: {e}")
+            return False
+        _spot_ids_match.clear()
+        _spot_ids_match[index.version] = usable
+    return usable
 
 # 가게 정보 조회
+# 앱에 낚시터 서비스가 등록돼 있고 CSV 의 spot_id 가 spot 테이블과 일치하면
+# 메모리 검색 인덱스(부분 문자열/초성, 순위순), 아니면 SQL LIKE
 @board_api.route("/spots/search", methods=["GET"])
 def search_spots():
     keyword = request.args.get("q", "")
-    conn = get_connection()
-    cursor = conn.cursor(pymysql.cursors.DictCursor)
-    try:
-        cursor.execute("""
-            SELECT spot_id, name, address
-            FROM spot
-            WHERE name LIKE %s
-            LIMIT 20
-        """, (f"%{keyword}%",))
-        spots = cursor.fetchall()
+    spot_service = current_app.extensions.get("spot_service")
+    if spot_service is not None and _search_index_usable(spot_service):
+        spots = [
+            {
+                "spot_id": _csv_spot_id(record),
+                "name": record.get("name"),
+                "address": _json_value(record.get("address")),
+            }
+            for record in spot_service.search_spots(keyword)
+        ]
         return jsonify({"result": "성공", "spots": spots}), 200
+
+    try:
+        with db_connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute("""
+                SELECT spot_id, name, address
+                FROM spot
+                WHERE name LIKE %s
+                LIMIT 20
+            """, (f"%{keyword}%",))
+            spots = cursor.fetchall()
+            return jsonify({"result": "성공", "spots": spots}), 200
     except Exception as e:
         return jsonify({"result": "실패", "error": str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
 
+def _load_board_detail(board_id: int, comment_cursor: str | None, comment_limit: int) -> dict | None:
+    """
+    게시글 + 낚시터 + 댓글 수 (쿼리 1) / 댓글 한 페이지 (쿼리 2)
+    """
+    with db_connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
+        cursor.execute(BOARD_DETAIL_SQL, (board_id,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        board, spot, comment_count = split_detail(row)
+
+        sql, params = comment_page_query(board_id, comment_cursor, comment_limit)
+        cursor.execute(sql, params)
+        comments, next_comment_cursor = comment_page(cursor.fetchall(), comment_limit)
+    board_cache.remember_comments(board_id, comments)
+    return {
+        "board": board,
+        "spot": spot,
+        "comments": comments,
+        "comment_count": comment_count,
+        "next_comment_cursor": next_comment_cursor,
+    }
+
+# 게시글 상세 (?comment_limit=50&comment_cursor=<next_comment_cursor>)
 @board_api.route("/boards/<int:board_id>", methods=["GET"])
 def get_board_detail(board_id):
-    conn = get_connection()
-    cursor = conn.cursor(pymysql.cursors.DictCursor)
+    comment_cursor = request.args.get("comment_cursor")
     try:
-        # 게시글 정보
-        cursor.execute("""
-            SELECT board_id, user_id, title, content, reg_date
-            FROM board WHERE board_id = %s
-        """, (board_id,))
-        board = cursor.fetchone()
-        if not board:
-            return jsonify({"result": "실패", "error": "게시글 없음"}), 404
-
-        # 낚시터 정보
-        cursor.execute("""
-            SELECT s.spot_id, s.name, s.address, s.tel, s.operation_hours, s.thum_url, s.menu_info, s.type
-            FROM spot s
-            JOIN board_spot bs ON s.spot_id = bs.spot_id
-            WHERE bs.board_id = %s
-        """, (board_id,))
-        spot = cursor.fetchone()
+        comment_limit = page_size(request.args.get("comment_limit"), COMMENT_PAGE_SIZE, COMMENT_PAGE_SIZE_MAX)
+        if comment_cursor:
+            decode_cursor(comment_cursor)
+    except InvalidPage as e:
+        return jsonify({"result": "실패", "error": str(e)}), 400
 
-        return jsonify({"result": "성공", "board": board, "spot": spot}), 200
+    try:
+        detail = board_cache.get_or_load(
+            board_scope(board_id),
+            ("detail", comment_cursor, comment_limit),
+            lambda: _load_board_detail(board_id, comment_cursor, comment_limit),
+        )
+        if detail is None:
+            return jsonify({"result": "실패", "error": "게시글 없음"}), 404
+        return jsonify({"result": "성공", **detail}), 200
     except Exception as e:
         return jsonify({"result": "실패", "error": str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
-
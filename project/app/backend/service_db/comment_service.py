@@ -1,7 +1,9 @@
 from flask import Blueprint, request, jsonify
 import pymysql
+from pymysql.constants import ER
 from dotenv import load_dotenv
-from .db_service import get_connection
+from .db_service import db_connection, row_exists
+from .read_cache import board_cache, board_scope
 
 load_dotenv()
 
@@ -18,27 +20,23 @@ def post_comments():
     if not all([board_id, user_id, comment_content]):
         return jsonify({"result": "실패", "error": "모든 필드가 필요합니다."}), 400
 
-    conn = get_connection()
-    cursor = conn.cursor()
     try:
-        # 게시글 존재 여부 확인
-        cursor.execute("SELECT 1 FROM board WHERE board_id = %s", (board_id,))
-        if not cursor.fetchone():
-            return jsonify({"result": "실패", "error": "존재하지 않는 게시글입니다."}), 404
-
-        # 댓글 등록
-        sql = """
-            INSERT INTO comment (board_id, user_id, comment_content, comment_date)
-            VALUES (%s, %s, %s, NOW())
-        """
-        cursor.execute(sql, (board_id, user_id, comment_content))
-        conn.commit()
+        with db_connection() as conn, conn.cursor() as cursor:
+            # 댓글 등록 (게시글 존재 여부는 외래 키로 확인)
+            sql = """
+                INSERT INTO comment (board_id, user_id, comment_content, comment_date)
+                VALUES (%s, %s, %s, NOW())
+            """
+            cursor.execute(sql, (board_id, user_id, comment_content))
+            conn.commit()
+        board_cache.invalidate_board(board_id)
         return jsonify({"result": "성공"}), 201
+    except pymysql.err.IntegrityError as e:
+        if e.args[0] == ER.NO_REFERENCED_ROW_2:
+            return jsonify({"result": "실패", "error": "존재하지 않는 게시글입니다."}), 404
+        return jsonify({"result": "실패", "error": str(e)}), 500
     except Exception as e:
         return jsonify({"result": "실패", "error": str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
 
 # 댓글 조회
 @comment_api.route("/comments", methods=["GET"])
@@ -47,24 +45,27 @@ def get_comments_by_board():
 
     if not board_id:
         return jsonify({"result": "실패", "error": "board_id는 필수입니다."}), 400
+    if not board_id.isdigit():
+        return jsonify({"result": "실패", "error": "board_id는 정수여야 합니다."}), 400
+
+    def load():
+        with db_connection() as conn, conn.cursor() as cursor:
+            sql = """
+                SELECT comment_id, board_id, user_id, comment_content, comment_date
+                FROM comment
+                WHERE board_id = %s
+                ORDER BY comment_date ASC
+            """
+            cursor.execute(sql, (board_id,))
+            comments = cursor.fetchall()
+        board_cache.remember_comments(board_id, comments)
+        return comments
 
-    conn = get_connection()
-    cursor = conn.cursor()
     try:
-        sql = """
-            SELECT comment_id, board_id, user_id, comment_content, comment_date
-            FROM comment
-            WHERE board_id = %s
-            ORDER BY comment_date ASC
-        """
-        cursor.execute(sql, (board_id,))
-        comments = cursor.fetchall()
+        comments = board_cache.get_or_load(board_scope(board_id), "comments", load)
         return jsonify({"result": "성공", "comments": comments}), 200
     except Exception as e:
         return jsonify({"result": "실패", "error": str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
 
 # 댓글 수정
 @comment_api.route("/comments/<int:comment_id>", methods=["PUT"])
@@ -76,26 +77,20 @@ def update_comment(comment_id):
     if not all([user_id, new_content]):
         return jsonify({"result": "실패", "error": "user_id와 comment_content가 필요합니다."}), 400
 
-    conn = get_connection()
-    cursor = conn.cursor()
     try:
-        # 작성자 확인
-        cursor.execute("SELECT user_id FROM comment WHERE comment_id = %s", (comment_id,))
-        row = cursor.fetchone()
-        if not row:
-            return jsonify({"result": "실패", "error": "댓글이 존재하지 않습니다."}), 404
-        if row["user_id"] != user_id:
-            return jsonify({"result": "실패", "error": "수정 권한이 없습니다."}), 403
-
-        sql = "UPDATE comment SET comment_content = %s WHERE comment_id = %s"
-        cursor.execute(sql, (new_content, comment_id))
-        conn.commit()
+        with db_connection() as conn, conn.cursor() as cursor:
+            # 작성자 조건을 붙인 UPDATE 한 번으로 권한 확인 + 수정
+            sql = "UPDATE comment SET comment_content = %s WHERE comment_id = %s AND user_id = %s"
+            cursor.execute(sql, (new_content, comment_id, user_id))
+            if cursor.rowcount == 0:
+                if not row_exists(cursor, "comment", "comment_id", comment_id):
+                    return jsonify({"result": "실패", "error": "댓글이 존재하지 않습니다."}), 404
+                return jsonify({"result": "실패", "error": "수정 권한이 없습니다."}), 403
+            conn.commit()
+        board_cache.invalidate_comment(comment_id)
         return jsonify({"result": "성공"}), 200
     except Exception as e:
         return jsonify({"result": "실패", "error": str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
 
 # 댓글 삭제
 @comment_api.route("/comments/<int:comment_id>", methods=["DELETE"])
@@ -106,23 +101,17 @@ def delete_comment(comment_id):
     if not user_id:
         return jsonify({"result": "실패", "error": "user_id가 필요합니다."}), 400
 
-    conn = get_connection()
-    cursor = conn.cursor()
     try:
-        # 작성자 확인
-        cursor.execute("SELECT user_id FROM comment WHERE comment_id = %s", (comment_id,))
-        row = cursor.fetchone()
-        if not row:
-            return jsonify({"result": "실패", "error": "댓글이 존재하지 않습니다."}), 404
-        if row["user_id"] != user_id:
-            return jsonify({"result": "실패", "error": "삭제 권한이 없습니다."}), 403
-
-        sql = "DELETE FROM comment WHERE comment_id = %s"
-        cursor.execute(sql, (comment_id,))
-        conn.commit()
+        with db_connection() as conn, conn.cursor() as cursor:
+            # 작성자 조건을 붙인 DELETE 한 번으로 권한 확인 + 삭제
+            sql = "DELETE FROM comment WHERE comment_id = %s AND user_id = %s"
+            cursor.execute(sql, (comment_id, user_id))
+            if cursor.rowcount == 0:
+                if not row_exists(cursor, "comment", "comment_id", comment_id):
+                    return jsonify({"result": "실패", "error": "댓글이 존재하지 않습니다."}), 404
+                return jsonify({"result": "실패", "error": "삭제 권한이 없습니다."}), 403
+            conn.commit()
+        board_cache.invalidate_comment(comment_id, listing=True)
         return jsonify({"result": "성공"}), 200
     except Exception as e:
         return jsonify({"result": "실패", "error": str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
@@ -1,6 +1,11 @@
 import pymysql
 import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
 from dotenv import load_dotenv
+from pymysql.constants import CLIENT
 
 load_dotenv()
 
@@ -10,8 +15,281 @@ DB_CONFIG = {
     'password': os.getenv('DB_PASSWORD'),
     'database': os.getenv('DB_NAME'),
     'port': int(os.getenv('DB_PORT')),
-    'cursorclass': pymysql.cursors.DictCursor
+    'cursorclass': pymysql.cursors.DictCursor,
+    # UPDATE 영향 행 수 = 조건에 맞은 행 수 (값이 같아 바뀌지 않은 행 포함). 단일 UPDATE 로 권한 확인할 때 사용
+    'client_flag': CLIENT.FOUND_ROWS,
 }
 
+# ─────────────────────────────────────────────────────────────────────────────
+#  MySQL 연결 풀
+#  요청마다 TCP 연결 + 인증을 새로 하지 않고 열린 연결을 재사용
+#  • 최소 DB_POOL_MIN 개는 앱 시작 시 warmup() 으로 미리 열고 유휴 상태로 유지, 최대 DB_POOL_MAX 개까지 생성
+#  • 모두 사용 중이면 DB_POOL_TIMEOUT 초까지 반납을 기다린 뒤 PoolTimeout
+#  • 대여 시 DB_POOL_PING_AFTER_SEC 초 넘게 쉰 연결은 ping 으로 확인 (끊겼으면 새로 연결)
+#  • 생성 후 DB_POOL_RECYCLE_SEC 초 지난 연결, DB_POOL_IDLE_SEC 초 넘게 쉰 연결(최소 개수 초과분)은 닫음
+#  • 반납 시 rollback 으로 열린 트랜잭션 정리 (다음 요청이 이전 스냅샷을 읽지 않도록)
+# ─────────────────────────────────────────────────────────────────────────────
+DB_POOL_MIN            = int(os.getenv("DB_POOL_MIN", "2"))
+DB_POOL_MAX            = int(os.getenv("DB_POOL_MAX", "10"))
+DB_POOL_TIMEOUT        = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_PING_AFTER_SEC = float(os.getenv("DB_POOL_PING_AFTER_SEC", "30"))
+DB_POOL_RECYCLE_SEC    = float(os.getenv("DB_POOL_RECYCLE_SEC", "1800"))   # MySQL wait_timeout 보다 짧게
+DB_POOL_IDLE_SEC       = float(os.getenv("DB_POOL_IDLE_SEC", "300"))
+
+
+class PoolTimeout(Exception):
+    """
+    DB_POOL_TIMEOUT 안에 반납된 연결이 없을 때
+    """
+
+
+class ConnectionPool:
+    """
+    스레드 안전 연결 풀. connect: 새 연결을 여는 함수
+    """
+
+    def __init__(
+        self,
+        connect,
+        min_size: int = DB_POOL_MIN,
+        max_size: int = DB_POOL_MAX,
+        timeout: float = DB_POOL_TIMEOUT,
+        ping_after_sec: float = DB_POOL_PING_AFTER_SEC,
+        recycle_sec: float = DB_POOL_RECYCLE_SEC,
+        idle_sec: float = DB_POOL_IDLE_SEC,
+    ):
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max(max_size, 1)
+        self.timeout = timeout
+        self.ping_after_sec = ping_after_sec
+        self.recycle_sec = recycle_sec
+        self.idle_sec = idle_sec
+        self._cond = threading.Condition()
+        self._idle = deque()        # (연결, 생성 시각, 마지막 반납 시각). 오른쪽이 최근 반납
+        self._created_at = {}       # id(사용 중 연결) → 생성 시각
+        self._size = 0              # 열린 연결 수 (유휴 + 사용 중)
+        self._waiters = 0           # 반납을 기다리는 요청 수
+        self._stats = {
+            "checkouts": 0,
+            "created": 0,
+            "closed": 0,
+            "recycled": 0,
+            "ping_failures": 0,
+            "broken": 0,
+            "exhausted": 0,         # 모든 연결이 사용 중이라 기다려야 했던 대여 수
+            "timeouts": 0,
+            "wait_ms_total": 0.0,
+            "wait_ms_max": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # 대여 / 반납
+    # ------------------------------------------------------------------
+    def acquire(self):
+        started = time.monotonic()
+        deadline = started + self.timeout
+        waited = False
+        while True:
+            stale = []
+            entry = None
+            timed_out = False
+            with self._cond:
+                while True:
+                    stale.extend(self._prune_locked(time.monotonic()))
+                    # 기다리는 요청이 있으면 새 요청은 뒤에 줄을 섬 (반납 직후 가로채기로 대기가 길어지지 않도록)
+                    if waited or not self._waiters:
+                        if self._idle:
+                            entry = self._idle.pop()
+                            break
+                        if self._size < self.max_size:
+                            self._size += 1
+                            break
+                    if not waited:
+                        waited = True
+                        self._stats["exhausted"] += 1
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        self._cond.notify()
+                        timed_out = True
+                        break
+                    self._waiters += 1
+                    self._cond.wait(remaining)
+                    self._waiters -= 1
+            self._close_all(stale)
+            if timed_out:
+                raise PoolTimeout(f"DB 연결 풀 고갈 ({self.max_size}개 사용 중, {self.timeout}초 대기)")
+
+            conn = self._checkout(entry)
+            if conn is not None:
+                break
+
+        wait_ms = (time.monotonic() - started) * 1000
+        with self._cond:
+            self._stats["checkouts"] += 1
+            self._stats["wait_ms_total"] += wait_ms
+            self._stats["wait_ms_max"] = max(self._stats["wait_ms_max"], wait_ms)
+        return conn
+
+    def _checkout(self, entry):
+        """
+        유휴 연결이면 필요 시 ping 확인, 없으면 새로 연결 (자리는 이미 확보된 상태).
+        ping 실패면 None (자리를 반납했으니 호출한 쪽이 다시 시도)
+        """
+        if entry is None:
+            try:
+                conn = self.connect()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._stats["created"] += 1
+                self._created_at[id(conn)] = time.monotonic()
+            return conn
+
+        conn, created, released = entry
+        if time.monotonic() - released >= self.ping_after_sec:
+            try:
+                conn.ping(reconnect=False)
+            except Exception:
+                with self._cond:
+                    self._stats["ping_failures"] += 1
+                    self._size -= 1
+                    self._cond.notify()
+                self._close_all([conn])
+                return None
+        with self._cond:
+            self._created_at[id(conn)] = created
+        return conn
+
+    def release(self, conn, broken: bool = False):
+        """
+        broken: 연결 오류가 난 연결 (풀에 돌려놓지 않고 닫음)
+        """
+        if not broken:
+            try:
+                conn.rollback()
+            except Exception:
+                broken = True
+        now = time.monotonic()
+        with self._cond:
+            created = self._created_at.pop(id(conn), now)
+            if broken or now - created >= self.recycle_sec:
+                self._size -= 1
+                self._stats["broken" if broken else "recycled"] += 1
+                drop = True
+            else:
+                self._idle.append((conn, created, now))
+                drop = False
+            self._cond.notify()
+        if drop:
+            self._close_all([conn])
+
+    def _prune_locked(self, now: float) -> list:
+        """
+        오래된 유휴 연결을 풀에서 빼서 반환 (닫기는 잠금 밖에서)
+        """
+        stale = []
+        keep = deque()
+        while self._idle:
+            conn, created, released = self._idle.popleft()
+            expired = now - created >= self.recycle_sec
+            idle_too_long = now - released >= self.idle_sec and self._size - len(stale) > self.min_size
+            if expired or idle_too_long:
+                stale.append(conn)
+                self._stats["recycled"] += 1
+            else:
+                keep.append((conn, created, released))
+        self._idle = keep
+        self._size -= len(stale)
+        if stale:
+            self._cond.notify(len(stale))
+        return stale
+
+    def _close_all(self, conns: list):
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+            with self._cond:
+                self._stats["closed"] += 1
+
+    # ------------------------------------------------------------------
+    # 관리
+    # ------------------------------------------------------------------
+    def warmup(self):
+        """
+        최소 개수만큼 미리 연결 (실패해도 첫 요청 때 다시 시도)
+        """
+        conns = []
+        try:
+            while True:
+                with self._cond:
+                    if self._size >= self.min_size:
+                        break
+                conns.append(self.acquire())
+        except Exception as e:
+            print(f"[DB] 연결 풀 예열 실패: {e}")
+        for conn in conns:
+            self.release(conn)
+
+    def close(self):
+        with self._cond:
+            conns = [conn for conn, _, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(conns)
+            self._cond.notify_all()
+        self._close_all(conns)
+
+    def stats(self) -> dict:
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update({
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+            })
+        checkouts = stats["checkouts"]
+        stats["wait_ms_avg"] = round(stats["wait_ms_total"] / checkouts, 3) if checkouts else 0.0
+        stats["wait_ms_total"] = round(stats["wait_ms_total"], 3)
+        stats["wait_ms_max"] = round(stats["wait_ms_max"], 3)
+        stats["reuse_ratio"] = round(1 - stats["created"] / checkouts, 4) if checkouts else 0.0
+        return stats
+
+
+def row_exists(cursor, table: str, column: str, value) -> bool:
+    """
+    조건부 UPDATE/DELETE 가 0건일 때 '없음(404)' 과 '권한 없음(403)' 구분용
+    """
+    cursor.execute(f"SELECT 1 FROM {table} WHERE {column} = %s", (value,))
+    return cursor.fetchone() is not None
+
+
 def get_connection():
+    """
+    풀을 거치지 않는 새 연결 (일회성 스크립트/벤치마크용). 요청 처리에는 db_connection() 사용
+    """
     return pymysql.connect(**DB_CONFIG)
+
+
+pool = ConnectionPool(get_connection)
+
+
+@contextmanager
+def db_connection():
+    """
+    풀에서 연결을 빌려 with 블록 동안 사용하고 반납.
+    커밋하지 않은 변경은 반납 시 rollback 됨
+    """
+    conn = pool.acquire()
+    try:
+        yield conn
+    finally:
+        # 끊긴 연결은 풀에 돌려놓지 않음 (rollback 실패도 release 에서 같은 처리)
+        pool.release(conn, broken=not conn.open)
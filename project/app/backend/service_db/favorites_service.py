@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
-from .db_service import get_connection
+from .db_service import db_connection
 from pymysql.cursors import DictCursor
+from pymysql.constants import ER
 import pymysql
 
 favorites_api = Blueprint('favorites_api', __name__)
@@ -16,28 +17,25 @@ def add_favorite():
     if not user_id or not spot_id:
         return jsonify({"result": "실패", "error": "user_id와 spot_id는 필수입니다."}), 400
 
-    conn = get_connection()
-    cursor = conn.cursor()
     try:
-        # 중복 확인
-        sql_check = "SELECT 1 FROM favorites WHERE user_id = %s AND spot_id = %s"
-        cursor.execute(sql_check, (user_id, spot_id))
-        if cursor.fetchone():
-            return jsonify({"result": "실패", "error": "이미 즐겨찾기에 추가된 항목입니다."}), 400
-
-        sql_insert = """
-            INSERT INTO favorites (user_id, spot_id, memo)
-            VALUES (%s, %s, %s)
-        """
-        cursor.execute(sql_insert, (user_id, spot_id, memo))
-        conn.commit()
-        return jsonify({"result": "성공"}), 201
+        # 중복은 UNIQUE(user_id, spot_id) 로 판별 (사전 SELECT 없이 INSERT 한 번)
+        with db_connection() as conn, conn.cursor() as cursor:
+            sql_insert = """
+                INSERT INTO favorites (user_id, spot_id, memo)
+                VALUES (%s, %s, %s)
+            """
+            cursor.execute(sql_insert, (user_id, spot_id, memo))
+            conn.commit()
+            return jsonify({"result": "성공"}), 201
 
+    except pymysql.err.IntegrityError as e:
+        if e.args[0] == ER.DUP_ENTRY:
+            return jsonify({"result": "실패", "error": "이미 즐겨찾기에 추가된 항목입니다."}), 409
+        if e.args[0] == ER.NO_REFERENCED_ROW_2:
+            return jsonify({"result": "실패", "error": "존재하지 않는 사용자 또는 낚시터입니다."}), 404
+        return jsonify({"result": "실패", "error": str(e)}), 500
     except Exception as e:
         return jsonify({"result": "실패", "error": str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
 
 
 # 즐겨찾기 삭제
@@ -50,20 +48,16 @@ def delete_favorite():
     if not user_id or not spot_id:
         return jsonify({"result": "실패", "error": "user_id와 spot_id는 필수입니다."}), 400
 
-    conn = get_connection()
-    cursor = conn.cursor()
     try:
-        sql = "DELETE FROM favorites WHERE user_id = %s AND spot_id = %s"
-        affected_rows = cursor.execute(sql, (user_id, spot_id))
-        conn.commit()
-        if affected_rows == 0:
-            return jsonify({"result": "실패", "error": "삭제할 항목이 없습니다."}), 404
-        return jsonify({"result": "삭제 완료"}), 200
+        with db_connection() as conn, conn.cursor() as cursor:
+            sql = "DELETE FROM favorites WHERE user_id = %s AND spot_id = %s"
+            affected_rows = cursor.execute(sql, (user_id, spot_id))
+            conn.commit()
+            if affected_rows == 0:
+                return jsonify({"result": "실패", "error": "삭제할 항목이 없습니다."}), 404
+            return jsonify({"result": "삭제 완료"}), 200
     except Exception as e:
         return jsonify({"result": "실패", "error": str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
 
 
 # 즐겨찾기 조회
@@ -73,21 +67,17 @@ def get_favorite_spots():
     if not user_id:
         return jsonify({"result": "실패", "error": "user_id는 필수입니다."}), 400
 
-    conn = get_connection()
-    cursor = conn.cursor(DictCursor)
     try:
-        sql = """
-            SELECT s.*, f.memo
-            FROM favorites f
-            JOIN spot s ON f.spot_id = s.spot_id
-            WHERE f.user_id = %s
-        """
-        cursor.execute(sql, (user_id,))
-        result = cursor.fetchall()
-        return jsonify({"result": "성공", "data": result}), 200
+        with db_connection() as conn, conn.cursor(DictCursor) as cursor:
+            sql = """
+                SELECT s.*, f.memo
+                FROM favorites f
+                JOIN spot s ON f.spot_id = s.spot_id
+                WHERE f.user_id = %s
+            """
+            cursor.execute(sql, (user_id,))
+            result = cursor.fetchall()
+            return jsonify({"result": "성공", "data": result}), 200
     except Exception as e:
         return jsonify({"result": "실패", "error": str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
 
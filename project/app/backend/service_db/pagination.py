@@ -0,0 +1,128 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  게시판 목록 / 댓글 키셋(커서) 페이지네이션
+#  정렬 키의 마지막 값을 커서로 넘겨 OFFSET 없이 인덱스에서 바로 다음 페이지를 읽음
+#  • 게시판: (reg_date DESC, board_id DESC) — 인덱스 (reg_date, board_id)
+#  • 댓글  : (comment_date ASC, comment_id ASC) — 인덱스 (board_id, comment_date)
+#  (행 값 비교 (a, b) < (x, y) 는 MySQL 5.7+ / SQLite 3.15+ 모두 인덱스 범위 검색).
+#  목록에는 본문 대신 앞부분 미리보기 + 댓글 수만 포함
+# ─────────────────────────────────────────────────────────────────────────────
+BOARD_PAGE_SIZE       = 20
+BOARD_PAGE_SIZE_MAX   = 100
+BOARD_PREVIEW_CHARS   = 100
+COMMENT_PAGE_SIZE     = 50
+COMMENT_PAGE_SIZE_MAX = 200
+
+# SUBSTR 은 MySQL / SQLite 공통 (벤치마크가 같은 쿼리를 SQLite 로 실행)
+# 댓글 수는 페이지 행마다 (board_id, comment_date) 인덱스로 세는 집계 하위 쿼리 (목록 조회 한 번에 포함)
+BOARD_LIST_COLUMNS = (
+    f"board_id, user_id, title, SUBSTR(content, 1, {BOARD_PREVIEW_CHARS}) AS preview, reg_date, "
+    "(SELECT COUNT(*) FROM comment c WHERE c.board_id = board.board_id) AS comment_count"
+)
+BOARD_LIST_ORDER = "ORDER BY reg_date DESC, board_id DESC"
+
+COMMENT_COLUMNS = "comment_id, board_id, user_id, comment_content, comment_date"
+COMMENT_ORDER = "ORDER BY comment_date ASC, comment_id ASC"
+
+
+class InvalidPage(ValueError):
+    pass
+
+
+def page_size(value, default: int = BOARD_PAGE_SIZE, maximum: int = BOARD_PAGE_SIZE_MAX) -> int:
+    """
+    요청 limit → 1 ~ maximum (없으면 default)
+    """
+    if value in (None, ""):
+        return default
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        raise InvalidPage(f"limit 은 정수여야 합니다: {value}")
+    return max(1, min(size, maximum))
+
+
+def encode_cursor(sort_value, row_id: int) -> str:
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat(sep=" ")
+    raw = json.dumps([str(sort_value), int(row_id)], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, row_id = json.loads(raw)
+        return str(sort_value), int(row_id)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise InvalidPage(f"잘못된 cursor: {cursor}") from e
+
+
+def board_page_query(cursor: str | None, size: int) -> tuple[str, tuple]:
+    """
+    한 페이지 조회 SQL + 파라미터. 다음 페이지 존재 여부를 알기 위해 size + 1 건을 읽음
+    """
+    if cursor:
+        reg_date, board_id = decode_cursor(cursor)
+        sql = f"""
+            SELECT {BOARD_LIST_COLUMNS}
+            FROM board
+            WHERE (reg_date, board_id) < (%s, %s)
+            {BOARD_LIST_ORDER}
+            LIMIT %s
+        """
+        return sql, (reg_date, board_id, size + 1)
+    sql = f"""
+        SELECT {BOARD_LIST_COLUMNS}
+        FROM board
+        {BOARD_LIST_ORDER}
+        LIMIT %s
+    """
+    return sql, (size + 1,)
+
+
+def comment_page_query(board_id: int, cursor: str | None, size: int) -> tuple[str, tuple]:
+    """
+    게시글 댓글 한 페이지 (오래된 순). size + 1 건을 읽음
+    """
+    if cursor:
+        comment_date, comment_id = decode_cursor(cursor)
+        sql = f"""
+            SELECT {COMMENT_COLUMNS}
+            FROM comment
+            WHERE board_id = %s AND (comment_date, comment_id) > (%s, %s)
+            {COMMENT_ORDER}
+            LIMIT %s
+        """
+        return sql, (board_id, comment_date, comment_id, size + 1)
+    sql = f"""
+        SELECT {COMMENT_COLUMNS}
+        FROM comment
+        WHERE board_id = %s
+        {COMMENT_ORDER}
+        LIMIT %s
+    """
+    return sql, (board_id, size + 1)
+
+
+def keyset_page(rows: list[dict], size: int, sort_key: str, id_key: str) -> tuple[list[dict], str | None]:
+    """
+    size + 1 건 조회 결과 → (이번 페이지, 다음 페이지 커서 또는 None)
+    """
+    if len(rows) <= size:
+        return rows, None
+    rows = rows[:size]
+    last = rows[-1]
+    return rows, encode_cursor(last[sort_key], last[id_key])
+
+
+def board_page(rows: list[dict], size: int) -> tuple[list[dict], str | None]:
+    return keyset_page(rows, size, "reg_date", "board_id")
+
+
+def comment_page(rows: list[dict], size: int) -> tuple[list[dict], str | None]:
+    return keyset_page(rows, size, "comment_date", "comment_id")
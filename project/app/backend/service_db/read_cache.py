@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+
+from cache import LRUCache
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  게시판 / 댓글 조회 읽기 캐시 (프로세스 내 LRU, 외부 서비스 불필요)
+#  • 항목은 (버전, 값) 으로 저장. 조회 시 현재 버전과 다르면 miss 처리 후 다시 읽음
+#  • 쓰기 요청은 커밋 후 관련 범위의 버전을 올려 무효화
+#      - 목록 범위 "boards"         : 모든 목록 페이지 (커서/limit 별 항목, 댓글 수 포함)
+#      - 게시글 범위 ("board", id)  : 게시글 상세 (댓글 페이지별) + 댓글 목록
+#    (DB 를 읽기 전에 버전을 잡아 두므로 읽는 도중 쓰기가 끝나면 오래된 값은 다음 조회에서 버려짐)
+#  • 댓글 수정/삭제는 comment_id 만 알기 때문에 캐시된 댓글 목록에서 게시글을 찾고,
+#    모르면 모든 게시글 범위를 한 번에 무효화
+#  • 다른 워커 프로세스의 쓰기는 보이지 않으므로 BOARD_CACHE_TTL_SEC 후 만료
+# ─────────────────────────────────────────────────────────────────────────────
+BOARD_CACHE_MAX_ENTRIES = int(os.getenv("BOARD_CACHE_MAX_ENTRIES", "2048"))
+BOARD_CACHE_TTL_SEC     = float(os.getenv("BOARD_CACHE_TTL_SEC", "60"))
+
+BOARD_LIST = "boards"
+
+
+def board_scope(board_id: int) -> tuple:
+    return ("board", int(board_id))
+
+
+class BoardReadCache:
+    def __init__(self, max_entries: int = BOARD_CACHE_MAX_ENTRIES, ttl_sec: float = BOARD_CACHE_TTL_SEC):
+        self.ttl_sec = ttl_sec
+        self.cache = LRUCache(max_entries=max_entries)
+        self._lock = threading.Lock()
+        self._versions = {}         # 범위 → 버전
+        self._epoch = 0             # 모든 게시글 범위 공통 버전
+        self._comment_boards = LRUCache(max_entries=max_entries * 8)   # comment_id → board_id
+        self.stale = 0
+        self.invalidations = 0
+
+    def version(self, scope) -> tuple:
+        with self._lock:
+            epoch = self._epoch if scope != BOARD_LIST else 0
+            return epoch, self._versions.get(scope, 0)
+
+    def get_or_load(self, scope, key, load):
+        """
+        캐시에 현재 버전 값이 있으면 반환, 없으면 load() 결과를 저장 후 반환 (None 은 저장하지 않음)
+        """
+        version = self.version(scope)
+        entry = self.cache.get((scope, key))
+        if entry is not None:
+            if entry[0] == version:
+                return entry[1]
+            with self._lock:
+                self.stale += 1
+
+        value = load()
+        if value is not None:
+            self.cache.set((scope, key), (version, value), expires_at=time.time() + self.ttl_sec)
+        return value
+
+    def remember_comments(self, board_id: int, comments: list[dict]):
+        """
+        댓글 수정/삭제 시 게시글 범위를 찾기 위한 comment_id → board_id 기록
+        """
+        for comment in comments:
+            self._comment_boards.set(comment["comment_id"], int(board_id))
+
+    # ------------------------------------------------------------------
+    # 무효화 (쓰기 커밋 후 호출)
+    # ------------------------------------------------------------------
+    def invalidate(self, *scopes):
+        with self._lock:
+            for scope in scopes:
+                self._versions[scope] = self._versions.get(scope, 0) + 1
+            self.invalidations += 1
+
+    def invalidate_board(self, board_id: int, listing: bool = True):
+        if listing:
+            self.invalidate(BOARD_LIST, board_scope(board_id))
+        else:
+            self.invalidate(board_scope(board_id))
+
+    def invalidate_comment(self, comment_id: int, listing: bool = False):
+        """
+        listing: 댓글 수가 바뀌는 쓰기 (목록 페이지의 댓글 수도 무효화)
+        """
+        board_id = self._comment_boards.peek(comment_id)
+        if board_id is not None:
+            self.invalidate_board(board_id, listing=listing)
+            return
+        # 캐시된 댓글 목록에 없던 댓글: 어느 게시글인지 모르므로 게시글 범위 전체 무효화
+        with self._lock:
+            self._epoch += 1
+            if listing:
+                self._versions[BOARD_LIST] = self._versions.get(BOARD_LIST, 0) + 1
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        stats = self.cache.stats()
+        with self._lock:
+            # 버전이 지난 항목은 LRU 에서는 적중이지만 다시 읽었으므로 miss 로 집계
+            hits = stats["hits"] - self.stale
+            misses = stats["misses"] + self.stale
+            stats.update({
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+                "stale": self.stale,
+                "invalidations": self.invalidations,
+                "ttl_sec": self.ttl_sec,
+            })
+        stats.pop("bytes", None)
+        return stats
+
+
+board_cache = BoardReadCache()
@@ -1,7 +1,8 @@
 from flask import Blueprint, request, jsonify
 import pymysql
+from pymysql.constants import ER
 from dotenv import load_dotenv
-from .db_service import get_connection
+from .db_service import db_connection
 
 load_dotenv()
 
@@ -24,25 +25,22 @@ def create_user():
     address = data.get('address')
     phone = data.get('phone')
 
-    conn = get_connection()
-    cursor = conn.cursor()
     try:
-        cursor.execute("SELECT 1 FROM users WHERE user_id = %s OR email = %s", (user_id, email))
-        if cursor.fetchone():
+        # ID(기본 키) / 이메일(UNIQUE) 중복은 INSERT 결과로 판별
+        with db_connection() as conn, conn.cursor() as cursor:
+            sql = """
+                INSERT INTO users (user_id, user_pw, name, email, address, phone)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """
+            cursor.execute(sql, (user_id, user_pw, name, email, address, phone))
+            conn.commit()
+            return jsonify({"result": "성공", "user_id": user_id}), 201
+    except pymysql.err.IntegrityError as e:
+        if e.args[0] == ER.DUP_ENTRY:
             return jsonify({"result": "실패", "error": "이미 존재하는 ID 또는 이메일입니다."}), 409
-
-        sql = """
-            INSERT INTO users (user_id, user_pw, name, email, address, phone)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """
-        cursor.execute(sql, (user_id, user_pw, name, email, address, phone))
-        conn.commit()
-        return jsonify({"result": "성공", "user_id": user_id}), 201
+        return jsonify({"result": "실패", "error": str(e)}), 500
     except Exception as e:
         return jsonify({"result": "실패", "error": str(e)}), 500
-    finally:
-        cursor.close()
-        conn.close()
 
 # 로그인
 @user_api.route('/login', methods=['POST'])
@@ -54,10 +52,7 @@ def login():
     if not user_id or not user_pw:
         return jsonify({"result": "실패", "error": "ID/PW 입력 누락"}), 400
 
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    try:
+    with db_connection() as conn, conn.cursor() as cursor:
         sql = """
             SELECT *
             FROM users
@@ -70,8 +65,5 @@ def login():
             return jsonify({"result": "성공", "user_id": user['user_id']}), 200
         else:
             return jsonify({"result": "실패", "error": "아이디 또는 비밀번호가 틀렸습니다."}), 401
-    finally:
-        cursor.close()
-        conn.close()
 
 
@@ -1,68 +1,91 @@
 from spot.service import FishingSpotService
 from fish.service import FishService
-from function import bbox_from_x_y_radius
+from fish.index import FishPointIndex
+from fish.tile_cache import TileFeatureCache
+from fish.projection import project_point, project_points
+
+SEARCH_RADIUS_KM = 5
+MAX_FEATURES = 10
 
 class FishInfoService:
     def __init__(self, fish_api_key: str, spot_service: FishingSpotService):
         self.fish_service = FishService(fish_api_key)
         self.spot_service = spot_service
+        self.tile_cache = TileFeatureCache(self.fish_service, type_name="mv_map_ntee_fishes_point")
+        self.load_spot_points()
+        self.reload_point_index()
+
+    def load_spot_points(self):
+        """
+        모든 낚시터 좌표를 한 번에 EPSG:5186 으로 변환해 보관
+        (요청 처리 중에는 투영 연산을 하지 않음)
+        """
+        df = self.spot_service.df.dropna(subset=["lat", "lon"])
+        xs, ys = project_points(df["lat"].to_numpy(), df["lon"].to_numpy())
+
+        by_name, by_coords = {}, {}
+        for name, lat, lon, x, y in zip(df["name"], df["lat"], df["lon"], xs, ys):
+            by_name.setdefault(name, (float(x), float(y)))
+            by_coords.setdefault((float(lat), float(lon)), (float(x), float(y)))
+        self._xy_by_name = by_name
+        self._xy_by_coords = by_coords
+
+    def reload_point_index(self):
+        """
+        로컬 어류 조사 지점 인덱스 로드 (fish.harvest 결과 파일). 파일이 없으면 WFS 직접 조회
+        """
+        index = FishPointIndex.load()
+        self.point_index = index
+        if index is not None:
+            print(f"[FishAPI] 로컬 지점 인덱스 로드: {len(index)}개")
+
+    def _xy_for(self, lat: float, lon: float) -> tuple[float, float]:
+        xy = self._xy_by_coords.get((float(lat), float(lon)))
+        return xy if xy is not None else project_point(lat, lon)
+
+    def _query(self, x: float, y: float) -> list:
+        """
+        로컬 인덱스가 있으면 반경 검색, 없으면 타일 캐시를 거쳐 WFS 조회
+        """
+        index = self.point_index
+        if index is not None:
+            return index.query_radius(x, y, SEARCH_RADIUS_KM * 1000.0, limit=MAX_FEATURES)
+        return self.tile_cache.query_radius(x, y, SEARCH_RADIUS_KM * 1000.0, limit=MAX_FEATURES)
 
     # 낚시터 이름으로 어종 구하기
     def get_fish_by_spot_name(self, name: str) -> list:
-        # 위경도 조회
-        lat, lon = self.spot_service.get_coordinates_by_name(name)
-        if lat is None or lon is None:
-            return [{"error": "해당 낚시터를 찾을 수 없습니다."}]
+        # 미리 변환한 좌표, 없으면 위경도로 계산
+        xy = self._xy_by_name.get(name)
+        if xy is None:
+            lat, lon = self.spot_service.get_coordinates_by_name(name)
+            if lat is None or lon is None:
+                return [{"error": "해당 낚시터를 찾을 수 없습니다."}]
+            xy = self._xy_for(lat, lon)
 
-        # bbox 계산 (반경 5km 기준)
-        bbox = bbox_from_x_y_radius(lat, lon, radius_km=5)
-        # bbox = 314548.9311225004,401742.29949240043,320867.0145135768,409072.0397406582
-
-        # # 물고기 API 조회
-        # return self.fish_service.get_features(
-        #     bbox=bbox,
-        #     type_name="mv_map_ntee_fishes_point",
-        #     max_features=10
-        # )
-        result = self.fish_service.get_features(
-        bbox=bbox,
-        type_name="mv_map_ntee_fishes_point",
-        max_features=10
-        )
-        return result
+        return self._query(*xy)
     
     def get_fish_by_coordinates(self, lat: float, lon: float) -> list:
         """
-        위도/경도로부터 BBOX를 계산해 물고기 API를 호출하고,
-        조회된 어종 정보를 리스트로 반환합니다.
+        위도/경도 반경 5km 안의 어종 정보를 리스트로 반환합니다.
         - 어종이 없으면 빈 리스트 반환
-        - 실패 시 예외 로그를 출력하고 빈 리스트 반환
+        - 조회 실패(네트워크/응답 오류)는 예외로 전달 → 갱신 엔진이 재시도 후 '조회 실패' 기록
+          ('없음'과 구분하기 위해 빈 리스트로 바꾸지 않음)
         """
-        bbox = bbox_from_x_y_radius(lat, lon, radius_km=5)
-        print(f"[FishAPI] 요청 bbox: {bbox} (위도: {lat}, 경도: {lon})")
-
-        try:
-            result = self.fish_service.get_features(
-                bbox=bbox,
-                type_name="mv_map_ntee_fishes_point",
-                max_features=10
-            )
+        x, y = self._xy_for(lat, lon)
+        print(f"[FishAPI] 요청 좌표: ({x}, {y}) (위도: {lat}, 경도: {lon})")
 
-            # 결과 검증
-            if not isinstance(result, list):
-                print("[FishAPI] 경고: API 응답이 list가 아닙니다.")
-                return []
+        result = self._query(x, y)
 
-            if not result:
-                print("[FishAPI] 조회된 어종 없음.")
-                return []
+        # 결과 검증
+        if not isinstance(result, list):
+            raise ValueError(f"어종 조회 결과가 list가 아닙니다: {type(result).__name__}")
 
-            # 유효한 어종 정보 있는지 확인
-            valid_items = [f for f in result if f.get("spcs_korean_nm")]
-            print(f"[FishAPI] 유효 어종 개수: {len(valid_items)}")
+        if not result:
+            print("[FishAPI] 조회된 어종 없음.")
+            return []
 
-            return valid_items
+        # 유효한 어종 정보 있는지 확인
+        valid_items = [f for f in result if f.get("spcs_korean_nm")]
+        print(f"[FishAPI] 유효 어종 개수: {len(valid_items)}")
 
-        except Exception as e:
-            print(f"[FishAPI] 예외 발생: {e}")
-            return []
+        return valid_items
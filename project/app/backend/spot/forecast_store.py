@@ -0,0 +1,554 @@
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  낚시터 예보 저장소 (SQLite)
+#  • grid_forecast: 격자(nx, ny) 단위 초단기/단기 예보, (시각, 항목)마다 한 행
+#  • mid_forecast : 중기 지역 코드 단위 육상/기온/해상 예보, (날짜, 항목)마다 한 행
+#  • grid_refresh : 격자/구역별 마지막 갱신 시각 (갱신 우선순위 계산용)
+#  • spot_status  : 낚시터별 마지막 갱신 결과 (사용한 예보 경로, 성공 여부, 어종 목록)
+#  • refresh_issuance: 작업별 마지막으로 갱신을 마친 발표 (여러 프로세스의 같은 발표 중복 갱신 방지)
+#  • spot_hits / refresh_budget: 낚시터별 감쇠 조회 수, 구역별 남은 호출 예산 (모든 워커가 공유, spot.priority)
+#  같은 격자/지역을 쓰는 낚시터들은 예보 행을 공유하므로 부분 갱신은 해당 행만 교체
+#
+#  갱신 실행(run)은 작업 결과를 refresh_journal 에 하나씩 체크포인트하고,
+#  모든 작업이 끝나면 publish() 한 트랜잭션으로 위 테이블에 반영 (읽는 쪽은 이전/새 결과만 봄).
+#  중간에 프로세스가 죽으면 다음 실행이 같은 이름의 미완료 run 을 이어서 진행
+# ─────────────────────────────────────────────────────────────────────────────
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FORECAST_DB_PATH = os.path.join(BASE_DIR, "..", "dataset", "forecast", "forecast.db")
+
+FAILED = "조회 실패"
+
+# 미완료 갱신 실행을 이어받는 최대 경과 시간 (그보다 오래된 체크포인트는 예보가 낡았으므로 폐기)
+RESUME_MAX_AGE_SEC = 60 * 60
+RUN_HISTORY_SEC = 7 * 24 * 60 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS grid_forecast (
+    nx          INTEGER NOT NULL,
+    ny          INTEGER NOT NULL,
+    section     TEXT    NOT NULL,
+    fcst_time   TEXT    NOT NULL,
+    field       TEXT    NOT NULL,
+    value_int   INTEGER,
+    value_real  REAL,
+    value_text  TEXT,
+    PRIMARY KEY (nx, ny, section, fcst_time, field)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS mid_forecast (
+    reg_id      TEXT    NOT NULL,
+    section     TEXT    NOT NULL,
+    fcst_time   TEXT    NOT NULL,
+    field       TEXT    NOT NULL,
+    value_int   INTEGER,
+    value_real  REAL,
+    value_text  TEXT,
+    PRIMARY KEY (reg_id, section, fcst_time, field)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS grid_refresh (
+    nx          INTEGER NOT NULL,
+    ny          INTEGER NOT NULL,
+    section     TEXT    NOT NULL,
+    updated_at  REAL    NOT NULL,
+    PRIMARY KEY (nx, ny, section)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS spot_status (
+    spot_key            TEXT PRIMARY KEY,
+    nx                  INTEGER,
+    ny                  INTEGER,
+    land_code           TEXT,
+    temp_code           TEXT,
+    sea_code            TEXT,
+    weather_ok          INTEGER,
+    weather_updated_at  REAL,
+    fish_list           TEXT,
+    fish_updated_at     REAL
+);
+
+CREATE TABLE IF NOT EXISTS refresh_run (
+    run_id          TEXT PRIMARY KEY,
+    name            TEXT NOT NULL,
+    started_at      REAL NOT NULL,
+    published_at    REAL
+);
+
+CREATE TABLE IF NOT EXISTS refresh_journal (
+    run_id      TEXT    NOT NULL,
+    kind        TEXT    NOT NULL,
+    task_key    TEXT    NOT NULL,
+    ok          INTEGER NOT NULL,
+    payload     TEXT,
+    recorded_at REAL    NOT NULL,
+    PRIMARY KEY (run_id, kind, task_key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS refresh_issuance (
+    name            TEXT PRIMARY KEY,
+    issuance        TEXT NOT NULL,
+    completed_at    REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS spot_hits (
+    name        TEXT PRIMARY KEY,
+    value       REAL NOT NULL,
+    updated_at  REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS refresh_budget (
+    section     TEXT PRIMARY KEY,
+    remaining   REAL NOT NULL,
+    updated_at  REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key     TEXT PRIMARY KEY,
+    value   INTEGER NOT NULL
+);
+"""
+
+# 중기 예보 구역 → 해당 구역 조회에 쓰는 지역 코드 위치 (land, temp, sea)
+MID_CODE_INDEX = {"land": 0, "ta": 1, "sea": 2}
+
+
+def spot_key(record: dict) -> str:
+    """
+    저장소에서 낚시터를 구분하는 키: spot_id 컬럼이 있으면 spot_id, 없으면 이름
+    """
+    spot_id = record.get("spot_id")
+    if spot_id is not None and spot_id == spot_id:
+        return str(spot_id)
+    return str(record.get("name"))
+
+
+def _encode(value) -> tuple:
+    """
+    값 → (value_int, value_real, value_text). 파서가 만든 int/float/None/문자열을 타입 그대로 보존
+    """
+    if value is None:
+        return None, None, None
+    if isinstance(value, bool):
+        return int(value), None, None
+    if isinstance(value, int):
+        return value, None, None
+    if isinstance(value, float):
+        return None, value, None
+    return None, None, str(value)
+
+
+def _decode(value_int, value_real, value_text):
+    if value_int is not None:
+        return value_int
+    if value_real is not None:
+        return value_real
+    return value_text
+
+
+def _forecast_rows(prefix: tuple, section: str, forecast: dict) -> list[tuple]:
+    """
+    {예보시각: {항목: 값}} → 저장소 행 목록
+    """
+    rows = []
+    for fcst_time, fields in (forecast or {}).items():
+        for field, value in fields.items():
+            rows.append((*prefix, section, fcst_time, field, *_encode(value)))
+    return rows
+
+
+def _grid_statements(nx: int, ny: int, forecasts: dict, now: float) -> list[tuple]:
+    statements = []
+    for section, forecast in forecasts.items():
+        statements.append((
+            "DELETE FROM grid_forecast WHERE nx = ? AND ny = ? AND section = ?",
+            [(nx, ny, section)],
+        ))
+        statements.append((
+            "INSERT INTO grid_forecast VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            _forecast_rows((nx, ny), section, forecast),
+        ))
+        statements.append((
+            "INSERT OR REPLACE INTO grid_refresh VALUES (?, ?, ?, ?)",
+            [(nx, ny, section, now)],
+        ))
+    return statements
+
+
+def _mid_statements(codes: tuple, mid: dict) -> list[tuple]:
+    statements = []
+    for section, forecast in mid.items():
+        reg_id = codes[MID_CODE_INDEX[section]]
+        # 조회에 실패한 구역({})은 마지막으로 받은 예보를 그대로 둠
+        if not reg_id or not forecast:
+            continue
+        statements.append((
+            "DELETE FROM mid_forecast WHERE reg_id = ? AND section = ?",
+            [(reg_id, section)],
+        ))
+        statements.append((
+            "INSERT INTO mid_forecast VALUES (?, ?, ?, ?, ?, ?, ?)",
+            _forecast_rows((reg_id,), section, forecast),
+        ))
+    return statements
+
+
+def _status_statements(entries: list[tuple], now: float) -> list[tuple]:
+    """
+    entries: [(spot_key, (nx, ny, land, temp, sea), 성공 여부)]
+    """
+    return [(
+        """
+        INSERT INTO spot_status (spot_key, nx, ny, land_code, temp_code, sea_code, weather_ok, weather_updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (spot_key) DO UPDATE SET
+            nx = excluded.nx, ny = excluded.ny,
+            land_code = excluded.land_code, temp_code = excluded.temp_code, sea_code = excluded.sea_code,
+            weather_ok = excluded.weather_ok, weather_updated_at = excluded.weather_updated_at
+        """,
+        [(key, *route, int(ok), now) for key, route, ok in entries],
+    )]
+
+
+def _fish_statements(entries: list[tuple], now: float) -> list[tuple]:
+    """
+    entries: [(spot_key, 어종 목록 문자열)]
+    """
+    return [(
+        """
+        INSERT INTO spot_status (spot_key, fish_list, fish_updated_at) VALUES (?, ?, ?)
+        ON CONFLICT (spot_key) DO UPDATE SET
+            fish_list = excluded.fish_list, fish_updated_at = excluded.fish_updated_at
+        """,
+        [(key, fish_list, now) for key, fish_list in entries],
+    )]
+
+
+class ForecastStore:
+    def __init__(self, path: str = FORECAST_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('revision', 0)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        스레드별 연결 (Flask 요청 스레드와 갱신 작업 스레드가 동시에 사용)
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # 조회 수 감쇠 계산용 (SQLite 빌드에 수학 함수가 없을 수 있음)
+            conn.create_function("exp", 1, math.exp, deterministic=True)
+            self._local.conn = conn
+        return conn
+
+    def _write(self, statements: list[tuple], bump: bool = True):
+        """
+        (sql, 파라미터 목록) 묶음을 한 트랜잭션으로 실행하고 저장소 리비전을 올림 (bump=False 면 유지)
+        """
+        with self._write_lock:
+            conn = self._connect()
+            with conn:
+                for sql, params in statements:
+                    conn.executemany(sql, params)
+                if bump:
+                    conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'revision'")
+
+    def revision(self) -> int:
+        """
+        예보 반영마다 1씩 증가 (응답 캐시 / ETag 용 버전)
+        """
+        row = self._connect().execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+        return row[0] if row else 0
+
+    # ------------------------------------------------------------------
+    # 쓰기 (즉시 반영)
+    # ------------------------------------------------------------------
+    def save_grid(self, nx: int, ny: int, forecasts: dict):
+        """
+        격자 하나의 초단기/단기 예보 교체: forecasts = {"ultra": {...}, "short": {...}}
+        """
+        self._write(_grid_statements(nx, ny, forecasts, time.time()))
+
+    def save_mid(self, codes: tuple, mid: dict):
+        """
+        중기 예보 교체: codes = (land, temp, sea), mid = {"land": {...}, "ta": {...}, "sea": {...}}
+        코드가 없거나 예보가 빈 구역은 건너뜀
+        """
+        self._write(_mid_statements(codes, mid))
+
+    def set_weather_status(self, entries: list[tuple]):
+        """
+        entries: [(spot_key, (nx, ny, land, temp, sea), 성공 여부)]
+        """
+        self._write(_status_statements(entries, time.time()))
+
+    def set_fish_list(self, key: str, fish_list: str):
+        self._write(_fish_statements([(key, fish_list)], time.time()))
+
+    # ------------------------------------------------------------------
+    # 갱신 실행: 체크포인트 → 한 번에 반영
+    # ------------------------------------------------------------------
+    def begin_run(self, name: str, max_age_sec: float = RESUME_MAX_AGE_SEC) -> tuple[str, dict]:
+        """
+        같은 이름의 미완료 run 이 max_age_sec 이내에 시작됐으면 이어받고, 아니면 새 run 시작.
+        반환: (run_id, 이미 끝난 작업 {(kind, task_key): (ok, payload)})
+        """
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT run_id, started_at FROM refresh_run WHERE name = ? AND published_at IS NULL "
+            "ORDER BY started_at DESC LIMIT 1",
+            (name,),
+        ).fetchone()
+        if row is not None and time.time() - row[1] <= max_age_sec:
+            run_id = row[0]
+            cursor = conn.execute(
+                "SELECT kind, task_key, ok, payload FROM refresh_journal WHERE run_id = ?", (run_id,)
+            )
+            done = {
+                (kind, task_key): (bool(ok), json.loads(payload) if payload is not None else None)
+                for kind, task_key, ok, payload in cursor
+            }
+            return run_id, done
+
+        # 오래된 미완료 run 은 폐기 후 새로 시작 (반영된 run 기록은 RUN_HISTORY_SEC 동안 보관)
+        run_id = uuid.uuid4().hex
+        self._write([
+            ("DELETE FROM refresh_journal WHERE run_id IN "
+             "(SELECT run_id FROM refresh_run WHERE name = ? AND published_at IS NULL)", [(name,)]),
+            ("DELETE FROM refresh_run WHERE name = ? AND published_at IS NULL", [(name,)]),
+            ("DELETE FROM refresh_run WHERE published_at < ?", [(time.time() - RUN_HISTORY_SEC,)]),
+            ("INSERT INTO refresh_run (run_id, name, started_at) VALUES (?, ?, ?)", [(run_id, name, time.time())]),
+        ], bump=False)
+        return run_id, {}
+
+    def checkpoint(self, run_id: str, kind: str, task_key: str, ok: bool, payload=None):
+        """
+        작업 하나의 결과를 저널에 기록 (커밋 후 반환하므로 이후 중단돼도 다시 조회하지 않음)
+        """
+        self._write([(
+            "INSERT OR REPLACE INTO refresh_journal VALUES (?, ?, ?, ?, ?, ?)",
+            [(run_id, kind, task_key, int(ok),
+              json.dumps(payload, ensure_ascii=False) if payload is not None else None, time.time())],
+        )], bump=False)
+
+    def publish(self, run_id: str, grids: dict, mids: dict, statuses: list[tuple], fish: list[tuple]):
+        """
+        run 결과를 한 트랜잭션으로 반영하고 저널 정리
+        • grids: (nx, ny) → {"ultra", "short"}   • mids: (land, temp, sea) → {"land", "ta", "sea"}
+        • statuses: [(spot_key, route, 성공 여부)] • fish: [(spot_key, 어종 목록 문자열)]
+        """
+        now = time.time()
+        statements = []
+        for (nx, ny), forecasts in grids.items():
+            statements += _grid_statements(nx, ny, forecasts, now)
+        for codes, mid in mids.items():
+            statements += _mid_statements(codes, mid)
+        statements += _status_statements(statuses, now)
+        statements += _fish_statements(fish, now)
+        statements += [
+            ("UPDATE refresh_run SET published_at = ? WHERE run_id = ?", [(now, run_id)]),
+            ("DELETE FROM refresh_journal WHERE run_id = ?", [(run_id,)]),
+        ]
+        self._write(statements)
+
+    def complete_issuance(self, name: str, issuance: str):
+        """
+        작업 name 이 발표 issuance 에 대한 갱신을 마쳤음을 기록
+        """
+        self._write([(
+            "INSERT OR REPLACE INTO refresh_issuance VALUES (?, ?, ?)", [(name, issuance, time.time())]
+        )], bump=False)
+
+    def add_spot_hits(self, hits: dict[str, float], decay: float, min_value: float):
+        """
+        낚시터 이름별 조회 수를 더함 (기존 값은 decay 로 감쇠한 뒤 더함).
+        감쇠 후 min_value 미만으로 줄어든 항목은 함께 삭제
+        """
+        now = time.time()
+        self._write([
+            (
+                """
+                INSERT INTO spot_hits (name, value, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET
+                    value = value * exp(? * (updated_at - excluded.updated_at)) + excluded.value,
+                    updated_at = excluded.updated_at
+                """,
+                [(name, count, now, decay) for name, count in hits.items()],
+            ),
+            ("DELETE FROM spot_hits WHERE value * exp(? * (updated_at - ?)) < ?", [(decay, now, min_value)]),
+        ], bump=False)
+
+    def spend_call_budget(self, sections: tuple[str, ...], calls: int, capacity: float, hourly_budget: float):
+        """
+        구역별 남은 호출 수를 시간당 hourly_budget 씩 (capacity 까지) 채운 뒤 calls 만큼 차감
+        """
+        now = time.time()
+        self._write([(
+            """
+            INSERT INTO refresh_budget (section, remaining, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT (section) DO UPDATE SET
+                remaining = MIN(?, remaining + ? * (excluded.updated_at - updated_at) / 3600.0) - ?,
+                updated_at = excluded.updated_at
+            """,
+            [(section, capacity - calls, now, capacity, hourly_budget, calls) for section in sections],
+        )], bump=False)
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+    def completed_issuance(self, name: str) -> str | None:
+        """
+        작업 name 이 마지막으로 갱신을 마친 발표 (없으면 None)
+        """
+        row = self._connect().execute(
+            "SELECT issuance FROM refresh_issuance WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def statuses(self) -> dict[str, dict]:
+        """
+        spot_key → 마지막 갱신 결과
+        """
+        cursor = self._connect().execute(
+            "SELECT spot_key, nx, ny, land_code, temp_code, sea_code, weather_ok, fish_list FROM spot_status"
+        )
+        return {
+            key: {
+                "route": (nx, ny, land, temp, sea),
+                "weather_ok": weather_ok,
+                "fish_list": fish_list,
+            }
+            for key, nx, ny, land, temp, sea, weather_ok, fish_list in cursor
+        }
+
+    def last_published(self, name: str) -> dict | None:
+        """
+        이름별 마지막으로 반영된 run: {"started_at", "published_at"} (없으면 None)
+        """
+        row = self._connect().execute(
+            "SELECT started_at, published_at FROM refresh_run WHERE name = ? AND published_at IS NOT NULL "
+            "ORDER BY published_at DESC LIMIT 1",
+            (name,),
+        ).fetchone()
+        if row is None:
+            return None
+        return {"started_at": row[0], "published_at": row[1]}
+
+    def grid_refreshed_at(self, sections: tuple[str, ...]) -> dict[tuple, float]:
+        """
+        (nx, ny) → 주어진 구역들 중 가장 오래된 갱신 시각 (구역 중 하나라도 기록이 없으면 제외)
+        """
+        if not sections:
+            return {}
+        placeholders = ", ".join("?" for _ in sections)
+        cursor = self._connect().execute(
+            f"SELECT nx, ny, MIN(updated_at), COUNT(*) FROM grid_refresh WHERE section IN ({placeholders}) "
+            "GROUP BY nx, ny",
+            tuple(sections),
+        )
+        return {(nx, ny): updated for nx, ny, updated, count in cursor if count == len(sections)}
+
+    def spot_hits(self) -> dict[str, tuple[float, float]]:
+        """
+        이름 → (감쇠 적용 조회 수, 기준 시각)
+        """
+        cursor = self._connect().execute("SELECT name, value, updated_at FROM spot_hits")
+        return {name: (value, updated) for name, value, updated in cursor}
+
+    def call_budget(self) -> dict[str, tuple[float, float]]:
+        """
+        구역 → (남은 호출 수, 기준 시각)
+        """
+        cursor = self._connect().execute("SELECT section, remaining, updated_at FROM refresh_budget")
+        return {section: (remaining, updated) for section, remaining, updated in cursor}
+
+    def failed_weather_keys(self) -> list[str]:
+        cursor = self._connect().execute("SELECT spot_key FROM spot_status WHERE weather_ok = 0")
+        return [key for (key,) in cursor]
+
+    def failed_fish_keys(self) -> list[str]:
+        cursor = self._connect().execute("SELECT spot_key FROM spot_status WHERE fish_list = ?", (FAILED,))
+        return [key for (key,) in cursor]
+
+    def grid_forecasts(self, nx: int | None = None, ny: int | None = None) -> dict[tuple, dict]:
+        """
+        (nx, ny) → {"ultra": {...}, "short": {...}}. 격자를 지정하지 않으면 전체
+        """
+        sql = "SELECT nx, ny, section, fcst_time, field, value_int, value_real, value_text FROM grid_forecast"
+        params = ()
+        if nx is not None:
+            sql += " WHERE nx = ? AND ny = ?"
+            params = (nx, ny)
+        result: dict[tuple, dict] = {}
+        for gx, gy, section, fcst_time, field, vi, vr, vt in self._connect().execute(sql, params):
+            sections = result.setdefault((gx, gy), {"ultra": {}, "short": {}})
+            sections.setdefault(section, {}).setdefault(fcst_time, {})[field] = _decode(vi, vr, vt)
+        return result
+
+    def mid_forecasts(self) -> dict[tuple, dict]:
+        """
+        (section, reg_id) → {날짜: {항목: 값}}
+        """
+        result: dict[tuple, dict] = {}
+        cursor = self._connect().execute(
+            "SELECT reg_id, section, fcst_time, field, value_int, value_real, value_text FROM mid_forecast"
+        )
+        for reg_id, section, fcst_time, field, vi, vr, vt in cursor:
+            result.setdefault((section, reg_id), {}).setdefault(fcst_time, {})[field] = _decode(vi, vr, vt)
+        return result
+
+    def load_all(self) -> "ForecastSnapshot":
+        return ForecastSnapshot(self.statuses(), self.grid_forecasts(), self.mid_forecasts())
+
+
+class ForecastSnapshot:
+    """
+    저장소 전체를 한 번에 읽어 낚시터 레코드에 붙이는 용도 (목록 API)
+    격자/지역이 같은 낚시터는 같은 예보 객체를 공유
+    """
+
+    def __init__(self, statuses: dict, grids: dict, mids: dict):
+        self.statuses = statuses
+        self.grids = grids
+        self.mids = mids
+
+    def apply(self, record: dict) -> dict:
+        """
+        레코드 사본에 저장소의 날씨/어종 정보를 채움.
+        갱신 기록이 없는 낚시터는 CSV 값을 그대로 둠, 날씨 갱신 실패는 '조회 실패'
+        """
+        status = self.statuses.get(spot_key(record))
+        record = dict(record)
+        if status is None:
+            return record
+
+        if status["weather_ok"] == 1:
+            nx, ny, land, temp, sea = status["route"]
+            grid = self.grids.get((nx, ny), {})
+            record["weather_mid"] = {
+                "land": self.mids.get(("land", land), {}),
+                "ta": self.mids.get(("ta", temp), {}),
+                "sea": self.mids.get(("sea", sea), {}),
+            }
+            record["weather_short"] = grid.get("short", {})
+            record["weather_ultra"] = grid.get("ultra", {})
+        elif status["weather_ok"] == 0:
+            for col in ["weather_mid", "weather_short", "weather_ultra"]:
+                record[col] = FAILED
+
+        if status["fish_list"] is not None:
+            record["fish_list"] = status["fish_list"]
+        return record
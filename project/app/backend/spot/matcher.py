@@ -0,0 +1,73 @@
+from collections import deque
+
+import pandas as pd
+
+
+class RegionMatcher:
+    """
+    여러 지역 코드 테이블(region_name, region_code)의 지역명을 하나의
+    Aho-Corasick 오토마톤으로 묶어, 주소 문자열을 한 번만 훑어 테이블별 코드를 찾는다.
+    테이블마다 "주소에 포함된 지역명 중 파일상 가장 앞 행" 을 반환 (기존 순차 탐색과 동일).
+    """
+
+    def __init__(self, tables: dict[str, pd.DataFrame]):
+        self.tables = list(tables)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[str, int, str]]] = [[]]
+        # 빈 지역명은 모든 주소에 포함되므로 별도 보관
+        self._always: dict[str, tuple[int, str]] = {}
+
+        for table, df in tables.items():
+            for row_no, (name, code) in enumerate(zip(df["region_name"], df["region_code"])):
+                if not isinstance(name, str):
+                    continue
+                if name == "":
+                    self._always.setdefault(table, (row_no, code))
+                    continue
+                self._add(name, (table, row_no, code))
+        self._build_fail_links()
+
+    def _add(self, pattern: str, output: tuple):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(output)
+
+    def _build_fail_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                if state:
+                    f = self._fail[state]
+                    while f and ch not in self._goto[f]:
+                        f = self._fail[f]
+                    self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def match(self, address: str) -> dict[str, str | None]:
+        """
+        주소 → {테이블 이름: 지역 코드 또는 None}
+        """
+        best: dict[str, tuple[int, str]] = dict(self._always)
+        if isinstance(address, str):
+            goto, fail, out = self._goto, self._fail, self._out
+            state = 0
+            for ch in address:
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+                for table, row_no, code in out[state]:
+                    current = best.get(table)
+                    if current is None or row_no < current[0]:
+                        best[table] = (row_no, code)
+        return {table: best[table][1] if table in best else None for table in self.tables}
@@ -0,0 +1,224 @@
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+
+from dotenv import load_dotenv
+from spot.forecast_store import ForecastStore
+from spot.refresh_engine import spot_route
+
+load_dotenv()
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  인기도 기반 갱신 우선순위
+#  • 낚시터 점수 = 즐겨찾기 수 × 5 + 게시글 연결 수 × 2 + 최근 /api/weather 조회 수 (24시간 반감기)
+#  • 격자 예보(초단기/단기) 갱신 시 인기 상위 낚시터의 격자는 매 발표마다,
+#    나머지는 (1 + 점수) × 경과 시간 순으로 시간당 호출 예산 안에서만 갱신
+#  • 조회 수와 남은 예산은 ForecastStore(SQLite)에 두어 여러 워커 프로세스가 공유
+#  • 예산은 격자 구역(초단기/단기)에만 적용. 중기 예보(지역 코드 수만큼)와 주간 어종 갱신은
+#    호출 수가 적어 예산 밖에서 발표마다 전체 갱신 (호스트별 요청 속도 제한만 적용)
+# ─────────────────────────────────────────────────────────────────────────────
+REFRESH_HOURLY_CALL_BUDGET = int(os.getenv("REFRESH_HOURLY_CALL_BUDGET", "1000"))  # 예보 구역별 시간당 KMA 호출
+REFRESH_HOT_SPOTS          = int(os.getenv("REFRESH_HOT_SPOTS", "300"))            # 매 발표마다 갱신할 상위 낚시터 수
+HIT_HALF_LIFE_SEC          = 24 * 60 * 60
+HIT_MIN_VALUE              = 0.05      # 감쇠 후 이보다 작아진 조회 기록은 삭제
+HIT_FLUSH_SEC              = 30        # 조회 수를 모아 저장소에 반영하는 주기
+DB_COUNTS_TTL_SEC          = 10 * 60
+
+SCORE_WEIGHTS = {"favorites": 5.0, "boards": 2.0, "hits": 1.0}
+
+
+def load_db_counts() -> tuple[dict, dict]:
+    """
+    MySQL 에서 낚시터 이름별 즐겨찾기 수 / 게시글 연결 수 집계
+    """
+    from service_db.db_service import db_connection
+
+    with db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT s.name, COUNT(*) AS cnt
+            FROM favorites f
+            JOIN spot s ON f.spot_id = s.spot_id
+            GROUP BY s.name
+        """)
+        favorites = {row["name"]: row["cnt"] for row in cursor.fetchall()}
+        cursor.execute("""
+            SELECT s.name, COUNT(*) AS cnt
+            FROM board_spot bs
+            JOIN spot s ON bs.spot_id = s.spot_id
+            GROUP BY s.name
+        """)
+        boards = {row["name"]: row["cnt"] for row in cursor.fetchall()}
+        return favorites, boards
+
+
+class SpotPopularity:
+    """
+    낚시터 이름별 인기도 점수 (스레드 안전)
+    store: 조회 수를 공유하는 저장소 (프로세스별로 HIT_FLUSH_SEC 동안 모아서 반영)
+    load_counts: () → (즐겨찾기 수, 게시글 연결 수) 이름별 dict. 실패하면 이전 값 유지
+    """
+
+    def __init__(self, store: ForecastStore, load_counts=load_db_counts, half_life_sec: float = HIT_HALF_LIFE_SEC):
+        self.store = store
+        self.load_counts = load_counts
+        self.decay = math.log(2) / half_life_sec
+        self._lock = threading.Lock()
+        self._pending = defaultdict(float)  # 아직 저장소에 반영하지 않은 이름별 조회 수
+        self._flushed_at = time.time()
+        self._favorites = {}
+        self._boards = {}
+        self._counts_loaded_at = None
+
+    def record_hit(self, name: str):
+        """
+        조회 1회 기록 (실제 낚시터 이름만 넘겨야 함)
+        """
+        with self._lock:
+            self._pending[name] += 1.0
+            due = time.time() - self._flushed_at >= HIT_FLUSH_SEC
+        if due:
+            self.flush()
+
+    def flush(self):
+        """
+        모아둔 조회 수를 저장소에 반영 (감쇠해 HIT_MIN_VALUE 미만이 된 기록은 삭제)
+        """
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(float)
+            self._flushed_at = time.time()
+        if not pending:
+            return
+        try:
+            self.store.add_spot_hits(pending, self.decay, HIT_MIN_VALUE)
+        except sqlite3.Error as e:
+            print(f"[Priority] 조회 수 저장 실패 ({len(pending)}곳): {e}")
+
+    def refresh_counts(self, max_age_sec: float = DB_COUNTS_TTL_SEC):
+        if self._counts_loaded_at is not None and time.time() - self._counts_loaded_at < max_age_sec:
+            return
+        try:
+            favorites, boards = self.load_counts()
+        except Exception as e:
+            print(f"[Priority] 즐겨찾기/게시글 집계 실패, 이전 값 사용: {e}")
+            return
+        with self._lock:
+            self._favorites, self._boards = favorites, boards
+            self._counts_loaded_at = time.time()
+
+    def scores(self) -> dict[str, float]:
+        self.flush()
+        hits = self.store.spot_hits()
+        now = time.time()
+        scores = defaultdict(float)
+        with self._lock:
+            for name, count in self._favorites.items():
+                scores[name] += SCORE_WEIGHTS["favorites"] * count
+            for name, count in self._boards.items():
+                scores[name] += SCORE_WEIGHTS["boards"] * count
+        for name, (value, updated) in hits.items():
+            scores[name] += SCORE_WEIGHTS["hits"] * value * math.exp(-self.decay * (now - updated))
+        return dict(scores)
+
+
+class RefreshPlanner:
+    """
+    격자 예보 갱신 대상 선정 + 예보 구역별 시간당 호출 예산 관리
+    """
+
+    def __init__(
+        self,
+        popularity: SpotPopularity,
+        store: ForecastStore,
+        weather_service,
+        hourly_budget: int = REFRESH_HOURLY_CALL_BUDGET,
+        hot_spots: int = REFRESH_HOT_SPOTS,
+    ):
+        self.popularity = popularity
+        self.store = store
+        self.weather_service = weather_service
+        self.hourly_budget = hourly_budget
+        self.hot_spots = hot_spots
+        self.last_plan = {}
+
+    def _remaining(self, budget: dict, section: str, capacity: float, now: float) -> float:
+        remaining, updated = budget.get(section, (capacity, now))
+        return min(capacity, remaining + self.hourly_budget * (now - updated) / 3600)
+
+    def available(self, sections: tuple[str, ...], period_hours: float = 1.0) -> int:
+        """
+        남은 예산으로 갱신 가능한 격자 수 (격자 하나 = 구역마다 호출 1회).
+        발표 주기(period_hours) 동안 채워지는 만큼까지만 쌓임
+        """
+        budget = self.store.call_budget()
+        now = time.time()
+        capacity = self.hourly_budget * period_hours
+        return int(min(self._remaining(budget, section, capacity, now) for section in sections))
+
+    def record_calls(self, sections: tuple[str, ...], calls: int, period_hours: float = 1.0):
+        """
+        실제 호출 수만큼 예산 차감 (재시도로 초과하면 다음 실행에서 덜 갱신)
+        """
+        self.store.spend_call_budget(sections, calls, self.hourly_budget * period_hours, self.hourly_budget)
+
+    def select(self, records: list[dict], sections: tuple[str, ...], period_hours: float = 1.0) -> list[dict]:
+        """
+        갱신할 낚시터 선정 (같은 격자의 낚시터는 함께 선정/제외)
+        1) 인기 상위 hot_spots 곳이 속한 격자: 점수 순
+        2) 나머지 격자: (1 + 점수 합) × 마지막 갱신 후 경과 시간 순 (갱신 기록 없으면 최우선)
+        """
+        self.popularity.refresh_counts()
+        scores = self.popularity.scores()
+        now = time.time()
+
+        cells = defaultdict(list)
+        for record in records:
+            cells[spot_route(record, self.weather_service)[:2]].append(record)
+
+        cell_score = {cell: sum(scores.get(r.get("name"), 0.0) for r in members) for cell, members in cells.items()}
+        hot_names = {
+            name for name, score in sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:self.hot_spots]
+            if score > 0
+        }
+        hot_cells = sorted(
+            (cell for cell, members in cells.items() if any(r.get("name") in hot_names for r in members)),
+            key=lambda cell: cell_score[cell],
+            reverse=True,
+        )
+
+        refreshed_at = self.store.grid_refreshed_at(sections)
+        hot_set = set(hot_cells)
+        cold_cells = sorted(
+            (cell for cell in cells if cell not in hot_set),
+            key=lambda cell: (1 + cell_score[cell]) * (now - refreshed_at[cell]) if cell in refreshed_at else math.inf,
+            reverse=True,
+        )
+
+        budget = max(0, self.available(sections, period_hours))
+        chosen = (hot_cells + cold_cells)[:budget]
+        self.last_plan["/".join(sections)] = {
+            "planned_at": now,
+            "cells_total": len(cells),
+            "cells_selected": len(chosen),
+            "cells_hot": len(hot_cells),
+            "cells_deferred": len(cells) - len(chosen),
+            "budget_cells": budget,
+        }
+        print(
+            f"[Priority] {'/'.join(sections)}: 격자 {len(cells)}개 중 {len(chosen)}개 갱신 "
+            f"(인기 {len(hot_cells)}개, 예산 {budget}개, 보류 {len(cells) - len(chosen)}개)"
+        )
+        return [record for cell in chosen for record in cells[cell]]
+
+    def status(self) -> dict:
+        remaining = {section: round(remaining) for section, (remaining, _) in self.store.call_budget().items()}
+        top = sorted(self.popularity.scores().items(), key=lambda kv: kv[1], reverse=True)[:20]
+        return {
+            "hourly_budget": self.hourly_budget,
+            "remaining_calls": remaining,
+            "hot_spots": self.hot_spots,
+            "last_plan": self.last_plan,
+            "top_spots": [{"name": name, "score": round(score, 2)} for name, score in top],
+        }
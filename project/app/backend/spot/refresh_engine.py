@@ -0,0 +1,384 @@
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+import pandas as pd
+from dotenv import load_dotenv
+from fish.const import BASE_URL as FISH_BASE_URL
+from spot.forecast_store import FAILED, MID_CODE_INDEX, RESUME_MAX_AGE_SEC, ForecastStore, spot_key
+from spot.service import spot_address
+from transport import HTTPTransport, TokenBucket, transport as default_transport
+from weather.const import KMA_URL
+from weather.service import GRID_SECTIONS
+
+load_dotenv()
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  낚시터 갱신 엔진
+#  • 고유 격자 / 고유 중기 지역 / 낚시터별 어종 조회를 작업 단위로 나눠 워커 풀에서 병렬 처리
+#  • 호스트(KMA, EcoBank)별 초당 호출 수 제한은 엔진마다 따로 두고 워커 스레드의 요청에만 적용
+#    → 실제 HTTP 요청 1건마다 토큰 1개 (캐시/로컬 지점 인덱스가 응답하면 사용 안 함, 페이지 조회는 페이지마다)
+#    → 같은 연결 풀을 쓰는 /api/weather, /api/fish 요청은 갱신 작업의 호출 제한을 기다리지 않음
+#  • 실패 시 지수 백오프 + 지터 후 재시도, 끝내 실패하면 '조회 실패' 기록
+#  • 작업 결과는 저장소 저널에 체크포인트, 전부 끝나면 한 번에 반영 (중단 시 다음 실행이 이어받음)
+# ─────────────────────────────────────────────────────────────────────────────
+REFRESH_WORKERS  = int(os.getenv("REFRESH_WORKERS", "8"))
+KMA_RATE_LIMIT   = float(os.getenv("KMA_RATE_LIMIT", "10"))     # apis.data.go.kr 초당 호출 수
+FISH_RATE_LIMIT  = float(os.getenv("FISH_RATE_LIMIT", "5"))     # nie-ecobank.kr 초당 호출 수
+BACKOFF_BASE     = 1.0                                          # 첫 재시도 대기 상한 (초)
+BACKOFF_CAP      = 30.0                                         # 재시도 대기 최대 (초)
+
+HOST_KMA = urlsplit(KMA_URL).hostname
+HOST_FISH = urlsplit(FISH_BASE_URL).hostname
+
+# 갱신 구역: 격자 예보(ultra, short) + 중기 예보(mid)
+WEATHER_SECTIONS = GRID_SECTIONS + ("mid",)
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP) -> float:
+    """
+    지수 백오프 + 전체 지터: 0 ~ min(cap, base * 2^(attempt-1)) 사이 임의 값
+    """
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class RefreshStats:
+    """
+    작업 종류(grid / mid / fish)별 성공·실패·시도 횟수와 호출 지연 집계 (스레드 안전)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.counts = defaultdict(lambda: {"tasks": 0, "ok": 0, "failed": 0, "attempts": 0})
+        self.latencies = defaultdict(list)
+
+    def record_attempt(self, kind: str, elapsed: float):
+        with self._lock:
+            self.counts[kind]["attempts"] += 1
+            self.latencies[kind].append(elapsed)
+
+    def record_result(self, kind: str, ok: bool):
+        with self._lock:
+            self.counts[kind]["tasks"] += 1
+            self.counts[kind]["ok" if ok else "failed"] += 1
+
+    def summary(self, spots: int) -> dict:
+        elapsed = time.perf_counter() - self.started
+        kinds = {}
+        with self._lock:
+            for kind, counts in self.counts.items():
+                latencies = self.latencies[kind]
+                kinds[kind] = {
+                    **counts,
+                    "latency_avg_ms": round(sum(latencies) / len(latencies) * 1000, 1) if latencies else 0.0,
+                    "latency_p50_ms": round(_percentile(latencies, 0.5) * 1000, 1),
+                    "latency_p95_ms": round(_percentile(latencies, 0.95) * 1000, 1),
+                    "latency_max_ms": round(max(latencies) * 1000, 1) if latencies else 0.0,
+                }
+        attempts = sum(k["attempts"] for k in kinds.values())
+        return {
+            "spots": spots,
+            "elapsed_sec": round(elapsed, 2),
+            "spots_per_sec": round(spots / elapsed, 2) if elapsed else 0.0,
+            "calls_per_sec": round(attempts / elapsed, 2) if elapsed else 0.0,
+            "tasks": kinds,
+        }
+
+
+class RefreshEngine:
+    def __init__(
+        self,
+        weather_service,
+        fish_service,
+        store: ForecastStore,
+        workers: int = REFRESH_WORKERS,
+        max_retry: int = 3,
+        backoff_base: float = BACKOFF_BASE,
+        rate_limits: dict | None = None,
+        transport: HTTPTransport = default_transport,
+    ):
+        self.weather_service = weather_service
+        self.fish_service = fish_service
+        self.store = store
+        self.workers = workers
+        self.max_retry = max_retry
+        self.backoff_base = backoff_base
+        self.transport = transport
+        limits = {HOST_KMA: KMA_RATE_LIMIT, HOST_FISH: FISH_RATE_LIMIT, **(rate_limits or {})}
+        self.buckets = {host: TokenBucket(rate) for host, rate in limits.items()}
+
+    # ------------------------------------------------------------------
+    # 공통: 호출 제한 + 재시도
+    # ------------------------------------------------------------------
+    def _call(self, stats: RefreshStats, kind: str, label: str, fetch, is_valid):
+        """
+        fetch()를 최대 max_retry회 시도, is_valid(result)가 참이면 결과 반환, 끝내 실패하면 None
+        (호출 제한 대기는 fetch 안의 HTTP 요청마다 transport 에서)
+        """
+        for attempt in range(1, self.max_retry + 1):
+            start = time.perf_counter()
+            try:
+                result = fetch()
+                ok = is_valid(result)
+            except Exception as e:
+                result, ok, error = None, False, e
+            else:
+                error = None if ok else ValueError("빈 데이터 또는 오류 응답")
+            stats.record_attempt(kind, time.perf_counter() - start)
+
+            if ok:
+                return result
+            print(f"{label} 조회 실패 (시도 {attempt}/{self.max_retry}): {error}")
+            if attempt < self.max_retry:
+                time.sleep(backoff_delay(attempt, self.backoff_base))
+        return None
+
+    # ------------------------------------------------------------------
+    # 작업 단위: 결과 (성공 여부, 반영할 값)를 저널에 체크포인트한 뒤 반환
+    # ------------------------------------------------------------------
+    def _grid_task(self, stats: RefreshStats, run_id: str, nx: int, ny: int, members: int, include: tuple) -> tuple:
+        # 요청한 격자 예보(초단기/단기)가 모두 있어야 성공
+        grid = self._call(
+            stats, "grid",
+            f"[격자 {nx},{ny} / {members}곳] 날씨",
+            lambda: self.weather_service.fetch_grid_forecasts(nx, ny, include),
+            lambda r: bool(r and all(r.get(section) for section in include)),
+        )
+        return self._finish(stats, run_id, "grid", _grid_key(nx, ny), grid is not None, grid)
+
+    def _mid_task(self, stats: RefreshStats, run_id: str, codes: tuple, members: int) -> tuple:
+        # 지역 코드가 있는 구역(육상/기온/해상)이 모두 있어야 성공, 끝내 실패하면 {} (저장소는 이전 예보 유지)
+        mid = self._call(
+            stats, "mid",
+            f"[중기 {'/'.join(str(c) for c in codes)} / {members}곳] 날씨",
+            lambda: self.weather_service.fetch_mid_forecasts(*codes),
+            lambda r: _mid_complete(r, codes),
+        )
+        return self._finish(
+            stats, run_id, "mid", _mid_key(codes), mid is not None, mid or {"land": {}, "ta": {}, "sea": {}}
+        )
+
+    def _fish_task(self, stats: RefreshStats, run_id: str, record: dict, mark_failed: bool) -> tuple:
+        # 조회 오류는 예외로 올라와 재시도 / '조회 실패' 처리 (빈 목록은 '없음')
+        fish_result = self._call(
+            stats, "fish",
+            f"[{record['name']}] 어종",
+            lambda: self.fish_service.get_fish_by_coordinates(record["lat"], record["lon"]),
+            lambda r: isinstance(r, list),
+        )
+        if fish_result is not None:
+            fish_names = sorted(set(f.get("spcs_korean_nm", "") for f in fish_result if f.get("spcs_korean_nm")))
+            fish_list = ", ".join(fish_names) if fish_names else "없음"
+        else:
+            # 재시도 실행에서는 기존 '조회 실패' 유지 (반영할 값 없음)
+            fish_list = FAILED if mark_failed else None
+        return self._finish(stats, run_id, "fish", spot_key(record), fish_result is not None, fish_list)
+
+    def _finish(self, stats: RefreshStats, run_id: str, kind: str, task_key: str, ok: bool, payload) -> tuple:
+        self.store.checkpoint(run_id, kind, task_key, ok, payload)
+        stats.record_result(kind, ok)
+        return ok, payload
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    def refresh(
+        self,
+        weather_records: list[dict],
+        fish_records: list[dict],
+        mark_fish_failed: bool = True,
+        run_name: str = "full",
+        sections: tuple[str, ...] = WEATHER_SECTIONS,
+        resume_max_age: float = RESUME_MAX_AGE_SEC,
+    ) -> dict:
+        """
+        weather_records: 날씨를 갱신할 낚시터, fish_records: 어종을 갱신할 낚시터
+        mark_fish_failed: 어종 조회가 끝내 실패하면 '조회 실패' 기록 (재시도 실행에서는 기존 값 유지)
+        run_name: 같은 이름의 미완료 실행이 resume_max_age 초 이내에 남아 있으면
+                  저널에 기록된 작업은 건너뛰고 이어서 진행
+        sections: 갱신할 날씨 구역 ("ultra", "short", "mid" 중 일부, 발표 주기별 갱신용)
+        모든 작업이 끝나면 결과를 저장소에 한 번에 반영.
+        반환: 호출 절감 + 처리량/지연 통계
+        """
+        stats = RefreshStats()
+        waited_before = {host: bucket.waited for host, bucket in self.buckets.items()}
+        run_id, done = self.store.begin_run(run_name, resume_max_age)
+        grid_sections = tuple(s for s in GRID_SECTIONS if s in sections)
+        with_mid = "mid" in sections
+
+        grid_groups = defaultdict(list)
+        region_groups = defaultdict(list)
+        route_of = {}
+        for record in weather_records:
+            route = spot_route(record, self.weather_service)
+            key = spot_key(record)
+            grid_groups[route[:2]].append(key)
+            region_groups[route[2:]].append(key)
+            route_of[key] = route
+
+        print(
+            f"\n낚시터 {len(weather_records)}곳 → 고유 격자 {len(grid_groups)}개, "
+            f"고유 중기 지역 {len(region_groups)}개, 어종 {len(fish_records)}곳 (워커 {self.workers}개)"
+        )
+        if done:
+            print(f"이전 실행 이어받기: 체크포인트된 작업 {len(done)}개 건너뜀")
+
+        # (kind, task_key) → (성공 여부, 반영할 값). 저널에 있는 작업은 다시 조회하지 않음
+        results = {}
+        with ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="spot-refresh",
+            initializer=self.transport.use_rate_limits,
+            initargs=(self.buckets,),
+        ) as pool:
+            futures = {}
+            for (nx, ny), members in grid_groups.items():
+                if not grid_sections:
+                    break
+                task = ("grid", _grid_key(nx, ny))
+                if task in done:
+                    results[task] = done[task]
+                else:
+                    futures[pool.submit(self._grid_task, stats, run_id, nx, ny, len(members), grid_sections)] = task
+            for codes, members in region_groups.items():
+                if not with_mid or not any(codes):
+                    continue
+                task = ("mid", _mid_key(codes))
+                if task in done:
+                    results[task] = done[task]
+                else:
+                    futures[pool.submit(self._mid_task, stats, run_id, codes, len(members))] = task
+            for record in fish_records:
+                task = ("fish", spot_key(record))
+                if task in done:
+                    results[task] = done[task]
+                else:
+                    futures[pool.submit(self._fish_task, stats, run_id, record, mark_fish_failed)] = task
+
+            # 저장소 쓰기 오류 등 작업 밖 예외는 그대로 전파 (저널은 남아 다음 실행이 이어받음)
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        # 결과를 한 트랜잭션으로 반영: 낚시터별 조회와 같이 이번에 갱신한 격자/중기 예보가
+        # 하나라도 실패한 낚시터는 '조회 실패'. 중기만 갱신하는 실행은 실패만 기록
+        # (성공으로 덮어쓰면 다른 실행에서 실패한 격자 예보 상태가 지워짐)
+        grid_ok = {}
+        if grid_sections:
+            grid_ok = {cell: results[("grid", _grid_key(*cell))][0] for cell in grid_groups}
+        mid_ok = {}
+        if with_mid:
+            mid_ok = {codes: results[("mid", _mid_key(codes))][0] for codes in region_groups if any(codes)}
+        weather_ok = {
+            key: grid_ok.get(route[:2], True) and mid_ok.get(route[2:], True) for key, route in route_of.items()
+        }
+        self.store.publish(
+            run_id,
+            grids={cell: results[("grid", _grid_key(*cell))][1] for cell, ok in grid_ok.items() if ok},
+            mids={
+                codes: results[("mid", _mid_key(codes))][1]
+                for codes in region_groups if with_mid and any(codes)
+            },
+            statuses=[
+                (key, route, weather_ok[key])
+                for key, route in route_of.items() if grid_ok or not weather_ok[key]
+            ],
+            fish=[
+                (task_key, payload)
+                for (kind, task_key), (ok, payload) in results.items()
+                if kind == "fish" and payload is not None
+            ],
+        )
+
+        # 호출 횟수 비교 (1회 시도 기준): 낚시터별 조회 vs 격자/지역별 조회
+        mid_calls = {codes: sum(1 for c in codes if c) if with_mid else 0 for codes in region_groups}
+        naive_calls = len(grid_sections) * len(weather_records) + sum(
+            mid_calls[codes] * len(members) for codes, members in region_groups.items()
+        )
+        actual_calls = len(grid_sections) * len(grid_groups) + sum(mid_calls.values())
+
+        summary = stats.summary(len({spot_key(r) for r in weather_records + fish_records}))
+        result = {
+            "spots": summary.pop("spots"),
+            "grid_cells": len(grid_groups),
+            "regions": len(region_groups),
+            "calls_naive": naive_calls,
+            "calls_actual": actual_calls,
+            "calls_saved": naive_calls - actual_calls,
+            "resumed_tasks": len(done),
+            **summary,
+            # 이 실행 동안 호스트별 호출 제한 대기
+            "throttled_sec": {
+                host: round(bucket.waited - waited_before[host], 2) for host, bucket in self.buckets.items()
+            },
+            # 끝내 실패한 낚시터 (스케줄러의 재시도 패스용)
+            "failed": {
+                "weather": [key for key, route in route_of.items() if grid_ok and not grid_ok[route[:2]]],
+                "mid": [
+                    key
+                    for codes, members in region_groups.items()
+                    if with_mid and any(codes) and not results[("mid", _mid_key(codes))][0]
+                    for key in members
+                ],
+                "fish": [
+                    task_key for (kind, task_key), (ok, _) in results.items() if kind == "fish" and not ok
+                ],
+            },
+        }
+        _print_summary(result)
+        return result
+
+
+def _grid_key(nx: int, ny: int) -> str:
+    return f"{nx},{ny}"
+
+
+def _mid_key(codes: tuple) -> str:
+    return "|".join(c or "" for c in codes)
+
+
+def _mid_complete(mid, codes: tuple) -> bool:
+    return isinstance(mid, dict) and all(
+        mid.get(section) for section, index in MID_CODE_INDEX.items() if codes[index]
+    )
+
+
+def spot_route(row, weather_service) -> tuple:
+    """
+    낚시터 → (nx, ny, land, temp, sea)
+    CSV에 미리 저장된 예보 경로(spot.routing)가 있으면 사용, 없으면 위경도/주소로 계산
+    """
+    if pd.notna(row.get("nx")) and pd.notna(row.get("ny")):
+        codes = [row.get(c) for c in ["land_code", "temp_code", "sea_code"]]
+        codes = [c if isinstance(c, str) and c else None for c in codes]
+        return (int(row["nx"]), int(row["ny"]), *codes)
+    return weather_service.resolve_route(row["lat"], row["lon"], spot_address(row))
+
+
+def _print_summary(result: dict):
+    print(
+        f"\nKMA 호출 {result['calls_naive']}회 → {result['calls_actual']}회 ({result['calls_saved']}회 절감)"
+    )
+    print(
+        f"낚시터 {result['spots']}곳, {result['elapsed_sec']}초 "
+        f"({result['spots_per_sec']}곳/초, 호출 {result['calls_per_sec']}회/초)"
+    )
+    for kind, t in result["tasks"].items():
+        print(
+            f"  {kind:<5} 작업 {t['tasks']}개 (성공 {t['ok']}, 실패 {t['failed']}, 시도 {t['attempts']}) "
+            f"지연 평균 {t['latency_avg_ms']}ms / p50 {t['latency_p50_ms']}ms / "
+            f"p95 {t['latency_p95_ms']}ms / 최대 {t['latency_max_ms']}ms"
+        )
+    for host, waited in result["throttled_sec"].items():
+        print(f"  호출 제한 대기 {host}: {waited}초")
@@ -0,0 +1,64 @@
+import gzip
+import threading
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip/원본만 제공
+    brotli = None
+
+from spot.service import FishingSpotService
+
+# 뷰 이름 → FishingSpotService 조회 메서드
+SPOT_VIEWS = {
+    "all": "get_all_spots",
+    "boat": "get_sea_spots",
+    "indoor": "get_ground_spots",
+}
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 9
+
+
+class EncodedResponse:
+    """
+    한 뷰의 직렬화 결과: 원본/gzip/brotli 바이트 + ETag
+    """
+
+    def __init__(self, etag: str, body: bytes):
+        self.etag = etag
+        self.bodies = {"identity": body, "gzip": gzip.compress(body, compresslevel=GZIP_LEVEL)}
+        if brotli is not None:
+            self.bodies["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+
+
+class SpotResponseCache:
+    """
+    /api/spots 계열 응답 바이트를 데이터셋 버전마다 한 번만 만들어 재사용.
+    • dumps: 객체 → JSON 문자열 (app.py 의 기존 직렬화 방식 그대로 전달)
+    • 데이터셋 버전이 바뀌면 (spot_service.reload) 다음 요청에서 새로 생성
+    """
+
+    def __init__(self, spot_service: FishingSpotService, dumps):
+        self.spot_service = spot_service
+        self.dumps = dumps
+        self._lock = threading.Lock()
+        self._version = None
+        self._entries: dict[str, EncodedResponse] = {}
+
+    def get(self, view: str) -> EncodedResponse:
+        version = self.spot_service.version
+        entry = self._entries.get(view) if self._version == version else None
+        if entry is not None:
+            return entry
+
+        with self._lock:
+            if self._version != version:
+                self._version = version
+                self._entries = {}
+            entry = self._entries.get(view)
+            if entry is None:
+                data = getattr(self.spot_service, SPOT_VIEWS[view])()
+                body = self.dumps(data).encode("utf-8")
+                entry = EncodedResponse(f"{version}-{view}", body)
+                self._entries[view] = entry
+            return entry
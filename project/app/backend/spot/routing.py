@@ -0,0 +1,29 @@
+import os
+
+from spot.service import FishingSpotService, ROUTE_COLUMNS
+
+
+def build_routing_table(spot_service: FishingSpotService | None = None) -> int:
+    """
+    낚시터별 예보 경로(nx, ny, land_code, temp_code, sea_code)를 다시 계산해
+    낚시터 CSV 컬럼으로 저장 (데이터셋 배포 시 1회 실행). 반환: 경로가 채워진 낚시터 수
+    """
+    spot_service = spot_service or FishingSpotService()
+    df = spot_service.df.drop(columns=ROUTE_COLUMNS)
+    df = spot_service.with_routes(df)
+    df["nx"] = df["nx"].astype("Int64")
+    df["ny"] = df["ny"].astype("Int64")
+
+    tmp_path = spot_service.file_path + ".tmp"
+    df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+    os.replace(tmp_path, spot_service.file_path)
+    spot_service.reload()
+
+    filled = int(df["nx"].notna().sum())
+    print(f"[Routing] 낚시터 {len(df)}곳 중 {filled}곳 경로 저장: {spot_service.file_path}")
+    return filled
+
+
+if __name__ == "__main__":
+    # 실행 (backend 디렉터리에서): python -m spot.routing
+    build_routing_table()
@@ -0,0 +1,285 @@
+import os
+import threading
+import time
+import traceback
+from datetime import datetime
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from dotenv import load_dotenv
+
+from spot.forecast_store import spot_key
+from spot.priority import RefreshPlanner, SpotPopularity
+from spot.refresh_engine import RefreshEngine
+from weather.client import KST, get_base_datetime_mid, get_base_datetime_short, get_base_datetime_ultra
+from weather.service import GRID_SECTIONS
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경: 프로세스 내 잠금만 사용
+    fcntl = None
+
+load_dotenv()
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  낚시터 갱신 스케줄러
+#  KMA 발표 주기(get_base_datetime_*)가 다음 발표로 넘어간 직후에 해당 구역만 갱신
+#  • ultra: 매시 :45 (HH:40 이후 HH00 발표 사용)
+#  • short: 02/05/08/11/14/17/20/23시 :15
+#  • mid  : 06:30 / 18:30
+#  • fish : 월요일 04:00 어류 조사 지점 수집 후 낚시터별 어종 갱신
+#  실행 시각에 지터를 더하고, 잠금으로 두 실행이 겹치지 않게 하며 (여러 워커 프로세스 포함),
+#  실패한 낚시터는 제한된 횟수만큼 재시도 패스를 돌림.
+#  이미 갱신을 마친 발표는 다시 갱신하지 않음 (저장소의 refresh_issuance, 다른 프로세스가 마친 실행 포함).
+#  스케줄러는 REFRESH_SCHEDULER=1 인 프로세스에서만 시작 (gunicorn 등 여러 워커로 띄울 때는 한 프로세스만 1)
+#  popularity 가 주어지면 격자 예보 갱신 대상을 인기도 + 시간당 호출 예산으로 선정 (spot.priority)
+# ─────────────────────────────────────────────────────────────────────────────
+REFRESH_JITTER_SEC   = int(os.getenv("REFRESH_JITTER_SEC", "120"))     # 발표 직후 몰림 방지 (최대 지연)
+REFRESH_RETRY_PASSES = int(os.getenv("REFRESH_RETRY_PASSES", "1"))     # 실패 낚시터 재시도 패스 횟수
+REFRESH_SCHEDULER    = os.getenv("REFRESH_SCHEDULER", "1") == "1"      # 이 프로세스에서 스케줄러 시작 여부
+REFRESH_LOCK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dataset", "forecast", "refresh.lock")
+
+def _fish_issuance() -> tuple[str, str]:
+    # 어종 갱신은 주 1회: (연도, ISO 주차)
+    year, week, _ = datetime.now(KST).isocalendar()
+    return str(year), f"W{week:02d}"
+
+
+# 작업 id → cron 설정, 갱신 구역, 실행 주기 (시간), 어종 갱신 여부, 미완료 run 이어받기 허용 시간 (초),
+#           현재 발표 (날짜, 시각) 함수
+REFRESH_JOBS = {
+    "ultra": {
+        "cron": {"minute": 45},
+        "sections": ("ultra",),
+        "period_hours": 1,
+        "fish": False,
+        "resume_max_age": 20 * 60,
+        "issuance": get_base_datetime_ultra,
+    },
+    "short": {
+        "cron": {"hour": "2,5,8,11,14,17,20,23", "minute": 15},
+        "sections": ("short",),
+        "period_hours": 3,
+        "fish": False,
+        "resume_max_age": 60 * 60,
+        "issuance": get_base_datetime_short,
+    },
+    "mid": {
+        "cron": {"hour": "6,18", "minute": 30},
+        "sections": ("mid",),
+        "period_hours": 12,
+        "fish": False,
+        "resume_max_age": 3 * 60 * 60,
+        "issuance": get_base_datetime_mid,
+    },
+    "fish": {
+        "cron": {"day_of_week": "mon", "hour": 4},
+        "sections": (),
+        "period_hours": 24 * 7,
+        "fish": True,
+        "resume_max_age": 6 * 60 * 60,
+        "issuance": _fish_issuance,
+    },
+}
+
+
+class RefreshLock:
+    """
+    겹치지 않는 실행 보장: 프로세스 내 잠금 + (가능하면) 파일 잠금으로 다른 워커 프로세스와도 배제.
+    acquire()는 기다리지 않고 바로 성공 여부를 반환
+    """
+
+    def __init__(self, path: str = REFRESH_LOCK_PATH):
+        self.path = path
+        self._thread_lock = threading.Lock()
+        self._file = None
+
+    def acquire(self) -> bool:
+        if not self._thread_lock.acquire(blocking=False):
+            return False
+        if fcntl is None:
+            return True
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._file = open(self.path, "a")
+            fcntl.flock(self._file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._thread_lock.release()
+            return False
+
+    def release(self):
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+
+class RefreshScheduler:
+    def __init__(
+        self,
+        weather_service,
+        fish_service,
+        harvest=None,
+        popularity: SpotPopularity | None = None,
+        jitter_sec: int = REFRESH_JITTER_SEC,
+        retry_passes: int = REFRESH_RETRY_PASSES,
+        timezone: str = "Asia/Seoul",
+    ):
+        """
+        harvest: fish 작업 전에 실행할 어류 조사 지점 수집 함수 (없으면 생략)
+        popularity: 낚시터 인기도 (없으면 매 발표마다 전체 낚시터 갱신)
+        """
+        self.spot_service = weather_service.spot_service
+        self.engine = RefreshEngine(weather_service, fish_service, self.spot_service.store)
+        self.harvest = harvest
+        self.planner = None
+        if popularity is not None:
+            self.planner = RefreshPlanner(popularity, self.spot_service.store, weather_service)
+        self.jitter_sec = jitter_sec
+        self.retry_passes = retry_passes
+        self.lock = RefreshLock()
+        self.scheduler = BackgroundScheduler(timezone=timezone)
+        self._status = {job_id: {"runs": 0, "skipped": 0} for job_id in REFRESH_JOBS}
+
+    def start(self):
+        for job_id, job in REFRESH_JOBS.items():
+            self.scheduler.add_job(
+                self.run_job,
+                "cron",
+                args=[job_id],
+                id=job_id,
+                jitter=self.jitter_sec,
+                max_instances=1,
+                coalesce=True,
+                misfire_grace_time=10 * 60,
+                **job["cron"],
+            )
+        self.scheduler.start()
+
+    def shutdown(self):
+        self.scheduler.shutdown(wait=False)
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    def run_job(self, job_id: str) -> dict | None:
+        """
+        작업 하나 실행. 다른 실행이 진행 중이거나 현재 발표를 이미 갱신했으면 건너뜀 (None 반환)
+        """
+        status = self._status[job_id]
+        if not self.lock.acquire():
+            self._skip(status, f"[Scheduler] {job_id}: 다른 갱신이 진행 중이라 건너뜀")
+            return None
+
+        # 잠금을 잡은 뒤 확인 (지터로 늦게 깨어난 다른 프로세스가 방금 끝난 갱신을 반복하지 않도록)
+        job = REFRESH_JOBS[job_id]
+        issuance = "".join(job["issuance"]())
+        if self.spot_service.store.completed_issuance(job_id) == issuance:
+            self.lock.release()
+            self._skip(status, f"[Scheduler] {job_id}: 발표 {issuance} 갱신이 이미 끝나 건너뜀")
+            return None
+
+        started = time.time()
+        status.update({"running": True, "last_started_at": started})
+        try:
+            if job["fish"] and self.harvest is not None:
+                self.harvest()
+
+            # 낚시터 CSV가 바뀌었으면 새 버전으로 교체한 뒤 갱신
+            self.spot_service.reload_if_changed()
+            records = self.spot_service.index.records
+            weather_records = records
+            grid_sections = tuple(section for section in job["sections"] if section in GRID_SECTIONS)
+            if self.planner is not None and grid_sections:
+                weather_records = self.planner.select(records, grid_sections, job["period_hours"])
+            result = self._refresh(job_id, job, weather_records, records, mark_fish_failed=True)
+
+            # 실패한 낚시터만 제한된 횟수만큼 다시 시도 (어종은 기존 '조회 실패' 유지)
+            retries = 0
+            while retries < self.retry_passes and any(result["failed"].values()):
+                retries += 1
+                by_key = {spot_key(r): r for r in records}
+                failed = result["failed"]
+                weather_keys = set(failed["weather"]) | set(failed["mid"])
+                print(f"[Scheduler] {job_id}: 재시도 패스 {retries}/{self.retry_passes}")
+                result = self._refresh(
+                    f"{job_id}-retry",
+                    job,
+                    [by_key[k] for k in weather_keys if k in by_key],
+                    [by_key[k] for k in failed["fish"] if k in by_key],
+                    mark_fish_failed=False,
+                )
+
+            # 남은 실패 낚시터는 다음 발표 갱신 / 재시도 패스에서 다시 조회
+            self.spot_service.store.complete_issuance(job_id, issuance)
+            status.update({
+                "last_issuance": issuance,
+                "last_result": "ok" if not any(result["failed"].values()) else "partial",
+                "last_error": None,
+                "last_retry_passes": retries,
+                "last_failed": {kind: len(keys) for kind, keys in result["failed"].items()},
+                "last_success_at": time.time(),
+            })
+            return result
+        except Exception as e:
+            traceback.print_exc()
+            status.update({"last_result": "error", "last_error": str(e)})
+        finally:
+            finished = time.time()
+            status.update({
+                "running": False,
+                "runs": status["runs"] + 1,
+                "last_finished_at": finished,
+                "last_duration_sec": round(finished - started, 2),
+            })
+            self.lock.release()
+
+    @staticmethod
+    def _skip(status: dict, message: str):
+        status["skipped"] += 1
+        status["last_skipped_at"] = time.time()
+        print(message)
+
+    def _refresh(self, run_name: str, job: dict, weather_records: list, fish_records: list, mark_fish_failed: bool) -> dict:
+        result = self.engine.refresh(
+            weather_records if job["sections"] else [],
+            fish_records if job["fish"] else [],
+            mark_fish_failed=mark_fish_failed,
+            run_name=run_name,
+            sections=job["sections"],
+            resume_max_age=job["resume_max_age"],
+        )
+        # 실제 격자 조회 횟수를 시간당 예산에 반영 (재시도 포함)
+        grid_sections = tuple(section for section in job["sections"] if section in GRID_SECTIONS)
+        if self.planner is not None and grid_sections:
+            attempts = result["tasks"].get("grid", {}).get("attempts", 0)
+            self.planner.record_calls(grid_sections, attempts, job["period_hours"])
+        return result
+
+    # ------------------------------------------------------------------
+    # 상태
+    # ------------------------------------------------------------------
+    def status(self) -> dict:
+        """
+        작업별 최근 실행 결과 + 신선도 (+ 우선순위 선정 현황).
+        staleness_sec 은 저장소 기준 (다른 워커 프로세스가 반영한 실행 포함)
+        """
+        now = time.time()
+        result = {}
+        for job_id in REFRESH_JOBS:
+            status = dict(self._status[job_id])
+            published = self.spot_service.store.last_published(job_id)
+            if published is not None:
+                status["last_published_at"] = published["published_at"]
+                status["staleness_sec"] = round(now - published["published_at"], 1)
+            else:
+                status["last_published_at"] = None
+                status["staleness_sec"] = None
+            job = self.scheduler.get_job(job_id) if self.scheduler.running else None
+            status["next_run_at"] = job.next_run_time.isoformat() if job and job.next_run_time else None
+            result[job_id] = status
+        return {"jobs": result, "priority": self.planner.status() if self.planner is not None else None}
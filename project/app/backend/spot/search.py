@@ -0,0 +1,194 @@
+import heapq
+import re
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  낚시터 이름 검색 인덱스 (메모리)
+#  • 이름을 정규화(소문자, 공백/기호 제거)한 문자열의 1-gram / 2-gram 역색인
+#  • 한글 음절은 초성으로 바꾼 문자열도 같은 방식으로 색인 ("ㅂㅅ" → 부산…)
+#  • 순위: 완전 일치 > 접두 일치 > 단어 시작 일치 > 그 밖의 위치, 같은 등급은 앞쪽 위치 > 짧은 이름 > 이름
+#  • 레코드를 (이름 길이, 이름) 순으로 번호를 매기고, n-gram 게시 목록을 (등급, 위치)별로 나눠 두어
+#    질의 첫 n-gram 의 목록을 순위 순서대로 훑다가 limit 건이 차면 멈춤 ("낚시"처럼 흔한 질의도 상위 몇 건만 확인)
+#  • 가장 드문 n-gram 의 후보가 적거나 훑기가 SCAN_BUDGET 안에 끝나지 않으면 교집합 후 전부 순위 계산
+#  SpotIndex 마다 하나씩 만들어지므로 낚시터 데이터 재로딩 시 함께 교체됨
+# ─────────────────────────────────────────────────────────────────────────────
+SEARCH_LIMIT = 20
+
+# 가장 드문 질의 n-gram 의 레코드 수가 이 이하면 바로 교집합 후 전부 순위 계산
+RANK_ALL_MAX = 64
+# 순위 순서 훑기에서 확인할 게시 항목 수 상한. 넘도록 limit 건이 안 차면 (드문 일치) 교집합 후 순위 계산
+SCAN_BUDGET = 2048
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_FIRST, HANGUL_LAST = 0xAC00, 0xD7A3
+JAMO_CONSONANTS = set("ㄱㄲㄳㄴㄵㄶㄷㄸㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅃㅄㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ")
+
+_STRIP = re.compile(r"[\s\W_]+", re.UNICODE)
+
+
+def normalize(text: str) -> str:
+    return _STRIP.sub("", str(text)).lower()
+
+
+def to_chosung(text: str) -> str:
+    """
+    한글 음절 → 초성, 나머지 문자는 그대로 (정규화된 문자열 기준)
+    """
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_FIRST <= code <= HANGUL_LAST:
+            chars.append(CHOSUNG[(code - HANGUL_FIRST) // 588])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def _grams(text: str):
+    """
+    (n-gram, 시작 위치) — 1-gram, 2-gram
+    """
+    for i in range(len(text)):
+        yield text[i], i
+        if i + 1 < len(text):
+            yield text[i:i + 2], i
+
+
+def _query_grams(query: str) -> list[str]:
+    return [query] if len(query) == 1 else [query[i:i + 2] for i in range(len(query) - 1)]
+
+
+def _word_starts(name: str) -> set[int]:
+    """
+    원래 이름에서 공백/기호 뒤에 오는 단어의 시작 위치 (정규화 문자열 기준 인덱스)
+    """
+    starts, position, boundary = set(), 0, True
+    for ch in str(name):
+        if _STRIP.fullmatch(ch):
+            boundary = True
+            continue
+        if boundary:
+            starts.add(position)
+            boundary = False
+        position += 1
+    return starts
+
+
+def _grade(position: int, word_starts: set[int]) -> int:
+    # 0: 접두(완전 일치 포함 — 같은 위치에선 짧은 이름이 먼저라 완전 일치가 맨 앞), 1: 단어 시작, 2: 그 밖
+    if position == 0:
+        return 0
+    return 1 if position in word_starts else 2
+
+
+class _GramIndex:
+    """
+    정규화 이름 또는 초성 이름 하나에 대한 색인
+    • docs: n-gram → 레코드 번호 집합 (교집합/후보 수 판단용)
+    • ranked: n-gram → [((등급, 위치), [레코드 번호…]), …] 등급/위치 순 (번호 = 이름 길이/이름 순)
+    """
+
+    def __init__(self, texts: list[str], word_starts: list[set[int]]):
+        self.texts = texts
+        self.docs = {}
+        ranked = {}
+        for doc, text in enumerate(texts):
+            for gram, position in _grams(text):
+                self.docs.setdefault(gram, set()).add(doc)
+                key = (_grade(position, word_starts[doc]), position)
+                ranked.setdefault(gram, {}).setdefault(key, []).append(doc)
+        self.ranked = {gram: sorted(by_key.items()) for gram, by_key in ranked.items()}
+        self.word_starts = word_starts
+
+    def search(self, query: str, limit: int) -> list[int]:
+        grams = _query_grams(query)
+        postings = [self.docs.get(gram) for gram in set(grams)]
+        if not all(postings):
+            return []
+        postings.sort(key=len)
+
+        rarest = postings[0]
+        if len(rarest) > RANK_ALL_MAX:
+            found = self._scan(query, grams[0], rarest, limit)
+            if found is not None:
+                return found
+
+        candidates = rarest.intersection(*postings[1:])
+        ranked = []
+        for doc in candidates:
+            key = self._best(doc, query)
+            if key is not None:
+                ranked.append((key, doc))
+        return [doc for _, doc in heapq.nsmallest(limit, ranked)]
+
+    def _scan(self, query: str, first: str, rarest: set[int], limit: int) -> list[int] | None:
+        """
+        첫 n-gram 의 (등급, 위치) 목록을 순위 순서대로 훑음. 한 레코드는 처음 확인된(가장 높은) 순위로만.
+        SCAN_BUDGET 안에 끝나지 않으면 None
+        """
+        found, seen, budget = [], set(), SCAN_BUDGET
+        for (_, position), docs in self.ranked[first]:
+            for doc in docs:
+                budget -= 1
+                if budget < 0:
+                    return None
+                if doc in seen or doc not in rarest or not self.texts[doc].startswith(query, position):
+                    continue
+                seen.add(doc)
+                found.append(doc)
+                if len(found) >= limit:
+                    return found
+        return found
+
+    def _best(self, doc: int, query: str) -> tuple[int, int] | None:
+        """
+        레코드 안에서 질의가 나오는 위치 중 가장 높은 (등급, 위치), 없으면 None
+        """
+        text, best = self.texts[doc], None
+        position = text.find(query)
+        if position == 0:
+            return 0, 0
+        while position >= 0:
+            key = (_grade(position, self.word_starts[doc]), position)
+            if best is None or key < best:
+                best = key
+            position = text.find(query, position + 1)
+        return best
+
+
+class SpotSearchIndex:
+    def __init__(self, records: list[dict]):
+        named = []
+        for record in records:
+            name = record.get("name")
+            if isinstance(name, str) and name.strip():
+                norm = normalize(name)
+                named.append((len(norm), norm, record, name))
+        # 안정 정렬: 같은 이름은 원래 순서 유지
+        named.sort(key=lambda item: (item[0], item[1]))
+
+        self.records = [record for _, _, record, _ in named]
+        names = [norm for _, norm, _, _ in named]
+        word_starts = [_word_starts(name) for *_, name in named]
+        self.names = _GramIndex(names, word_starts)
+        # 초성 변환은 음절 → 자음 1:1 이라 위치/단어 시작이 그대로 유지됨
+        self.chosung = _GramIndex([to_chosung(norm) for norm in names], word_starts)
+
+    def __len__(self):
+        return len(self.records)
+
+    def search(self, keyword: str, limit: int = SEARCH_LIMIT) -> list[dict]:
+        """
+        이름 검색 결과 (순위순, 최대 limit 건). 빈 질의는 짧은 이름 순
+        """
+        query = normalize(keyword)
+        if limit <= 0:
+            return []
+        if not query:
+            return self.records[:limit]
+
+        # 초성(자음)이 섞인 질의는 질의의 음절도 초성으로 바꿔 초성 이름에서 검색
+        if any(ch in JAMO_CONSONANTS for ch in query):
+            docs = self.chosung.search(to_chosung(query), limit)
+        else:
+            docs = self.names.search(query, limit)
+        return [self.records[doc] for doc in docs]
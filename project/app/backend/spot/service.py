@@ -2,119 +2,307 @@ import os
 import pandas as pd
 import json
 
+from function import x_y_to_kma_grid_batch
+from spot.matcher import RegionMatcher
+from spot.snapshot import SNAPSHOT_DIR, load_or_build, snapshot_name
+from spot.forecast_store import ForecastStore
+from spot.search import SEARCH_LIMIT, SpotSearchIndex
+
+SHORT_COLUMNS = [
+    "type",
+    "admin_code",
+    "level1",
+    "level2",
+    "level3",
+    "grid_x",
+    "grid_y",
+    "lon_h",
+    "lon_m",
+    "lon_s",
+    "lat_h",
+    "lat_m",
+    "lat_s",
+    "lon_sec100",
+    "lat_sec100",
+    "update",
+    "extra",
+]
+
+# 낚시터별 예보 경로 컬럼: 격자 + 중기 예보 코드 (spot.routing 으로 미리 계산해 CSV에 저장)
+ROUTE_COLUMNS = ["nx", "ny", "land_code", "temp_code", "sea_code"]
+WEATHER_COLUMNS = ["weather_mid", "weather_short", "weather_ultra"]
+
+
+def _decode_weather(row: dict) -> dict:
+    """
+    날씨 컬럼의 JSON 문자열을 객체로 디코딩한 사본 ('조회 실패' 등 JSON이 아니면 그대로)
+    """
+    record = dict(row)
+    for col in WEATHER_COLUMNS:
+        if isinstance(record.get(col), str):
+            try:
+                record[col] = json.loads(record[col])
+            except json.JSONDecodeError:
+                pass
+    return record
+
+
+def spot_address(row) -> str:
+    """
+    주소 컬럼 우선순위: address → road_address → lot_address
+    (미리 계산하는 예보 경로와 갱신 작업의 경로 계산이 같은 주소를 쓰도록 공용)
+    """
+    for col in ["address", "road_address", "lot_address"]:
+        value = row.get(col)
+        if isinstance(value, str) and value:
+            return value
+    return ""
+
+
+class SpotIndex:
+    """
+    낚시터 데이터 + 조회용 해시 인덱스 묶음 (재로딩 시 통째로 교체)
+    • by_name: 이름 → 레코드 (같은 이름이 여러 개면 첫 행)
+    • by_id: spot_id → 레코드
+    • by_type: 유형 → 레코드 목록
+    • parsed / parsed_by_type: 날씨 JSON을 미리 디코딩한 레코드 (목록 API 응답용)
+    • search: 이름 n-gram / 초성 검색 인덱스 (spot.search)
+    • version: 데이터셋 버전 (원본 파일 수정 시각 + 크기, 응답 캐시/ETag 용)
+    """
+
+    def __init__(self, df: pd.DataFrame, version: str = ""):
+        self.df = df
+        self.version = version
+        self.records = df.to_dict("records")
+        self.by_name = {}
+        self.by_id = {}
+        self.by_type = {}
+        for record in self.records:
+            self.by_name.setdefault(record.get("name"), record)
+            if "spot_id" in record:
+                self.by_id.setdefault(record["spot_id"], record)
+            self.by_type.setdefault(record.get("type"), []).append(record)
+
+        self.parsed = [_decode_weather(record) for record in self.records]
+        self.parsed_by_type = {}
+        for record in self.parsed:
+            self.parsed_by_type.setdefault(record.get("type"), []).append(record)
+
+        self.search = SpotSearchIndex(self.records)
+
+
 class FishingSpotService:
-    def __init__(self):
+    def __init__(
+        self,
+        file_path: str | None = None,
+        store: ForecastStore | None = None,
+        snapshot_dir: str = SNAPSHOT_DIR,
+    ):
         base_dir = os.path.dirname(os.path.abspath(__file__))
-        file_path = os.path.join(base_dir, "..", "dataset", "fishing_spot", "fishing_spot.csv")
+        self.file_path = file_path or os.path.join(base_dir, "..", "dataset", "fishing_spot", "fishing_spot.csv")
         region_dir = os.path.join(base_dir, "..", "dataset", "weather_region")
-        land_path = os.path.join(region_dir, "region_mid_land.csv")
-        temp_path = os.path.join(region_dir, "region_mid_temp.csv")
-        sea_path = os.path.join(region_dir, "region_mid_sea.csv")
-        short_path = os.path.join(region_dir, "region_short.csv")
-
-        self.df = pd.read_csv(file_path)
-
-        self.land_df = pd.read_csv(land_path, header=None, names=["region_name", "region_code"])
-        self.temp_df = pd.read_csv(temp_path, header=None, names=["region_name", "region_code"])
-        self.sea_df = pd.read_csv(sea_path, header=None, names=["region_name", "region_code"])
-
-        short_cols = [
-            "type",
-            "admin_code",
-            "level1",
-            "level2",
-            "level3",
-            "grid_x",
-            "grid_y",
-            "lon_h",
-            "lon_m",
-            "lon_s",
-            "lat_h",
-            "lat_m",
-            "lat_s",
-            "lon_sec100",
-            "lat_sec100",
-            "update",
-            "extra",
+        self.region_paths = [
+            os.path.join(region_dir, "region_mid_land.csv"),
+            os.path.join(region_dir, "region_mid_temp.csv"),
+            os.path.join(region_dir, "region_mid_sea.csv"),
+            os.path.join(region_dir, "region_short.csv"),
         ]
-        self.short_df = pd.read_csv(short_path, names=short_cols, header=0)
+        self.snapshot_dir = snapshot_dir
+
+        # 지역 코드 테이블 + 파생 조회 구조 (스냅샷이 최신이면 CSV 파싱 생략)
+        regions = load_or_build("regions", self.region_paths, self._read_region_tables, self.snapshot_dir)
+        self.land_df, self.temp_df, self.sea_df, self.short_df = (
+            regions["land_df"], regions["temp_df"], regions["sea_df"], regions["short_df"]
+        )
+        self.region_matcher = regions["matcher"]
+        self.land_map, self.temp_map, self.sea_map = regions["land_map"], regions["temp_map"], regions["sea_map"]
+
+        # (grid_x, grid_y) → region_short.csv 첫 행, 격자별 중기 코드 메모
+        self.short_by_grid = regions["short_by_grid"]
+        self._grid_codes = {}
+
+        self.index = self._load_index()
 
-        self.land_map = dict(zip(self.land_df["region_name"], self.land_df["region_code"]))
-        self.temp_map = dict(zip(self.temp_df["region_name"], self.temp_df["region_code"]))
-        self.sea_map = dict(zip(self.sea_df["region_name"], self.sea_df["region_code"]))
+        # 날씨/어종 갱신 결과 저장소 (CSV에는 더 이상 쓰지 않음)
+        self.store = store or ForecastStore()
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self.index.df
+
+    def reload(self):
+        """
+        낚시터 CSV를 다시 읽고 인덱스를 새로 만든 뒤 한 번에 교체
+        (교체 전까지 기존 인덱스로 계속 응답)
+        """
+        self.index = self._load_index()
+
+    def reload_if_changed(self) -> bool:
+        """
+        낚시터 CSV가 현재 인덱스 이후 바뀌었으면 (다른 프로세스의 원자적 교체 포함) 다시 로드.
+        반환: 교체 여부
+        """
+        stat = os.stat(self.file_path)
+        if f"{stat.st_mtime_ns:x}-{stat.st_size:x}" == self.index.version:
+            return False
+        self.reload()
+        return True
+
+    def _read_region_tables(self) -> dict:
+        land_path, temp_path, sea_path, short_path = self.region_paths
+        land_df = pd.read_csv(land_path, header=None, names=["region_name", "region_code"])
+        temp_df = pd.read_csv(temp_path, header=None, names=["region_name", "region_code"])
+        sea_df = pd.read_csv(sea_path, header=None, names=["region_name", "region_code"])
+        short_df = pd.read_csv(short_path, names=SHORT_COLUMNS, header=0)
+        return {
+            "land_df": land_df,
+            "temp_df": temp_df,
+            "sea_df": sea_df,
+            "short_df": short_df,
+            "matcher": RegionMatcher({"land": land_df, "temp": temp_df, "sea": sea_df}),
+            "land_map": dict(zip(land_df["region_name"], land_df["region_code"])),
+            "temp_map": dict(zip(temp_df["region_name"], temp_df["region_code"])),
+            "sea_map": dict(zip(sea_df["region_name"], sea_df["region_code"])),
+            "short_by_grid": {
+                (int(r["grid_x"]), int(r["grid_y"])): r
+                for r in short_df.drop_duplicates(subset=["grid_x", "grid_y"]).to_dict("records")
+            },
+        }
+
+    def _load_index(self) -> SpotIndex:
+        """
+        낚시터 인덱스 로드. 낚시터 CSV와 지역 테이블이 스냅샷 이후 바뀌지 않았으면 스냅샷 사용
+        """
+        sources = [self.file_path] + self.region_paths
+        return load_or_build(
+            snapshot_name("spots", self.file_path), sources, self._read_spot_index, self.snapshot_dir
+        )
+
+    def _read_spot_index(self) -> SpotIndex:
+        stat = os.stat(self.file_path)
+        version = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        return SpotIndex(self.with_routes(pd.read_csv(self.file_path)), version)
+
+    @property
+    def version(self) -> str:
+        """
+        낚시터 데이터셋 버전 + 예보 저장소 리비전 (둘 중 하나만 바뀌어도 응답 캐시 무효화)
+        """
+        return f"{self.index.version}-{self.store.revision():x}"
+
+    # ------------------------------------------------------------------
+    # 예보 경로 (격자 + 중기 코드)
+    # ------------------------------------------------------------------
+    def with_routes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        격자(nx, ny)가 없는 행만 경로를 계산해 채움
+        (CSV에 미리 저장돼 있으면 그대로 사용, 중기 코드는 원래 없을 수 있음)
+        """
+        df = df.copy()
+        for col in ROUTE_COLUMNS:
+            if col not in df.columns:
+                df[col] = None
+
+        missing = df[["nx", "ny"]].isna().any(axis=1) & df["lat"].notna() & df["lon"].notna()
+        if missing.any():
+            rows = df.loc[missing]
+            nxs, nys = x_y_to_kma_grid_batch(rows["lat"].to_numpy(), rows["lon"].to_numpy())
+            addresses = [spot_address(row) for row in rows.to_dict("records")]
+            routes = [
+                self.route_for(int(nx), int(ny), address)
+                for nx, ny, address in zip(nxs, nys, addresses)
+            ]
+            df.loc[missing, ROUTE_COLUMNS] = pd.DataFrame(routes, index=rows.index, columns=ROUTE_COLUMNS)
+        return df
+
+    def route_for(self, nx: int, ny: int, address) -> tuple:
+        """
+        주소 기반 중기 코드 우선, 찾지 못한 코드는 격자 기반 매핑으로 보완
+        """
+        land, temp, sea = self.resolve_mid_codes_from_address(address)
+        if not land or not temp or not sea:
+            land_g, temp_g, sea_g = self.get_mid_codes_by_grid(nx, ny)
+            land, temp, sea = land or land_g, temp or temp_g, sea or sea_g
+        return nx, ny, land, temp, sea
+
+    def get_route_by_name(self, name: str) -> tuple | None:
+        """
+        낚시터 이름 → (nx, ny, land_code, temp_code, sea_code), 없으면 None
+        """
+        record = self.index.by_name.get(name)
+        if record is None or pd.isna(record.get("nx")) or pd.isna(record.get("ny")):
+            return None
+        codes = [record.get(c) for c in ROUTE_COLUMNS[2:]]
+        codes = [c if isinstance(c, str) and c else None for c in codes]
+        return (int(record["nx"]), int(record["ny"]), *codes)
 
     # 모든 낚시터 출력
     def get_all_spots(self):
-        return self._parse_spot_rows(self.df)
+        return self._parse_spot_rows(self.index.parsed)
 
     # 선상 낚시터 출력
     def get_sea_spots(self):
-        filtered = self.df[self.df["type"] == "boat"]
-        return self._parse_spot_rows(filtered)
+        return self._parse_spot_rows(self.index.parsed_by_type.get("boat", []))
 
     # 실내 낚시터 출력
     def get_ground_spots(self):
-        filtered = self.df[self.df["type"] == "indoor"]
-        return self._parse_spot_rows(filtered)
-
-    # 내부 공통 처리 함수
-    def _parse_spot_rows(self, df_subset):
-        result = []
-        for _, row in df_subset.iterrows():
-            record = row.to_dict()
-            for col in ["weather_mid", "weather_short", "weather_ultra"]:
-                if isinstance(record.get(col), str):
-                    try:
-                        record[col] = json.loads(record[col])
-                    except json.JSONDecodeError:
-                        pass
-            result.append(record)
-        return result
+        return self._parse_spot_rows(self.index.parsed_by_type.get("indoor", []))
+
+    def get_spot_by_name(self, name: str) -> dict | None:
+        return self.index.by_name.get(name)
+
+    def get_spot_by_id(self, spot_id) -> dict | None:
+        return self.index.by_id.get(spot_id)
+
+    def search_spots(self, keyword: str, limit: int = SEARCH_LIMIT) -> list[dict]:
+        """
+        이름 부분 문자열 / 접두 / 초성 검색 (순위순)
+        """
+        return self.index.search.search(keyword, limit)
+
+    # 내부 공통 처리 함수: 저장소의 최신 날씨/어종 정보를 붙인 사본
+    # (저장소에 갱신 기록이 없는 낚시터는 CSV에서 미리 디코딩해 둔 값 사용)
+    def _parse_spot_rows(self, records: list[dict]):
+        forecasts = self.store.load_all()
+        return [forecasts.apply(record) for record in records]
     
     def get_coordinates_by_name(self, name: str):
         """
         낚시터 이름으로 위도(lat)와 경도(lon)를 반환
         """
-        row = self.df[self.df["name"] == name]
-        if not row.empty:
-            lat = float(row.iloc[0]["lat"])
-            lon = float(row.iloc[0]["lon"])
-            return lat, lon
+        record = self.index.by_name.get(name)
+        if record is not None:
+            return float(record["lat"]), float(record["lon"])
         else:
             return None, None
         
-    def _lookup_code(self, name: str, df: pd.DataFrame) -> str:
-        row = self.df[self.df["name"] == name]
-        if row.empty:
-            return None
+    def resolve_mid_codes_from_address(self, address: str) -> tuple[str | None, str | None, str | None]:
+        """
+        주소 → (육상, 기온, 해상) 중기 예보 코드. 주소를 한 번만 훑어서 세 코드를 함께 찾음
+        """
+        codes = self.region_matcher.match(address)
+        return codes["land"], codes["temp"], codes["sea"]
 
-        address = str(row.iloc[0].get("address") or "")
+    def _lookup_code(self, name: str, table: str) -> str:
+        record = self.index.by_name.get(name)
+        if record is None:
+            return None
+        return self._lookup_code_from_address(record.get("address"), table)
 
-        for _, region_row in df.iterrows():
-            region_name = region_row["region_name"]
-            if region_name in address:
-                return region_row["region_code"]
-        return None
-    
-    
-    def _lookup_code_from_address(self, address: str, df: pd.DataFrame) -> str:
-        print("주소체크" + address)
-        for _, row in df.iterrows():
-            region_name = row["region_name"]
-            if region_name in address:
-                print("출력체크" + row["region_code"])
-                return row["region_code"]
-        print("실패 ㅇㅇ")
-        return None
+    def _lookup_code_from_address(self, address: str, table: str) -> str:
+        """
+        table: "land" | "temp" | "sea"
+        """
+        return self.region_matcher.match(address)[table]
 
     def get_mid_land_code_by_name(self, name: str) -> str:
-        return self._lookup_code(name, self.land_df)
+        return self._lookup_code(name, "land")
 
     def get_mid_temp_code_by_name(self, name: str) -> str:
-        return self._lookup_code(name, self.temp_df)
+        return self._lookup_code(name, "temp")
 
     def get_mid_sea_code_by_name(self, name: str) -> str:
-        return self._lookup_code(name, self.sea_df)
+        return self._lookup_code(name, "sea")
 
     # ------------------------------------------------------------------
     # 격자 좌표(nx, ny)를 이용한 중기 예보 코드 조회
@@ -189,15 +377,22 @@ class FishingSpotService:
         return None
 
     def get_mid_codes_by_grid(self, nx: int, ny: int) -> tuple[str | None, str | None, str | None]:
-        row = self.short_df[(self.short_df["grid_x"] == nx) & (self.short_df["grid_y"] == ny)]
-        if row.empty:
-            return None, None, None
-        row = row.iloc[0]
-        l1 = row["level1"]
-        l2 = row["level2"]
-        l3 = row["level3"]
-
-        land = self._land_code_from_levels(l1, l2)
-        temp = self._temp_code_from_levels(l1, l2, l3)
-        sea = self._sea_code_from_level1(l1)
-        return land, temp, sea
+        key = (int(nx), int(ny))
+        codes = self._grid_codes.get(key)
+        if codes is not None:
+            return codes
+
+        row = self.short_by_grid.get(key)
+        if row is None:
+            codes = (None, None, None)
+        else:
+            l1 = row["level1"]
+            l2 = row["level2"]
+            l3 = row["level3"]
+            codes = (
+                self._land_code_from_levels(l1, l2),
+                self._temp_code_from_levels(l1, l2, l3),
+                self._sea_code_from_level1(l1),
+            )
+        self._grid_codes[key] = codes
+        return codes
@@ -0,0 +1,91 @@
+import hashlib
+import os
+import pickle
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  데이터셋 바이너리 스냅샷
+#  CSV/엑셀 파싱 결과(DataFrame, 인덱스 객체 등)를 pickle 로 저장해 두고,
+#  원본 파일(경로 + 수정 시각 + 크기)이 그대로면 원본 대신 스냅샷을 읽는다.
+# ─────────────────────────────────────────────────────────────────────────────
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_DIR = os.path.join(BASE_DIR, "..", "dataset", "snapshot")
+
+# 스냅샷에 담기는 객체 구조가 바뀌면 올려서 기존 스냅샷을 무효화
+SNAPSHOT_FORMAT = 3
+
+
+def snapshot_name(prefix: str, path: str) -> str:
+    """
+    원본 경로별로 구분되는 스냅샷 이름 (예: spots-1a2b3c4d5e)
+    """
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:10]
+    return f"{prefix}-{digest}"
+
+
+def _source_stats(sources: list[str]) -> list[tuple]:
+    stats = []
+    for path in sources:
+        st = os.stat(path)
+        stats.append((os.path.abspath(path), st.st_mtime_ns, st.st_size))
+    return stats
+
+
+def _snapshot_path(name: str, directory: str) -> str:
+    return os.path.join(directory, f"{name}.pkl")
+
+
+def load_snapshot(name: str, sources: list[str], directory: str = SNAPSHOT_DIR):
+    """
+    스냅샷이 없거나, 손상됐거나, 원본보다 오래됐으면 None
+    """
+    path = _snapshot_path(name, directory)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            meta, value = pickle.load(f)
+    except Exception as e:
+        print(f"[Snapshot] {name} 읽기 실패: {e}")
+        return None
+    if meta != {"format": SNAPSHOT_FORMAT, "sources": _source_stats(sources)}:
+        return None
+    return value
+
+
+def save_snapshot(name: str, sources: list[str], value, stats: list[tuple] | None = None, directory: str = SNAPSHOT_DIR):
+    """
+    임시 파일에 쓴 뒤 교체 (여러 워커가 동시에 써도 읽는 쪽은 완성된 파일만 봄)
+    """
+    meta = {"format": SNAPSHOT_FORMAT, "sources": stats or _source_stats(sources)}
+    path = _snapshot_path(name, directory)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump((meta, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[Snapshot] {name} 저장 실패: {e}")
+
+
+def load_or_build(name: str, sources: list[str], build, directory: str = SNAPSHOT_DIR):
+    """
+    최신 스냅샷이 있으면 읽고, 없으면 build() 로 원본을 파싱한 뒤 스냅샷으로 저장
+    """
+    value = load_snapshot(name, sources, directory)
+    if value is not None:
+        return value
+
+    # 파싱 전 원본 상태를 기록 (파싱 중 원본이 바뀌면 다음 로드 때 다시 만들도록)
+    stats = _source_stats(sources)
+    value = build()
+    save_snapshot(name, sources, value, stats, directory)
+    return value
+
+
+if __name__ == "__main__":
+    # 실행 (backend 디렉터리에서): python -m spot.snapshot
+    # 서비스 로딩 과정에서 오래된 스냅샷이 다시 만들어짐
+    from spot.service import FishingSpotService
+    service = FishingSpotService()
+    print(f"[Snapshot] 낚시터 {len(service.df)}곳 스냅샷 갱신 완료 (버전 {service.version})")
@@ -1,5 +1,5 @@
 from spot.service import FishingSpotService
-from weather.service import WeatherService
+from weather.service import WeatherService, GRID_SECTIONS, MID_SECTIONS
 from function import x_y_to_kma_grid
 import time
 
@@ -12,17 +12,11 @@ class FishingWeatherService:
         """
         낚시터 이름으로 날씨 정보 반환
         """
-        lat, lon = self.spot_service.get_coordinates_by_name(name)
-        if lat is None or lon is None:
+        # 미리 계산된 예보 경로 (격자 + 중기 지역 코드) 조회
+        route = self.spot_service.get_route_by_name(name)
+        if route is None:
             return {"error": "해당 낚시터를 찾을 수 없습니다."}
-
-        # 위경도를 기상청 격자 좌표로 변환
-        nx, ny = x_y_to_kma_grid(lat, lon)
-
-        # 낚시터 이름으로 중기예보 지역코드 얻기 (육상/기온/해상)
-        land_code = self.spot_service.get_mid_land_code_by_name(name)
-        temp_code = self.spot_service.get_mid_temp_code_by_name(name)
-        sea_code = self.spot_service.get_mid_sea_code_by_name(name)
+        nx, ny, land_code, temp_code, sea_code = route
 
         # 날씨 정보 요청
         service = WeatherService(
@@ -45,22 +39,8 @@ class FishingWeatherService:
             return {"error": "위경도가 올바르지 않습니다."}
 
         try:
-            # 위경도 → 기상청 격자
-            nx, ny = x_y_to_kma_grid(lat, lon)
+            nx, ny, land_code, temp_code, sea_code = self.resolve_route(lat, lon, address)
             print(f"[Weather] 격자 변환: lat={lat}, lon={lon} → nx={nx}, ny={ny}")
-
-            # 주소에서 지역 코드 추출
-            land_code = self.spot_service._lookup_code_from_address(address, self.spot_service.land_df)
-            temp_code = self.spot_service._lookup_code_from_address(address, self.spot_service.temp_df)
-            sea_code = self.spot_service._lookup_code_from_address(address, self.spot_service.sea_df)
-
-            # 주소 기반으로 찾지 못한 경우 격자 기반 매핑 시도
-            if not land_code or not temp_code or not sea_code:
-                land_g, temp_g, sea_g = self.spot_service.get_mid_codes_by_grid(nx, ny)
-                land_code = land_code or land_g
-                temp_code = temp_code or temp_g
-                sea_code = sea_code or sea_g
-
             print(f"[Weather] 코드 추출: land={land_code}, temp={temp_code}, sea={sea_code}")
 
             for attempt in range(1, max_retry + 1):
@@ -99,4 +79,37 @@ class FishingWeatherService:
 
         except Exception as e:
             print(f"[Weather] 예외 발생: {e}")
-            return {"error": f"날씨 조회 중 예외 발생: {e}"}
\ No newline at end of file
+            return {"error": f"날씨 조회 중 예외 발생: {e}"}
+
+    # ------------------------------------------------------------------
+    # 갱신 작업용: 격자/지역 단위로 나눠서 조회
+    # ------------------------------------------------------------------
+    def resolve_route(self, lat: float, lon: float, address: str) -> tuple:
+        """
+        위경도 + 주소 → (nx, ny, land_code, temp_code, sea_code)
+        주소로 찾지 못한 중기 코드는 격자 기반 매핑으로 보완
+        """
+        nx, ny = x_y_to_kma_grid(lat, lon)
+        return self.spot_service.route_for(nx, ny, address)
+
+    def fetch_grid_forecasts(self, nx: int, ny: int, include: tuple[str, ...] = GRID_SECTIONS) -> dict:
+        """
+        격자 단위 예보만 조회: {"ultra": {...}, "short": {...}} (include 로 일부 구역만 조회 가능)
+        """
+        service = WeatherService(self.api_key, nx, ny, reg_id_land=None, reg_id_temp=None, reg_id_sea=None)
+        result = service.get_all_forecasts(include=include)
+        return {section: result[section] for section in include}
+
+    def fetch_mid_forecasts(self, land_code: str | None, temp_code: str | None, sea_code: str | None) -> dict:
+        """
+        중기 지역 코드 단위 예보만 조회: {"land": {...}, "ta": {...}, "sea": {...}}
+        """
+        service = WeatherService(
+            self.api_key,
+            None,
+            None,
+            reg_id_land=land_code,
+            reg_id_temp=temp_code,
+            reg_id_sea=sea_code,
+        )
+        return service.get_all_forecasts(include=MID_SECTIONS)["mid"]
@@ -0,0 +1,42 @@
+"""
+낚시터 예보 저장소 (spot.forecast_store) 테스트.
+실행 (backend 디렉터리에서):
+    python -m pytest tests
+"""
+import os
+import tempfile
+import unittest
+
+from spot.forecast_store import ForecastStore
+
+CODES = ("11B00000", "11B10101", "12A20000")
+MID = {"land": {"3": {"wf": "맑음"}}, "ta": {"3": {"taMin": 8}}, "sea": {"3": {"wh": 1.0}}}
+
+
+class ForecastStoreMidTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ForecastStore(os.path.join(self.tmp.name, "forecast.db"))
+        self.store.save_mid(CODES, MID)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_empty_sections_keep_last_forecast(self):
+        run_id, _ = self.store.begin_run("mid")
+        self.store.publish(run_id, grids={}, mids={CODES: {"land": {}, "ta": {}, "sea": {}}}, statuses=[], fish=[])
+        self.assertEqual(self.store.mid_forecasts(), {
+            ("land", CODES[0]): MID["land"],
+            ("ta", CODES[1]): MID["ta"],
+            ("sea", CODES[2]): MID["sea"],
+        })
+
+    def test_non_empty_section_replaces_forecast(self):
+        self.store.save_mid(CODES, {"land": {"4": {"wf": "흐림"}}, "ta": {}, "sea": {}})
+        mids = self.store.mid_forecasts()
+        self.assertEqual(mids[("land", CODES[0])], {"4": {"wf": "흐림"}})
+        self.assertEqual(mids[("sea", CODES[2])], MID["sea"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+낚시터 갱신 엔진 (spot.refresh_engine) 테스트.
+가짜 날씨/어종 서비스와 임시 SQLite 저장소로 KMA/EcoBank 호출 없이 실행.
+실행 (backend 디렉터리에서):
+    python -m pytest tests
+"""
+import os
+import tempfile
+import unittest
+
+from spot.forecast_store import ForecastStore
+from spot.refresh_engine import RefreshEngine
+
+SPOT = {
+    "spot_id": 1, "name": "테스트낚시터", "lat": 37.5, "lon": 127.0,
+    "nx": 60, "ny": 127, "land_code": "11B00000", "temp_code": "11B10101", "sea_code": "12A20000",
+}
+GRID = {"ultra": {"202610180900": {"T1H": 15}}, "short": {"202610181200": {"TMP": 16}}}
+MID = {"land": {"3": {"wf": "맑음"}}, "ta": {"3": {"taMin": 8}}, "sea": {"3": {"wh": 1.0}}}
+
+
+class FakeWeatherService:
+    def __init__(self, mid: dict):
+        self.mid = mid
+        self.mid_calls = 0
+
+    def fetch_grid_forecasts(self, nx, ny, include):
+        return {section: GRID[section] for section in include}
+
+    def fetch_mid_forecasts(self, land_code, temp_code, sea_code):
+        self.mid_calls += 1
+        return self.mid
+
+
+class RefreshEngineMidTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ForecastStore(os.path.join(self.tmp.name, "forecast.db"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def refresh(self, mid: dict, run_name: str) -> tuple[dict, FakeWeatherService]:
+        weather = FakeWeatherService(mid)
+        engine = RefreshEngine(weather, None, self.store, workers=2, max_retry=3, backoff_base=0)
+        return engine.refresh([SPOT], [], run_name=run_name), weather
+
+    def test_complete_mid_counts_as_success(self):
+        result, weather = self.refresh(MID, "ok")
+        self.assertEqual(result["failed"]["mid"], [])
+        self.assertEqual(result["tasks"]["mid"]["ok"], 1)
+        self.assertEqual(weather.mid_calls, 1)
+
+    def test_empty_mid_sections_are_retried_and_reported(self):
+        # fetch_mid_forecasts 는 실패한 구역을 {} 로 채워 항상 dict 를 반환
+        result, weather = self.refresh({"land": {}, "ta": {}, "sea": {}}, "empty")
+        self.assertEqual(result["failed"]["mid"], ["1"])
+        self.assertEqual(result["tasks"]["mid"]["failed"], 1)
+        self.assertEqual(weather.mid_calls, 3)
+
+    def test_one_missing_section_fails_the_region(self):
+        result, _ = self.refresh({**MID, "sea": {}}, "partial")
+        self.assertEqual(result["failed"]["mid"], ["1"])
+
+    def test_failed_mid_marks_spot_weather_failed(self):
+        # 낚시터별 조회와 같이 중기 예보가 실패하면 격자 예보가 있어도 '조회 실패'
+        self.refresh({"land": {}, "ta": {}, "sea": {}}, "empty")
+        self.assertEqual(self.store.statuses()["1"]["weather_ok"], 0)
+        self.assertEqual(self.store.failed_weather_keys(), ["1"])
+
+        self.refresh(MID, "ok")
+        self.assertEqual(self.store.statuses()["1"]["weather_ok"], 1)
+
+    def test_section_without_region_code_is_not_required(self):
+        spot = {**SPOT, "sea_code": None}
+        weather = FakeWeatherService({**MID, "sea": {}})
+        engine = RefreshEngine(weather, None, self.store, workers=2, max_retry=3, backoff_base=0)
+        result = engine.refresh([spot], [], run_name="no-sea")
+        self.assertEqual(result["failed"]["mid"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
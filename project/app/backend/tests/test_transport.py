@@ -0,0 +1,62 @@
+"""
+공용 HTTP 전송 계층 (transport) 테스트: 로컬 HTTP 서버로 호출 제한 범위 확인.
+실행 (backend 디렉터리에서):
+    python -m pytest tests
+"""
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from transport import HTTPTransport, TokenBucket
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class RateLimitScopeTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+        self.transport = HTTPTransport()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def timed_gets(self, count: int) -> float:
+        start = time.perf_counter()
+        for _ in range(count):
+            self.transport.get(self.url)
+        return time.perf_counter() - start
+
+    def test_limits_apply_only_to_the_thread_that_set_them(self):
+        bucket = TokenBucket(rate=5, burst=1)
+        limited = {}
+
+        def worker():
+            self.transport.use_rate_limits({"127.0.0.1": bucket})
+            limited["elapsed"] = self.timed_gets(4)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        unlimited = self.timed_gets(4)
+        thread.join()
+
+        # 버킷 1개 + 초당 5개 → 4건에 약 0.6초, 다른 스레드는 대기 없음
+        self.assertGreaterEqual(limited["elapsed"], 0.5)
+        self.assertGreater(bucket.waited, 0.5)
+        self.assertLess(unlimited, 0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+load_dotenv()
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 공용 HTTP 전송 계층 설정 (.env 로 조정 가능)
+# ─────────────────────────────────────────────────────────────────────────────
+HTTP_POOL_SIZE       = int(os.getenv("HTTP_POOL_SIZE", "20"))        # 호스트별 keep-alive 연결 수
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))
+HTTP_READ_TIMEOUT    = float(os.getenv("HTTP_READ_TIMEOUT", "10"))
+HTTP_GZIP            = os.getenv("HTTP_GZIP", "1") == "1"
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 채워지는 토큰 버킷 (최대 burst개). acquire()는 토큰이 생길 때까지 대기
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.waited = 0.0               # 누적 대기 시간 (초)
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        반환: 토큰을 기다린 시간 (초)
+        """
+        if self.rate <= 0:
+            return 0.0
+        tokens = min(tokens, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    self.waited += waited
+                    return waited
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+def _host_key(parts) -> str:
+    return f"{parts.scheme}://{parts.hostname}:{parts.port or DEFAULT_PORTS.get(parts.scheme)}"
+
+
+class HTTPTransport:
+    """
+    requests.Session 기반 연결 풀.
+    • 호스트별 keep-alive 연결 재사용 (pool_size)
+    • 모든 요청에 (connect, read) 타임아웃 적용
+    • gzip=True 이면 압축 응답 요청
+    • use_rate_limits(): 호출한 스레드의 요청만 호스트(도메인)별 초당 요청 수로 제한
+      (갱신 워커용, 실제 HTTP 요청 1건당 토큰 1개. 다른 스레드의 대화형 요청은 기다리지 않음)
+    • stats(): 호스트별 요청 수, 오류 수, 지연(ms), 호출 제한 대기(ms), 신규/재사용 연결 수
+    """
+
+    def __init__(
+        self,
+        pool_size: int = HTTP_POOL_SIZE,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+        read_timeout: float = HTTP_READ_TIMEOUT,
+        gzip: bool = HTTP_GZIP,
+    ):
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip, deflate" if gzip else "identity",
+        })
+        self._lock = threading.Lock()
+        self._hosts: dict[str, dict] = {}
+        self._local = threading.local()
+
+    def use_rate_limits(self, limits: dict[str, TokenBucket] | None):
+        """
+        이 스레드에서 보내는 요청에 호스트 → 버킷 제한 적용 (None 이면 해제)
+        """
+        self._local.limits = limits
+
+    def get(self, url: str, params: dict | None = None, timeout=None) -> requests.Response:
+        parts = urlsplit(url)
+        key = _host_key(parts)
+        limits = getattr(self._local, "limits", None)
+        bucket = limits.get(parts.hostname) if limits else None
+        waited = bucket.acquire() if bucket is not None else 0.0
+        start = time.perf_counter()
+        try:
+            resp = self.session.get(url, params=params, timeout=timeout or self.timeout)
+        except Exception:
+            self._record(key, time.perf_counter() - start, waited, error=True)
+            raise
+        self._record(key, time.perf_counter() - start, waited, error=False)
+        return resp
+
+    def _record(self, key: str, elapsed: float, waited: float, error: bool):
+        with self._lock:
+            s = self._hosts.setdefault(
+                key, {"requests": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0, "throttled_ms": 0.0}
+            )
+            s["requests"] += 1
+            s["errors"] += int(error)
+            s["total_ms"] += elapsed * 1000
+            s["max_ms"] = max(s["max_ms"], elapsed * 1000)
+            s["throttled_ms"] += waited * 1000
+
+    def _pool_counters(self) -> dict:
+        """
+        urllib3 연결 풀 카운터 합계: {호스트 키: (새로 연 연결 수, 풀을 거친 요청 수)}
+        """
+        counters = {}
+        adapters = {id(a): a for a in self.session.adapters.values()}.values()
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for pool_key in list(pools.keys()):
+                pool = pools.get(pool_key)
+                if pool is None:
+                    continue
+                key = f"{pool_key.key_scheme}://{pool_key.key_host}:{pool_key.key_port or DEFAULT_PORTS.get(pool_key.key_scheme)}"
+                opened, used = counters.get(key, (0, 0))
+                counters[key] = (opened + pool.num_connections, used + pool.num_requests)
+        return counters
+
+    def stats(self) -> dict:
+        with self._lock:
+            hosts = {k: dict(v) for k, v in self._hosts.items()}
+        counters = self._pool_counters()
+
+        for key, s in hosts.items():
+            s["avg_ms"] = round(s["total_ms"] / s["requests"], 2) if s["requests"] else 0.0
+            s["total_ms"] = round(s["total_ms"], 2)
+            s["max_ms"] = round(s["max_ms"], 2)
+            s["throttled_ms"] = round(s["throttled_ms"], 2)
+            opened, used = counters.get(key, (0, 0))
+            s["connections_opened"] = opened
+            s["connections_reused"] = max(0, used - opened)
+        return hosts
+
+
+# 모든 클라이언트가 공유하는 기본 전송 계층
+transport = HTTPTransport()
@@ -1,6 +1,8 @@
-import requests
 from datetime import datetime, timedelta, timezone
 
+from cache import LRUCache
+from transport import transport
+
 DEBUG = False
 
 from weather.const import (
@@ -60,6 +62,50 @@ def get_base_datetime_mid():
         return now.strftime("%Y%m%d"), "1800"
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+#  발표 시각 기반 만료 시각 계산
+#  (get_base_datetime_* 가 다음 발표로 넘어가는 시점에 캐시를 만료)
+# ─────────────────────────────────────────────────────────────────────────────
+ULTRA_NEXT_ISSUE = timedelta(hours=1, minutes=40)   # HH00 발표 → (HH+1):40 에 다음 발표 사용
+SHORT_NEXT_ISSUE = timedelta(hours=3)               # 02/05/08/.../23시 3시간 간격
+MID_NEXT_ISSUE   = timedelta(hours=12)              # 06시/18시
+
+
+def _base_to_datetime(date: str, time: str) -> datetime:
+    return datetime.strptime(date + time, "%Y%m%d%H%M").replace(tzinfo=KST)
+
+
+def get_expiry_ultra(date: str, time: str) -> datetime:
+    return _base_to_datetime(date, time) + ULTRA_NEXT_ISSUE
+
+
+def get_expiry_short(date: str, time: str) -> datetime:
+    return _base_to_datetime(date, time) + SHORT_NEXT_ISSUE
+
+
+def get_expiry_mid(date: str, time: str) -> datetime:
+    return _base_to_datetime(date, time) + MID_NEXT_ISSUE
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  공유 예보 캐시
+#  • 초단기/단기: (엔드포인트, grid_x, grid_y, base_date, base_time)
+#  • 중기:       (엔드포인트, regId, tmFc)
+# ─────────────────────────────────────────────────────────────────────────────
+FORECAST_CACHE_MAX_ENTRIES = 4096
+FORECAST_CACHE_MAX_BYTES   = 256 * 1024 * 1024
+
+forecast_cache = LRUCache(
+    max_entries=FORECAST_CACHE_MAX_ENTRIES,
+    max_bytes=FORECAST_CACHE_MAX_BYTES,
+)
+
+
+def _is_success(raw: dict) -> bool:
+    header = raw.get("response", {}).get("header", {}) if isinstance(raw, dict) else {}
+    return header.get("resultCode") == "00"
+
+
 class KMAClient:
     def __init__(
         self,
@@ -77,26 +123,39 @@ class KMAClient:
         self.reg_id_temp = reg_id_temp
         self.reg_id_sea = reg_id_sea
 
-    def fetch_ultra(self):
-        date, time = get_base_datetime_ultra()
-        url = KMA_URL.format(CAST_F, self.api_key, self.grid_x, self.grid_y, date, time)
-        resp = requests.get(url)
-        resp.raise_for_status()
-        return resp.json()
+    def _get_json(self, url: str, cache_key: tuple, expires_at: datetime) -> dict:
+        """
+        캐시에 있으면 캐시 응답, 없으면 호출 후 정상 응답(resultCode 00)만 캐시에 저장
+        """
+        cached = forecast_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-    def fetch_short(self):
-        date, time = get_base_datetime_short()
-        url = KMA_URL.format(CAST_V, self.api_key, self.grid_x, self.grid_y, date, time)
-        resp = requests.get(url)
+        resp = transport.get(url)
         resp.raise_for_status()
-        
+
         if DEBUG == True:
             print(f"Response status: {resp.status_code}")
             print(f"Response URL: {resp.url}")
             print(f"Response content: {resp.text[:200]}...")
             print(f"Response headers: {resp.headers}")
-        #print(resp.json())
-        return resp.json()
+
+        data = resp.json()
+        if _is_success(data):
+            forecast_cache.set(cache_key, data, expires_at=expires_at.timestamp(), size=len(resp.content))
+        return data
+
+    def fetch_ultra(self):
+        date, time = get_base_datetime_ultra()
+        url = KMA_URL.format(CAST_F, self.api_key, self.grid_x, self.grid_y, date, time)
+        key = (CAST_F, self.grid_x, self.grid_y, date, time)
+        return self._get_json(url, key, get_expiry_ultra(date, time))
+
+    def fetch_short(self):
+        date, time = get_base_datetime_short()
+        url = KMA_URL.format(CAST_V, self.api_key, self.grid_x, self.grid_y, date, time)
+        key = (CAST_V, self.grid_x, self.grid_y, date, time)
+        return self._get_json(url, key, get_expiry_short(date, time))
 
     def fetch_mid_land(self):
         if not self.reg_id_land:
@@ -104,9 +163,8 @@ class KMAClient:
         date, time = get_base_datetime_mid()
         tmFc = f"{date}{time}"
         url = KMA_MID_URL.format(CAST_ML, self.api_key, self.reg_id_land, tmFc[:8], tmFc[8:])
-        resp = requests.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        key = (CAST_ML, self.reg_id_land, tmFc)
+        return self._get_json(url, key, get_expiry_mid(date, time))
 
     def fetch_mid_ta(self):
         if not self.reg_id_temp:
@@ -114,9 +172,8 @@ class KMAClient:
         date, time = get_base_datetime_mid()
         tmFc = f"{date}{time}"
         url = KMA_MID_URL.format(CAST_MT, self.api_key, self.reg_id_temp, tmFc[:8], tmFc[8:])
-        resp = requests.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        key = (CAST_MT, self.reg_id_temp, tmFc)
+        return self._get_json(url, key, get_expiry_mid(date, time))
 
     def fetch_mid_sea(self):
         if not self.reg_id_sea:
@@ -124,6 +181,5 @@ class KMAClient:
         date, time = get_base_datetime_mid()
         tmFc = f"{date}{time}"
         url = KMA_MID_URL.format(CAST_MS, self.api_key, self.reg_id_sea, tmFc[:8], tmFc[8:])
-        resp = requests.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        key = (CAST_MS, self.reg_id_sea, tmFc)
+        return self._get_json(url, key, get_expiry_mid(date, time))
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import time
+
 from weather.client import KMAClient
 from weather.parser import (
     parse_ultra_short,
@@ -7,6 +10,20 @@ from weather.parser import (
     parse_mid_sea,
 )
 
+# ─────────────────────────────────────────────────────────────────────────────
+#  동시 조회용 공유 스레드 풀
+#  (요청마다 풀을 만들지 않고, 전체 동시 호출 수를 제한)
+# ─────────────────────────────────────────────────────────────────────────────
+MAX_FETCH_WORKERS = 16
+SECTION_TIMEOUT   = 15.0   # 구역별 최대 대기 시간 (초)
+
+GRID_SECTIONS = ("ultra", "short")          # 격자(nx, ny) 단위 예보
+MID_SECTIONS  = ("land", "ta", "sea")       # 중기 지역 코드 단위 예보
+ALL_SECTIONS  = GRID_SECTIONS + MID_SECTIONS
+
+_executor = ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS, thread_name_prefix="kma-fetch")
+
+
 class WeatherService:
     def __init__(
         self,
@@ -26,58 +43,68 @@ class WeatherService:
             reg_id_sea=reg_id_sea,
         )
 
-    def get_all_forecasts(self) -> dict:
-        out = {}
-
-        # 초단기
-        try:
-            raw_ultra = self.client.fetch_ultra()
-            ultra_data = parse_ultra_short(raw_ultra)
-        except Exception as e:
-            ultra_data = {}
-            print(f"[Error][초단기] {e}")
+    def _sections(self) -> list[tuple]:
+        """
+        (키, 로그 라벨, 조회 함수, 파서) 목록. 지역 코드가 없는 중기 구역은 제외.
+        """
+        sections = [
+            ("ultra", "초단기", self.client.fetch_ultra, parse_ultra_short),
+            ("short", "단기", self.client.fetch_short, parse_short_term),
+        ]
+        if self.client.reg_id_land:
+            sections.append(("land", "중기 육상", self.client.fetch_mid_land, parse_mid_land))
+        if self.client.reg_id_temp:
+            sections.append(("ta", "중기 기온", self.client.fetch_mid_ta, parse_mid_ta))
+        if self.client.reg_id_sea:
+            sections.append(("sea", "중기 해상", self.client.fetch_mid_sea, parse_mid_sea))
+        return sections
 
-        # 단기
+    @staticmethod
+    def _fetch_section(label, fetch, parse) -> dict:
         try:
-            raw_short = self.client.fetch_short()
-            short_data = parse_short_term(raw_short)
+            return parse(fetch())
         except Exception as e:
-            short_data = {}
-            print(f"[Error][단기] {e}")
-
-        # 중기 예보
-        mid_data_ground, mid_data_ta, mid_data_sea = {}, {}, {}
-
-        if self.client.reg_id_land:
-            try:
-                raw_mid_ground = self.client.fetch_mid_land()
-                mid_data_ground = parse_mid_land(raw_mid_ground)
-            except Exception as e:
-                mid_data_ground = {}
-                print(f"[Error][중기 육상] {e}")
+            print(f"[Error][{label}] {e}")
+            return {}
 
-        if self.client.reg_id_temp:
-            try:
-                raw_mid_ta = self.client.fetch_mid_ta()
-                mid_data_ta = parse_mid_ta(raw_mid_ta)
-            except Exception as e:
-                mid_data_ta = {}
-                print(f"[Error][중기 기온] {e}")
+    def get_all_forecasts(
+        self,
+        concurrent: bool = True,
+        timeout: float = SECTION_TIMEOUT,
+        include: tuple[str, ...] = ALL_SECTIONS,
+    ) -> dict:
+        """
+        초단기/단기/중기(육상·기온·해상) 예보를 조회.
+        • concurrent=True: 다섯 구역을 공유 스레드 풀에서 동시에 요청 (지연 = 가장 느린 호출)
+        • concurrent=False: 기존처럼 순차 요청
+        • include: 조회할 구역 키 (GRID_SECTIONS / MID_SECTIONS 등), 나머지는 {}
+        실패하거나 timeout 안에 끝나지 않은 구역은 {} 로 채움.
+        """
+        sections = [s for s in self._sections() if s[0] in include]
+        data = {key: {} for key in ALL_SECTIONS}
 
-        if self.client.reg_id_sea:
-            try:
-                raw_mid_sea = self.client.fetch_mid_sea()
-                mid_data_sea = parse_mid_sea(raw_mid_sea)
-            except Exception as e:
-                mid_data_sea = {}
-                print(f"[Error][중기 해상] {e}")
+        if concurrent:
+            futures = [
+                (key, label, _executor.submit(self._fetch_section, label, fetch, parse))
+                for key, label, fetch, parse in sections
+            ]
+            deadline = time.monotonic() + timeout
+            for key, label, future in futures:
+                try:
+                    data[key] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeoutError:
+                    future.cancel()
+                    print(f"[Error][{label}] {timeout}초 안에 응답 없음")
+        else:
+            for key, label, fetch, parse in sections:
+                data[key] = self._fetch_section(label, fetch, parse)
 
-        out["ultra"] = ultra_data
-        out["short"] = short_data
-        out["mid"] = {
-            "land": mid_data_ground,
-            "ta": mid_data_ta,
-            "sea": mid_data_sea,
+        return {
+            "ultra": data["ultra"],
+            "short": data["short"],
+            "mid": {
+                "land": data["land"],
+                "ta": data["ta"],
+                "sea": data["sea"],
+            },
         }
-
-        return out